@@ -8,11 +8,12 @@ import pygame
 import sys
 import random
 import math
-import time
+import collections
+import numpy as np
 from pygame import gfxdraw
 
 # Import our visual elements
-from visual_elements import ParticleSystem, BackgroundEffect, EnhancedSnake, EnhancedFood
+from visual_elements import ParticleSystem, BackgroundEffect, EnhancedSnake, EnhancedFood, ALL_CELLS
 
 # Initialize pygame
 pygame.init()
@@ -24,6 +25,9 @@ GRID_SIZE = 20
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
 FPS = 60
+MAX_MENU_PARTICLES = 512
+RANDOM_BATCH_SIZE = 1024  # Random values drawn per refill for menu particles
+MAX_MOVES_PER_FRAME = 5  # Snake steps one frame may catch up on after a stall
 
 # Colors
 BLACK = (0, 0, 0)
@@ -41,10 +45,19 @@ PLAYING = 1
 PAUSED = 2
 GAME_OVER = 3
 
+# Arrow key directions and the reverse of each (the snake cannot turn back on itself)
+DIRECTION_KEYS = {
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+}
+OPPOSITE_DIRECTIONS = {(0, -1): (0, 1), (0, 1): (0, -1), (-1, 0): (1, 0), (1, 0): (-1, 0)}
+
 class FancyGame:
     def __init__(self):
         # Set up the display
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF)
         pygame.display.set_caption("Fancy Snake Game")
         self.clock = pygame.time.Clock()
         
@@ -60,33 +73,87 @@ class FancyGame:
         # Initialize game objects
         self.snake = EnhancedSnake(GRID_WIDTH // 2, GRID_HEIGHT // 2)
         self.food = EnhancedFood()
-        self.food.spawn(self.snake.segments)
+        self.spawn_food()
         
         # Font for text rendering
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.title_font = pygame.font.Font(None, 72)
+        self.title_cache = {}  # (text, scale) -> (text surface, glow surface)
+        
+        # HUD surfaces; text is cached with the (value, color) it was rendered for
+        self.score_bg = pygame.Surface((150, 40), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.rect(self.score_bg, (0, 0, 0, 128), self.score_bg.get_rect(), border_radius=10)
+        self.start_text_cache = {}  # pulse color step -> "Press ENTER" text
+        self.score_hud = (None, None)
+        self.high_score_hud = (None, None, None)
         
         # Game timing
-        self.last_update_time = time.time()
         self.move_timer = 0
         self.move_delay = 0.1  # seconds between snake movements
         
         # Menu animation
         self.menu_time = 0
-        self.menu_particles = []
+        self.subtitle_hue = 0.0  # Degrees, wrapped to [0, 360) as it advances
+        self.subtitle_cache = {}  # integer hue -> rendered subtitle
+        self.menu_particles = {
+            'x': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'y': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'vx': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'vy': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'age': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'lifetime': np.ones(MAX_MENU_PARTICLES, np.float32),
+            'alpha': np.empty(MAX_MENU_PARTICLES, np.uint8),
+            'size': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'rgb': np.empty((MAX_MENU_PARTICLES, 3), np.uint8),
+            'alive': np.zeros(MAX_MENU_PARTICLES, bool),
+        }
+        self.free_menu_particle_slots = collections.deque(range(MAX_MENU_PARTICLES))
+        self.particle_sprites = {}  # (size, quantized rgba) -> pre-drawn disc
+        
+        # Menu particle randomness is drawn in batches and consumed one value at a time
+        self.rng = np.random.default_rng()
+        self.random_values = []
+        self.random_index = 0
+        
+        # Hue lookup tables for the subtitle and menu snake color cycling
+        self.subtitle_hues = [self.hsv_to_rgb(h, 0.7, 0.9) for h in range(360)]
+        self.menu_snake_hues = [self.hsv_to_rgb(h, 0.8, 0.8) for h in range(360)]
+        
+        # Menu snake spiral: per-segment angle offsets and radii
+        self.spiral_phases = np.arange(20) * 0.3
+        self.spiral_radii = 100 + np.arange(20) * 5
+        
+        # Menu snake sprites: body circles by (radius, hue bucket) and one eye
+        self.menu_snake_sprites = {}
+        self.menu_snake_eye = pygame.Surface((7, 7), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.circle(self.menu_snake_eye, WHITE, (3, 3), 3)
+        pygame.draw.circle(self.menu_snake_eye, BLACK, (3, 3), 1)
         
         # Game over animation
         self.game_over_time = 0
         self.death_particles_created = False
         
+        # Radial overlays for the pause and game over screens
+        x_offsets = np.arange(SCREEN_WIDTH, dtype=np.float32) - SCREEN_WIDTH // 2
+        y_offsets = np.arange(SCREEN_HEIGHT, dtype=np.float32) - SCREEN_HEIGHT // 2
+        self.overlay_distance = np.hypot(x_offsets[:, None], y_offsets[None, :])
+        self.overlay_max_radius = math.sqrt(SCREEN_WIDTH**2 + SCREEN_HEIGHT**2) / 2
+        self.overlay_falloff = np.empty((SCREEN_WIDTH, SCREEN_HEIGHT), np.float32)
+        self.pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.fill_radial_overlay(self.pause_overlay, self.overlay_max_radius, 128)
+        self.game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.game_over_overlay_radius = None
+        
+        # Pause and game over panels, built once and reused every frame
+        self.option_buttons = {}  # option text -> (text surface, background)
+        self.final_score_panel = (None, None, None)
+        
     def run(self):
         running = True
         while running:
-            # Calculate delta time
-            current_time = time.time()
-            dt = current_time - self.last_update_time
-            self.last_update_time = current_time
+            # Cap the frame rate and get the delta time in one call
+            dt = self.clock.tick(FPS) / 1000.0
             
             # Handle events
             for event in pygame.event.get():
@@ -97,11 +164,9 @@ class FancyGame:
             # Update game state
             self.update(dt)
             
-            # Render
-            self.render()
-            
-            # Cap the frame rate
-            self.clock.tick(FPS)
+            # Render, unless the window is minimized and nothing would be seen
+            if pygame.display.get_active():
+                self.render()
         
         pygame.quit()
         sys.exit()
@@ -112,14 +177,10 @@ class FancyGame:
                 if event.key == pygame.K_RETURN:
                     self.state = PLAYING
             elif self.state == PLAYING:
-                if event.key == pygame.K_UP and self.snake.direction != (0, 1):
-                    self.snake.change_direction((0, -1))
-                elif event.key == pygame.K_DOWN and self.snake.direction != (0, -1):
-                    self.snake.change_direction((0, 1))
-                elif event.key == pygame.K_LEFT and self.snake.direction != (1, 0):
-                    self.snake.change_direction((-1, 0))
-                elif event.key == pygame.K_RIGHT and self.snake.direction != (-1, 0):
-                    self.snake.change_direction((1, 0))
+                if event.key in DIRECTION_KEYS:
+                    direction = DIRECTION_KEYS[event.key]
+                    if self.snake.direction != OPPOSITE_DIRECTIONS[direction]:
+                        self.snake.change_direction(direction)
                 elif event.key == pygame.K_ESCAPE:
                     self.state = PAUSED
             elif self.state == PAUSED:
@@ -145,6 +206,7 @@ class FancyGame:
         if self.state == MENU:
             # Update menu animations
             self.menu_time += dt
+            self.subtitle_hue = (self.subtitle_hue + dt * 50) % 360
             self.update_menu_particles(dt)
             
         elif self.state == PLAYING:
@@ -154,33 +216,11 @@ class FancyGame:
             # Update food animation
             self.food.update(dt)
             
-            # Update move timer
-            self.move_timer += dt
-            if self.move_timer >= self.move_delay:
-                self.move_timer = 0
-                
-                # Move snake
-                self.snake.move()
-                
-                # Check for collisions with food
-                if self.snake.head_position == self.food.position:
-                    # Create particles at food position
-                    x, y = self.food.position
-                    self.particles.create_food_particles(x, y, self.food.color)
-                    
-                    # Grow snake and update score
-                    self.snake.grow()
-                    self.score += self.food.value * 10
-                    self.high_score = max(self.score, self.high_score)
-                    
-                    # Spawn new food
-                    self.food.spawn(self.snake.segments)
-                
-                # Check for collisions with walls or self
-                if self.snake.check_collision():
-                    self.state = GAME_OVER
-                    self.game_over_time = 0
-                    self.death_particles_created = False
+            # Advance the snake in fixed steps, catching up on any missed after a slow frame
+            self.move_timer = min(self.move_timer + dt, self.move_delay * MAX_MOVES_PER_FRAME)
+            while self.state == PLAYING and self.move_timer >= self.move_delay:
+                self.move_timer -= self.move_delay
+                self.step_snake()
                     
         elif self.state == GAME_OVER:
             # Update game over animations
@@ -191,66 +231,110 @@ class FancyGame:
                 self.particles.create_death_particles(self.snake.segments)
                 self.death_particles_created = True
     
+    def step_snake(self):
+        """Move the snake one cell and resolve food and collisions"""
+        # Move snake; its segment counts show whether the head landed on the body
+        self.snake.move()
+        hit_self = self.snake.check_collision()
+
+        # Check for collisions with food
+        if self.snake.head_position == self.food.position:
+            # Create particles at food position
+            x, y = self.food.position
+            self.particles.create_food_particles(x, y, self.food.color)
+
+            # Grow snake and update score
+            self.snake.grow()
+            self.score += self.food.value * 10
+            self.high_score = max(self.score, self.high_score)
+
+            # Spawn new food
+            self.spawn_food()
+
+        # Check for collisions with walls or self
+        if hit_self:
+            self.state = GAME_OVER
+            self.game_over_time = 0
+            self.death_particles_created = False
+    
     def update_menu_particles(self, dt):
-        # Update existing menu particles
-        for particle in self.menu_particles[:]:
-            particle['age'] += dt
-            if particle['age'] >= particle['lifetime']:
-                self.menu_particles.remove(particle)
-            else:
-                # Update position
-                particle['x'] += particle['vx'] * dt
-                particle['y'] += particle['vy'] * dt
-                # Update alpha
-                progress = particle['age'] / particle['lifetime']
-                particle['alpha'] = int(255 * (1 - progress))
+        # Update existing menu particles (all fields advanced as whole arrays)
+        mp = self.menu_particles
+        alive = mp['alive']
+        mp['age'][alive] += dt
+        mp['x'][alive] += mp['vx'][alive] * dt
+        mp['y'][alive] += mp['vy'][alive] * dt
+        
+        # Update alpha and retire particles that have outlived their lifetime
+        progress = np.minimum(mp['age'][alive] / mp['lifetime'][alive], 1.0)
+        mp['alpha'][alive] = (255 * (1 - progress)).astype(np.uint8)
+        expired = alive & (mp['age'] >= mp['lifetime'])
+        self.free_menu_particle_slots.extend(np.flatnonzero(expired).tolist())
+        alive &= ~expired
         
         # Add new particles occasionally
-        if random.random() < dt * 5:  # Average 5 particles per second
+        if self.random_uniform(0, 1) < dt * 5:  # Average 5 particles per second
             self.add_menu_particle()
     
+    def random_uniform(self, low, high):
+        """Draw a uniform float from the batched random buffer, refilling it when used up"""
+        if self.random_index >= len(self.random_values):
+            self.random_values = self.rng.random(RANDOM_BATCH_SIZE).tolist()
+            self.random_index = 0
+        value = self.random_values[self.random_index]
+        self.random_index += 1
+        return low + (high - low) * value
+    
+    def random_int(self, low, high):
+        """Draw an integer in [low, high] from the batched random buffer"""
+        return low + int(self.random_uniform(0, high - low + 1))
+    
     def add_menu_particle(self):
         """Add ambient particles in the menu screen"""
         # Random position near the edges
-        side = random.randint(0, 3)
+        side = self.random_int(0, 3)
         if side == 0:  # Top
-            x = random.randint(0, SCREEN_WIDTH)
+            x = self.random_int(0, SCREEN_WIDTH)
             y = 0
-            vx = random.uniform(-20, 20)
-            vy = random.uniform(20, 50)
+            vx = self.random_uniform(-20, 20)
+            vy = self.random_uniform(20, 50)
         elif side == 1:  # Right
             x = SCREEN_WIDTH
-            y = random.randint(0, SCREEN_HEIGHT)
-            vx = random.uniform(-50, -20)
-            vy = random.uniform(-20, 20)
+            y = self.random_int(0, SCREEN_HEIGHT)
+            vx = self.random_uniform(-50, -20)
+            vy = self.random_uniform(-20, 20)
         elif side == 2:  # Bottom
-            x = random.randint(0, SCREEN_WIDTH)
+            x = self.random_int(0, SCREEN_WIDTH)
             y = SCREEN_HEIGHT
-            vx = random.uniform(-20, 20)
-            vy = random.uniform(-50, -20)
+            vx = self.random_uniform(-20, 20)
+            vy = self.random_uniform(-50, -20)
         else:  # Left
             x = 0
-            y = random.randint(0, SCREEN_HEIGHT)
-            vx = random.uniform(20, 50)
-            vy = random.uniform(-20, 20)
+            y = self.random_int(0, SCREEN_HEIGHT)
+            vx = self.random_uniform(20, 50)
+            vy = self.random_uniform(-20, 20)
         
         # Random color (green/blue hues)
-        r = random.randint(0, 100)
-        g = random.randint(150, 255)
-        b = random.randint(100, 255)
+        r = self.random_int(0, 100)
+        g = self.random_int(150, 255)
+        b = self.random_int(100, 255)
         color = (r, g, b)
         
-        self.menu_particles.append({
-            'x': x,
-            'y': y,
-            'vx': vx,
-            'vy': vy,
-            'size': random.uniform(2, 5),
-            'color': color,
-            'alpha': 200,
-            'lifetime': random.uniform(1.0, 3.0),
-            'age': 0,
-        })
+        # Write into a free slot; drop the particle if the pool is full
+        if not self.free_menu_particle_slots:
+            return
+        i = self.free_menu_particle_slots.popleft()
+        mp = self.menu_particles
+        mp['x'][i] = x
+        mp['y'][i] = y
+        mp['vx'][i] = vx
+        mp['vy'][i] = vy
+        mp['size'][i] = self.random_uniform(2, 5)
+        mp['rgb'][i] = color
+        mp['alpha'][i] = 200
+        mp['lifetime'][i] = self.random_uniform(1.0, 3.0)
+        mp['age'][i] = 0
+        mp['alive'][i] = True
     
     def render(self):
         # Render background
@@ -282,55 +366,50 @@ class FancyGame:
     
     def render_menu(self):
         # Render menu particles
-        for particle in self.menu_particles:
-            pygame.gfxdraw.filled_circle(
-                self.screen,
-                int(particle['x']),
-                int(particle['y']),
-                int(particle['size']),
-                (*particle['color'], particle['alpha'])
+        mp = self.menu_particles
+        alive = mp['alive']
+        blit_sequence = [
+            (self.get_particle_sprite(size, r, g, b, alpha), (x - size, y - size))
+            for x, y, size, (r, g, b), alpha in zip(
+                mp['x'][alive].astype(int).tolist(),
+                mp['y'][alive].astype(int).tolist(),
+                mp['size'][alive].astype(int).tolist(),
+                mp['rgb'][alive].tolist(),
+                mp['alpha'][alive].tolist(),
             )
+        ]
+        self.screen.blits(blit_sequence, doreturn=False)
         
         # Title with pulsing effect
         pulse = (math.sin(self.menu_time * 2) + 1) * 0.1
-        title_scale = 1.0 + pulse
-        title_text = self.title_font.render("FANCY SNAKE", True, GOLD)
-        title_rect = title_text.get_rect()
-        title_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)
-        
-        # Create a slightly larger surface for the title to accommodate the scaling
-        scaled_width = int(title_rect.width * title_scale)
-        scaled_height = int(title_rect.height * title_scale)
-        scaled_surface = pygame.transform.scale(title_text, (scaled_width, scaled_height))
-        scaled_rect = scaled_surface.get_rect(center=title_rect.center)
+        title_scale = round((1.0 + pulse) * 40) / 40  # 2.5% steps so scaled titles can be cached
         
         # Draw title with glow effect
-        glow_surface = pygame.Surface((scaled_width + 20, scaled_height + 20), pygame.SRCALPHA)
-        glow_text = self.title_font.render("FANCY SNAKE", True, (255, 215, 0, 100))
-        glow_scaled = pygame.transform.scale(glow_text, (scaled_width + 10, scaled_height + 10))
-        glow_rect = glow_scaled.get_rect(center=(glow_surface.get_width()//2, glow_surface.get_height()//2))
-        glow_surface.blit(glow_scaled, glow_rect)
-        
-        # Apply blur effect to glow (simple approximation)
-        for i in range(5):
-            blur_offset = i + 1
-            for offset_x, offset_y in [(blur_offset, 0), (-blur_offset, 0), (0, blur_offset), (0, -blur_offset)]:
-                self.screen.blit(glow_surface, (scaled_rect.x - 10 + offset_x, scaled_rect.y - 10 + offset_y))
+        scaled_surface, glow_surface = self.get_title_surfaces("FANCY SNAKE", GOLD, (255, 215, 0, 100), title_scale)
+        scaled_rect = scaled_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
+        
+        # Glow with the blur already baked in
+        self.screen.blit(glow_surface, glow_surface.get_rect(center=scaled_rect.center))
         
         # Draw the actual title
         self.screen.blit(scaled_surface, scaled_rect)
         
         # Subtitle with color cycling
-        hue = (self.menu_time * 50) % 360  # Cycle through hues
-        r, g, b = self.hsv_to_rgb(hue, 0.7, 0.9)
-        subtitle_text = self.font.render("A Very Fancy Snake Game", True, (r, g, b))
+        hue = int(self.subtitle_hue)  # Cycle through hues
+        subtitle_text = self.subtitle_cache.get(hue)
+        if subtitle_text is None:
+            subtitle_text = self.font.render("A Very Fancy Snake Game", True, self.subtitle_hues[hue]).convert_alpha()
+            self.subtitle_cache[hue] = subtitle_text
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4 + 80))
         self.screen.blit(subtitle_text, subtitle_rect)
         
         # Menu options with pulsing effect
         pulse_start = (math.sin(self.menu_time * 3) + 1) * 0.5
-        start_color = self.lerp_color(WHITE, GOLD, pulse_start)
-        start_text = self.font.render("Press ENTER to Start", True, start_color)
+        step = round(pulse_start * 15)  # 16 color steps, each rendered only once
+        if step not in self.start_text_cache:
+            start_color = self.lerp_color(WHITE, GOLD, step / 15)
+            self.start_text_cache[step] = self.font.render("Press ENTER to Start", True, start_color).convert_alpha()
+        start_text = self.start_text_cache[step]
         start_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         self.screen.blit(start_text, start_rect)
         
@@ -348,91 +427,91 @@ class FancyGame:
         # Draw animated snake in the background
         self.render_menu_snake()
     
+    def get_particle_sprite(self, size, r, g, b, alpha):
+        """Get a cached disc sprite, quantizing color and alpha to 16 levels"""
+        key = (size, r >> 4, g >> 4, b >> 4, alpha >> 4)
+        sprite = self.particle_sprites.get(key)
+        if sprite is None:
+            if len(self.particle_sprites) >= 4096:
+                self.particle_sprites.clear()
+            sprite = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA).convert_alpha()
+            color = ((r & 0xF0) | 8, (g & 0xF0) | 8, (b & 0xF0) | 8, (alpha & 0xF0) | 8)
+            pygame.gfxdraw.filled_circle(sprite, size, size, size, color)
+            self.particle_sprites[key] = sprite
+        return sprite
+    
     def render_menu_snake(self):
         """Render an animated snake in the menu background"""
         # Calculate snake path based on time
         t = self.menu_time * 0.5
-        points = []
         
         # Create a spiral path
-        for i in range(20):
-            angle = t + i * 0.3
-            radius = 100 + i * 5
-            x = SCREEN_WIDTH // 2 + math.cos(angle) * radius
-            y = SCREEN_HEIGHT // 2 + math.sin(angle) * radius
-            points.append((x, y))
-        
-        # Draw snake segments along the path
+        angles = t + self.spiral_phases
+        xs = SCREEN_WIDTH // 2 + np.cos(angles) * self.spiral_radii
+        ys = SCREEN_HEIGHT // 2 + np.sin(angles) * self.spiral_radii
+        points = zip(xs.tolist(), ys.tolist())
+        
+        # Draw snake segments along the path with one batched blit
+        blit_sequence = []
         for i, (x, y) in enumerate(points):
             # Calculate color based on position in snake
-            hue = (t * 50 + i * 10) % 360
-            r, g, b = self.hsv_to_rgb(hue, 0.8, 0.8)
+            hue = int(t * 50 + i * 10) % 360
             
             # Draw segment
-            size = 15 - i * 0.5  # Gradually smaller toward tail
-            pygame.draw.circle(self.screen, (r, g, b), (int(x), int(y)), max(5, int(size)))
+            size = max(5, int(15 - i * 0.5))  # Gradually smaller toward tail
+            blit_sequence.append((self.get_menu_snake_sprite(size, hue), (int(x) - size, int(y) - size)))
             
             # Draw eyes on the head
             if i == 0:
-                # Eyes
                 eye_offset = 5
-                pygame.draw.circle(self.screen, WHITE, (int(x - eye_offset), int(y - eye_offset)), 3)
-                pygame.draw.circle(self.screen, WHITE, (int(x + eye_offset), int(y - eye_offset)), 3)
-                
-                # Pupils
-                pygame.draw.circle(self.screen, BLACK, (int(x - eye_offset), int(y - eye_offset)), 1)
-                pygame.draw.circle(self.screen, BLACK, (int(x + eye_offset), int(y - eye_offset)), 1)
+                blit_sequence.append((self.menu_snake_eye, (int(x - eye_offset) - 3, int(y - eye_offset) - 3)))
+                blit_sequence.append((self.menu_snake_eye, (int(x + eye_offset) - 3, int(y - eye_offset) - 3)))
+        
+        self.screen.blits(blit_sequence, doreturn=False)
+    
+    def get_menu_snake_sprite(self, size, hue):
+        """Get a cached menu snake segment, quantizing hue to 2 degree steps"""
+        key = (size, hue // 2)
+        sprite = self.menu_snake_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(sprite, self.menu_snake_hues[hue // 2 * 2], (size, size), size)
+            self.menu_snake_sprites[key] = sprite
+        return sprite
     
     def render_hud(self, dimmed=False):
         color = (150, 150, 150) if dimmed else WHITE
         
         # Score with fancy background
-        score_bg = pygame.Surface((150, 40), pygame.SRCALPHA)
-        pygame.draw.rect(score_bg, (0, 0, 0, 128), score_bg.get_rect(), border_radius=10)
-        self.screen.blit(score_bg, (10, 10))
-        
-        score_text = self.font.render(f"Score: {self.score}", True, color)
-        self.screen.blit(score_text, (20, 15))
-        
-        # High score with fancy background
-        high_score_text = self.font.render(f"High: {self.high_score}", True, color)
-        high_score_rect = high_score_text.get_rect()
-        
-        high_score_bg = pygame.Surface((high_score_rect.width + 20, 40), pygame.SRCALPHA)
-        pygame.draw.rect(high_score_bg, (0, 0, 0, 128), high_score_bg.get_rect(), border_radius=10)
-        self.screen.blit(high_score_bg, (SCREEN_WIDTH - high_score_rect.width - 30, 10))
-        
-        self.screen.blit(high_score_text, (SCREEN_WIDTH - high_score_rect.width - 20, 15))
+        self.screen.blit(self.score_bg, (10, 10))
+        
+        # Only re-render score text when the value or color changes
+        if self.score_hud[0] != (self.score, color):
+            self.score_hud = ((self.score, color), self.font.render(f"Score: {self.score}", True, color).convert_alpha())
+        self.screen.blit(self.score_hud[1], (20, 15))
+        
+        # High score with fancy background, rebuilt only when it changes
+        if self.high_score_hud[0] != (self.high_score, color):
+            high_score_text = self.font.render(f"High: {self.high_score}", True, color).convert_alpha()
+            high_score_bg = pygame.Surface((high_score_text.get_width() + 20, 40), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(high_score_bg, (0, 0, 0, 128), high_score_bg.get_rect(), border_radius=10)
+            self.high_score_hud = ((self.high_score, color), high_score_text, high_score_bg)
+        _, high_score_text, high_score_bg = self.high_score_hud
+        high_score_width = high_score_text.get_width()
+        
+        self.screen.blit(high_score_bg, (SCREEN_WIDTH - high_score_width - 30, 10))
+        self.screen.blit(high_score_text, (SCREEN_WIDTH - high_score_width - 20, 15))
     
     def render_pause_menu(self):
         # Semi-transparent overlay with radial gradient
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        # Create radial gradient
-        center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-        max_radius = math.sqrt(SCREEN_WIDTH**2 + SCREEN_HEIGHT**2) / 2
-        
-        for radius in range(0, int(max_radius), 2):
-            alpha = int(128 * (radius / max_radius))
-            pygame.gfxdraw.filled_circle(overlay, center[0], center[1], int(max_radius) - radius, (0, 0, 0, alpha))
-        
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.pause_overlay, (0, 0))
         
         # Pause title with glow
-        pause_text = self.title_font.render("PAUSED", True, WHITE)
+        pause_text, glow_surface = self.get_title_surfaces("PAUSED", WHITE, (255, 255, 255, 100))
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         
-        # Glow effect
-        glow_surface = pygame.Surface((pause_rect.width + 20, pause_rect.height + 20), pygame.SRCALPHA)
-        glow_text = self.title_font.render("PAUSED", True, (255, 255, 255, 100))
-        glow_rect = glow_text.get_rect(center=(glow_surface.get_width()//2, glow_surface.get_height()//2))
-        glow_surface.blit(glow_text, glow_rect)
-        
-        # Apply blur effect to glow (simple approximation)
-        for i in range(5):
-            blur_offset = i + 1
-            for offset_x, offset_y in [(blur_offset, 0), (-blur_offset, 0), (0, blur_offset), (0, -blur_offset)]:
-                self.screen.blit(glow_surface, (pause_rect.x - 10 + offset_x, pause_rect.y - 10 + offset_y))
+        # Glow with the blur already baked in
+        self.screen.blit(glow_surface, glow_surface.get_rect(center=pause_rect.center))
         
         # Draw the actual text
         self.screen.blit(pause_text, pause_rect)
@@ -444,75 +523,48 @@ class FancyGame:
         ]
         
         for option in options:
-            text = self.font.render(option["text"], True, WHITE)
+            text, bg_surface = self.get_option_button(option["text"])
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + option["y_offset"]))
             
-            # Background with rounded corners
-            bg_rect = text_rect.inflate(40, 20)
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(bg_surface, (0, 0, 0, 150), bg_surface.get_rect(), border_radius=10)
-            
-            # Draw subtle border
-            pygame.draw.rect(bg_surface, (100, 100, 100, 100), bg_surface.get_rect(), width=2, border_radius=10)
-            
-            self.screen.blit(bg_surface, bg_rect)
+            self.screen.blit(bg_surface, text_rect.inflate(40, 20))
             self.screen.blit(text, text_rect)
     
     def render_game_over(self):
         # Semi-transparent overlay with radial gradient that expands over time
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
         # Calculate expanding radius based on game over time
         expansion_duration = 1.0  # seconds
         progress = min(1.0, self.game_over_time / expansion_duration)
         
-        # Create radial gradient
-        center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-        max_radius = math.sqrt(SCREEN_WIDTH**2 + SCREEN_HEIGHT**2) / 2
-        current_radius = max_radius * progress
-        
-        for radius in range(0, int(current_radius), 2):
-            alpha = int(192 * (radius / current_radius))
-            pygame.gfxdraw.filled_circle(overlay, center[0], center[1], int(current_radius) - radius, (0, 0, 0, alpha))
-        
-        self.screen.blit(overlay, (0, 0))
+        # Redraw the overlay in place only while it is still expanding
+        current_radius = self.overlay_max_radius * progress
+        if current_radius != self.game_over_overlay_radius:
+            self.fill_radial_overlay(self.game_over_overlay, current_radius, 192)
+            self.game_over_overlay_radius = current_radius
+        self.screen.blit(self.game_over_overlay, (0, 0))
         
         # Only show text after the overlay animation is complete
         if progress >= 1.0:
             # Game over title with animation
-            title_scale = 1.0 + 0.1 * math.sin(self.game_over_time * 3)
-            game_over_text = self.title_font.render("GAME OVER", True, RED)
-            game_over_rect = game_over_text.get_rect()
-            game_over_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3)
-            
-            # Scale the text
-            scaled_width = int(game_over_rect.width * title_scale)
-            scaled_height = int(game_over_rect.height * title_scale)
-            scaled_surface = pygame.transform.scale(game_over_text, (scaled_width, scaled_height))
-            scaled_rect = scaled_surface.get_rect(center=game_over_rect.center)
+            title_scale = round((1.0 + 0.1 * math.sin(self.game_over_time * 3)) * 40) / 40
             
             # Draw with glow effect
-            glow_surface = pygame.Surface((scaled_width + 20, scaled_height + 20), pygame.SRCALPHA)
-            glow_text = self.title_font.render("GAME OVER", True, (255, 0, 0, 100))
-            glow_scaled = pygame.transform.scale(glow_text, (scaled_width + 10, scaled_height + 10))
-            glow_rect = glow_scaled.get_rect(center=(glow_surface.get_width()//2, glow_surface.get_height()//2))
-            glow_surface.blit(glow_scaled, glow_rect)
+            scaled_surface, glow_surface = self.get_title_surfaces("GAME OVER", RED, (255, 0, 0, 100), title_scale)
+            scaled_rect = scaled_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
             
-            # Apply blur effect to glow
-            for i in range(5):
-                blur_offset = i + 1
-                for offset_x, offset_y in [(blur_offset, 0), (-blur_offset, 0), (0, blur_offset), (0, -blur_offset)]:
-                    self.screen.blit(glow_surface, (scaled_rect.x - 10 + offset_x, scaled_rect.y - 10 + offset_y))
+            # Glow with the blur already baked in
+            self.screen.blit(glow_surface, glow_surface.get_rect(center=scaled_rect.center))
             
             # Draw the actual text
             self.screen.blit(scaled_surface, scaled_rect)
             
-            # Score with fancy background
-            score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
+            # Score with fancy background, rebuilt only when the score changes
+            if self.final_score_panel[0] != self.score:
+                score_text = self.font.render(f"Final Score: {self.score}", True, WHITE).convert_alpha()
+                score_bg = pygame.Surface((score_text.get_width() + 40, score_text.get_height() + 20), pygame.SRCALPHA).convert_alpha()
+                pygame.draw.rect(score_bg, (0, 0, 0, 150), score_bg.get_rect(), border_radius=10)
+                self.final_score_panel = (self.score, score_text, score_bg)
+            _, score_text, score_bg = self.final_score_panel
             score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            
-            score_bg = pygame.Surface((score_rect.width + 40, score_rect.height + 20), pygame.SRCALPHA)
-            pygame.draw.rect(score_bg, (0, 0, 0, 150), score_bg.get_rect(), border_radius=10)
             self.screen.blit(score_bg, score_rect.inflate(40, 20))
             self.screen.blit(score_text, score_rect)
             
@@ -523,57 +575,93 @@ class FancyGame:
             ]
             
             for option in options:
-                text = self.font.render(option["text"], True, WHITE)
+                text, bg_surface = self.get_option_button(option["text"])
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + option["y_offset"]))
                 
-                # Background with rounded corners
-                bg_rect = text_rect.inflate(40, 20)
-                bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(bg_surface, (0, 0, 0, 150), bg_surface.get_rect(), border_radius=10)
-                
-                # Draw subtle border
-                pygame.draw.rect(bg_surface, (100, 100, 100, 100), bg_surface.get_rect(), width=2, border_radius=10)
-                
-                self.screen.blit(bg_surface, bg_rect)
+                self.screen.blit(bg_surface, text_rect.inflate(40, 20))
                 self.screen.blit(text, text_rect)
     
+    def get_option_button(self, text):
+        """Get the cached text and rounded background for a menu option"""
+        if text not in self.option_buttons:
+            text_surface = self.font.render(text, True, WHITE).convert_alpha()
+            width, height = text_surface.get_size()
+            
+            # Background with rounded corners
+            bg_surface = pygame.Surface((width + 40, height + 20), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(bg_surface, (0, 0, 0, 150), bg_surface.get_rect(), border_radius=10)
+            
+            # Draw subtle border
+            pygame.draw.rect(bg_surface, (100, 100, 100, 100), bg_surface.get_rect(), width=2, border_radius=10)
+            
+            self.option_buttons[text] = (text_surface, bg_surface)
+        return self.option_buttons[text]
+    
+    def fill_radial_overlay(self, overlay, radius, max_alpha):
+        """Fill a black overlay that is darkest at the center and fades out at radius"""
+        alpha = pygame.surfarray.pixels_alpha(overlay)
+        if radius <= 0:
+            alpha[:] = 0
+        else:
+            # Same falloff as stacking alpha-blended circles from the edge inwards,
+            # computed in place in a preallocated float buffer
+            falloff = self.overlay_falloff
+            np.multiply(self.overlay_distance, -1.0 / radius, out=falloff)
+            falloff += 1
+            np.clip(falloff, 0, 1, out=falloff)
+            falloff *= falloff
+            falloff *= max_alpha / 2
+            alpha[:] = falloff
+        del alpha  # Unlock the surface
+    
+    def get_title_surfaces(self, text, color, glow_color, scale=None):
+        """Get the cached title text and pre-blurred glow surfaces, optionally scaled"""
+        key = (text, scale)
+        if key not in self.title_cache:
+            text_surface = self.title_font.render(text, True, color)
+            glow_text = self.title_font.render(text, True, glow_color)
+            width, height = text_surface.get_size()
+            
+            if scale is not None:
+                width = int(width * scale)
+                height = int(height * scale)
+                text_surface = pygame.transform.scale(text_surface, (width, height))
+                glow_text = pygame.transform.scale(glow_text, (width + 10, height + 10))
+            
+            # Bake the blur (simple approximation: 20 offset copies) into one surface
+            glow_surface = pygame.Surface((width + 30, height + 30), pygame.SRCALPHA).convert_alpha()
+            glow_rect = glow_text.get_rect(center=(glow_surface.get_width()//2, glow_surface.get_height()//2))
+            for i in range(5):
+                blur_offset = i + 1
+                for offset_x, offset_y in [(blur_offset, 0), (-blur_offset, 0), (0, blur_offset), (0, -blur_offset)]:
+                    glow_surface.blit(glow_text, glow_rect.move(offset_x, offset_y))
+            
+            self.title_cache[key] = (text_surface.convert_alpha(), glow_surface)
+        return self.title_cache[key]
+    
     def reset_game(self):
         self.snake = EnhancedSnake(GRID_WIDTH // 2, GRID_HEIGHT // 2)
-        self.food.spawn(self.snake.segments)
+        self.spawn_food()
         self.score = 0
         self.move_timer = 0
         self.particles = ParticleSystem()
     
+    def spawn_food(self):
+        """Spawn food on a random cell that the snake does not occupy"""
+        free_cells = ALL_CELLS.difference(self.snake.segment_counts)
+        if free_cells:
+            self.food.place(random.choice(tuple(free_cells)))
+    
     def hsv_to_rgb(self, h, s, v):
         """Convert HSV color to RGB"""
-        h = h / 360
-        i = math.floor(h * 6)
-        f = h * 6 - i
-        p = v * (1 - s)
-        q = v * (1 - f * s)
-        t = v * (1 - (1 - f) * s)
-        
-        if i % 6 == 0:
-            r, g, b = v, t, p
-        elif i % 6 == 1:
-            r, g, b = q, v, p
-        elif i % 6 == 2:
-            r, g, b = p, v, t
-        elif i % 6 == 3:
-            r, g, b = p, q, v
-        elif i % 6 == 4:
-            r, g, b = t, p, v
-        else:
-            r, g, b = v, p, q
-        
-        return int(r * 255), int(g * 255), int(b * 255)
+        color = pygame.Color(0)
+        color.hsva = (h % 360, s * 100, v * 100, 100)
+        return color.r, color.g, color.b
     
     def lerp_color(self, color1, color2, t):
         """Linear interpolation between two colors"""
-        r = int(color1[0] + (color2[0] - color1[0]) * t)
-        g = int(color1[1] + (color2[1] - color1[1]) * t)
-        b = int(color1[2] + (color2[2] - color1[2]) * t)
-        return (r, g, b)
+        color = pygame.Color(color1).lerp(color2, t)
+        return color.r, color.g, color.b
 
 
 # Main function
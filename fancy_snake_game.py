@@ -8,12 +8,13 @@ import pygame
 import sys
 import random
 import math
-import time
-import os
+import collections
+import functools
+import numpy as np
 from pygame import gfxdraw
 
 # Import our custom modules
-from visual_elements import ParticleSystem, BackgroundEffect, EnhancedSnake, EnhancedFood
+from visual_elements import ParticleSystem, BackgroundEffect, EnhancedSnake, EnhancedFood, ALL_CELLS
 from sound_manager import SoundManager
 from power_ups import PowerUpManager
 from game_modes import GameModeManager, CLASSIC, MEDIUM
@@ -28,6 +29,8 @@ GRID_SIZE = 20
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
 FPS = 60
+MAX_MENU_PARTICLES = 512
+MAX_MOVES_PER_FRAME = 5  # Snake steps one frame may catch up on after a stall
 
 # Colors
 BLACK = (0, 0, 0)
@@ -46,15 +49,32 @@ PLAYING = 2
 PAUSED = 3
 GAME_OVER = 4
 
+# Arrow key directions and the reverse of each
+DIRECTION_KEYS = {
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+}
+OPPOSITE_DIRECTIONS = {(0, -1): (0, 1), (0, 1): (0, -1), (-1, 0): (1, 0), (1, 0): (-1, 0)}
+
+# Which of (v, p, q, t) feeds r, g and b in each of the six hue sectors
+HSV_SECTORS = ((0, 3, 1), (2, 0, 1), (1, 0, 3), (1, 2, 0), (3, 1, 0), (0, 1, 2))
+
 class FancySnakeGame:
     def __init__(self):
         # Set up the display
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        try:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            # Vsync is not available on every driver
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF)
         pygame.display.set_caption("Fancy Snake Game")
         self.clock = pygame.time.Clock()
         
-        # Create directories if they don't exist
-        os.makedirs('sounds', exist_ok=True)
+        # Only quit and key presses are handled, so keep everything else out of the queue
+        pygame.event.set_allowed(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         
         # Game state
         self.state = MENU
@@ -74,6 +94,35 @@ class FancySnakeGame:
         self.selected_mode = CLASSIC
         self.selected_difficulty = MEDIUM
         
+        # Key press handlers for each game state
+        self.key_handlers = {
+            MENU: {
+                pygame.K_RETURN: self.open_mode_select,
+                pygame.K_SPACE: self.start_game,  # Quick start with default settings
+            },
+            MODE_SELECT: {
+                pygame.K_RETURN: self.start_selected_mode,
+                pygame.K_SPACE: self.start_selected_mode,
+                pygame.K_ESCAPE: self.close_mode_select,
+                pygame.K_UP: self.select_previous_mode,
+                pygame.K_DOWN: self.select_next_mode,
+                pygame.K_LEFT: self.select_easier_difficulty,
+                pygame.K_RIGHT: self.select_harder_difficulty,
+            },
+            PLAYING: {
+                **{key: functools.partial(self.steer, direction) for key, direction in DIRECTION_KEYS.items()},
+                pygame.K_ESCAPE: self.pause_game,
+            },
+            PAUSED: {
+                pygame.K_RETURN: self.resume_game,
+                pygame.K_ESCAPE: self.quit_to_menu,
+            },
+            GAME_OVER: {
+                pygame.K_RETURN: self.start_game,
+                pygame.K_ESCAPE: self.return_to_menu,
+            },
+        }
+        
         # Initialize visual elements
         self.background = BackgroundEffect(SCREEN_WIDTH, SCREEN_HEIGHT)
         self.particles = ParticleSystem()
@@ -85,20 +134,65 @@ class FancySnakeGame:
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.title_font = pygame.font.Font(None, 72)
+        self.text_cache = {}  # (font, text, color) -> rendered surface
+        self.scaled_title_cache = {}  # (text, color, size) -> scaled title text
+        self.glow_cache = {}  # (text, glow color, size) -> pre-blurred glow
+        self.hud_backgrounds = {}  # width -> rounded HUD background
+        self.hud_key = None  # (score, high score, color) the HUD blits were built for
+        self.hud_blits = []
         
         # Game timing
-        self.last_update_time = time.time()
         self.move_timer = 0
         self.base_move_delay = self.game_mode_manager.get_move_delay()
         self.move_delay = self.base_move_delay
         
         # Menu animation
         self.menu_time = 0
-        self.menu_particles = []
+        self.menu_particles = {
+            'x': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'y': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'vx': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'vy': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'age': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'lifetime': np.ones(MAX_MENU_PARTICLES, np.float32),
+            'alpha': np.empty(MAX_MENU_PARTICLES, np.uint8),
+            'size': np.empty(MAX_MENU_PARTICLES, np.float32),
+            'color_key': np.empty(MAX_MENU_PARTICLES, np.uint16),  # 4-bit r, g, b
+            'alive': np.zeros(MAX_MENU_PARTICLES, bool),
+        }
+        self.free_menu_particle_slots = collections.deque(range(MAX_MENU_PARTICLES))
+        self.particle_sprites = {}  # packed size and quantized rgba -> pre-drawn disc
+        
+        # Hue lookup tables for the subtitle and menu snake color cycling
+        self.subtitle_hues = self.hue_palette(0.7, 0.9)
+        self.menu_snake_hues = self.hue_palette(0.8, 0.8)
+        
+        # Color gradients keyed by (start color, end color, steps)
+        self.palette_cache = {}
+        
+        # Menu snake spiral: per-segment angle offsets and radii
+        self.spiral_phases = np.arange(20) * 0.3
+        self.spiral_radii = 100 + np.arange(20) * 5
         
         # Game over animation
         self.game_over_time = 0
         self.death_particles_created = False
+        self.scene_snapshot = None  # Dimmed scene behind the pause and game over screens
+        
+        # Radial overlays for the pause and game over screens
+        x_offsets = np.arange(SCREEN_WIDTH, dtype=np.float32) - SCREEN_WIDTH // 2
+        y_offsets = np.arange(SCREEN_HEIGHT, dtype=np.float32) - SCREEN_HEIGHT // 2
+        self.overlay_distance = np.hypot(x_offsets[:, None], y_offsets[None, :])
+        self.overlay_max_radius = math.sqrt(SCREEN_WIDTH**2 + SCREEN_HEIGHT**2) / 2
+        self.overlay_falloff = np.empty((SCREEN_WIDTH, SCREEN_HEIGHT), np.float32)
+        self.pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.fill_radial_overlay(self.pause_overlay, self.overlay_max_radius, 128)
+        self.game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.game_over_overlay_radius = None
+        
+        # Pause and game over panels, built once and reused every frame
+        self.option_buttons = {}  # option text -> (text surface, background)
+        self.final_score_panel = (None, None, None)
         
         # Play menu music
         self.sound_manager.play_music('menu')
@@ -106,10 +200,8 @@ class FancySnakeGame:
     def run(self):
         running = True
         while running:
-            # Calculate delta time
-            current_time = time.time()
-            dt = current_time - self.last_update_time
-            self.last_update_time = current_time
+            # Cap the frame rate and get the delta time in one call
+            dt = self.clock.tick(FPS) / 1000.0
             
             # Handle events
             for event in pygame.event.get():
@@ -122,106 +214,80 @@ class FancySnakeGame:
             
             # Render
             self.render()
-            
-            # Cap the frame rate
-            self.clock.tick(FPS)
         
         pygame.quit()
         sys.exit()
     
     def handle_events(self, event):
         if event.type == pygame.KEYDOWN:
-            if self.state == MENU:
-                if event.key == pygame.K_RETURN:
-                    self.sound_manager.play_sound('menu_select')
-                    self.state = MODE_SELECT
-                elif event.key == pygame.K_SPACE:
-                    self.sound_manager.play_sound('menu_select')
-                    # Quick start with default settings
-                    self.reset_game()
-                    self.state = PLAYING
-                    self.sound_manager.stop_music()
-                    self.sound_manager.play_music('gameplay')
-            
-            elif self.state == MODE_SELECT:
-                if event.key == pygame.K_RETURN:
-                    self.sound_manager.play_sound('menu_select')
-                    # Apply selected mode and difficulty
-                    self.game_mode_manager.set_game_mode(self.selected_mode)
-                    self.game_mode_manager.set_difficulty(self.selected_difficulty)
-                    self.reset_game()
-                    self.state = PLAYING
-                    self.sound_manager.stop_music()
-                    self.sound_manager.play_music('gameplay')
-                elif event.key == pygame.K_SPACE:
-                    self.sound_manager.play_sound('menu_select')
-                    # Start game with current selections
-                    self.game_mode_manager.set_game_mode(self.selected_mode)
-                    self.game_mode_manager.set_difficulty(self.selected_difficulty)
-                    self.reset_game()
-                    self.state = PLAYING
-                    self.sound_manager.stop_music()
-                    self.sound_manager.play_music('gameplay')
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play_sound('menu_navigate')
-                    self.state = MENU
-                elif event.key == pygame.K_UP:
-                    self.sound_manager.play_sound('menu_navigate')
-                    if self.selected_mode > 0:
-                        self.selected_mode -= 1
-                elif event.key == pygame.K_DOWN:
-                    self.sound_manager.play_sound('menu_navigate')
-                    if self.selected_mode < 4:  # 5 game modes (0-4)
-                        self.selected_mode += 1
-                elif event.key == pygame.K_LEFT:
-                    self.sound_manager.play_sound('menu_navigate')
-                    if self.selected_difficulty > 0:
-                        self.selected_difficulty -= 1
-                elif event.key == pygame.K_RIGHT:
-                    self.sound_manager.play_sound('menu_navigate')
-                    if self.selected_difficulty < 3:  # 4 difficulty levels (0-3)
-                        self.selected_difficulty += 1
-            
-            elif self.state == PLAYING:
-                if event.key == pygame.K_UP and self.snake.direction != (0, 1):
-                    self.snake.change_direction((0, -1))
-                    self.sound_manager.play_sound('move')
-                elif event.key == pygame.K_DOWN and self.snake.direction != (0, -1):
-                    self.snake.change_direction((0, 1))
-                    self.sound_manager.play_sound('move')
-                elif event.key == pygame.K_LEFT and self.snake.direction != (1, 0):
-                    self.snake.change_direction((-1, 0))
-                    self.sound_manager.play_sound('move')
-                elif event.key == pygame.K_RIGHT and self.snake.direction != (-1, 0):
-                    self.snake.change_direction((1, 0))
-                    self.sound_manager.play_sound('move')
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play_sound('menu_select')
-                    self.state = PAUSED
-            
-            elif self.state == PAUSED:
-                if event.key == pygame.K_RETURN:
-                    self.sound_manager.play_sound('menu_select')
-                    self.state = PLAYING
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play_sound('menu_select')
-                    self.state = MENU
-                    self.sound_manager.stop_music()
-                    self.sound_manager.play_music('menu')
-            
-            elif self.state == GAME_OVER:
-                if event.key == pygame.K_RETURN:
-                    self.sound_manager.play_sound('menu_select')
-                    self.reset_game()
-                    self.state = PLAYING
-                    self.sound_manager.stop_music()
-                    self.sound_manager.play_music('gameplay')
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play_sound('menu_select')
-                    self.reset_game()
-                    self.state = MENU
-                    self.sound_manager.stop_music()
-                    self.sound_manager.play_music('menu')
+            handler = self.key_handlers[self.state].get(event.key)
+            if handler:
+                handler()
+    
+    def open_mode_select(self):
+        self.sound_manager.play_sound('menu_select')
+        self.state = MODE_SELECT
+    
+    def close_mode_select(self):
+        self.sound_manager.play_sound('menu_navigate')
+        self.state = MENU
+    
+    def select_previous_mode(self):
+        self.sound_manager.play_sound('menu_navigate')
+        if self.selected_mode > 0:
+            self.selected_mode -= 1
+    
+    def select_next_mode(self):
+        self.sound_manager.play_sound('menu_navigate')
+        if self.selected_mode < 4:  # 5 game modes (0-4)
+            self.selected_mode += 1
+    
+    def select_easier_difficulty(self):
+        self.sound_manager.play_sound('menu_navigate')
+        if self.selected_difficulty > 0:
+            self.selected_difficulty -= 1
+    
+    def select_harder_difficulty(self):
+        self.sound_manager.play_sound('menu_navigate')
+        if self.selected_difficulty < 3:  # 4 difficulty levels (0-3)
+            self.selected_difficulty += 1
+    
+    def start_selected_mode(self):
+        # Apply selected mode and difficulty
+        self.game_mode_manager.set_game_mode(self.selected_mode)
+        self.game_mode_manager.set_difficulty(self.selected_difficulty)
+        self.start_game()
+    
+    def start_game(self):
+        self.sound_manager.play_sound('menu_select')
+        self.reset_game()
+        self.state = PLAYING
+        self.sound_manager.play_music('gameplay')
+    
+    def steer(self, direction):
+        # The snake cannot turn back on itself
+        if self.snake.direction != OPPOSITE_DIRECTIONS[direction]:
+            self.snake.change_direction(direction)
+            self.sound_manager.play_sound('move')
+    
+    def pause_game(self):
+        self.sound_manager.play_sound('menu_select')
+        self.state = PAUSED
+    
+    def resume_game(self):
+        self.sound_manager.play_sound('menu_select')
+        self.state = PLAYING
+    
+    def quit_to_menu(self):
+        self.sound_manager.play_sound('menu_select')
+        self.state = MENU
+        self.sound_manager.play_music('menu')
+    
+    def return_to_menu(self):
+        self.sound_manager.play_sound('menu_select')
+        self.reset_game()
+        self.state = MENU
+        self.sound_manager.play_music('menu')
     
     def update(self, dt):
         # Always update background
@@ -240,6 +306,9 @@ class FancySnakeGame:
             pass
             
         elif self.state == PLAYING:
+            # The scene is changing again, so any pause or game over snapshot is stale
+            self.scene_snapshot = None
+            
             # Update snake animation
             self.snake.update_animation(dt, self.particles)
             
@@ -258,84 +327,14 @@ class FancySnakeGame:
             # Update game mode specific elements
             if self.game_mode_manager.update(dt):
                 # Time's up in time trial mode
-                self.state = GAME_OVER
-                self.game_over_time = 0
-                self.death_particles_created = False
-                self.sound_manager.play_sound('game_over')
-                self.sound_manager.stop_music()
-                self.sound_manager.play_music('game_over')
+                self.trigger_game_over()
                 return
             
-            # Update move timer
-            self.move_timer += dt
-            if self.move_timer >= self.move_delay:
-                self.move_timer = 0
-                
-                # Move snake
-                self.snake.move()
-                
-                # Check for portal teleportation
-                portal_exit = self.game_mode_manager.check_portal_teleport(self.snake.head_position)
-                if portal_exit:
-                    # Teleport snake head
-                    self.snake.segments[0] = portal_exit
-                    self.sound_manager.play_sound('power_up')  # Reuse power-up sound for teleport
-                
-                # Check for collisions with food
-                if self.snake.head_position == self.food.position:
-                    # Create particles at food position
-                    x, y = self.food.position
-                    self.particles.create_food_particles(x, y, self.food.color)
-                    
-                    # Play sound
-                    self.sound_manager.play_sound('eat')
-                    
-                    # Grow snake and update score
-                    self.snake.grow()
-                    
-                    # Calculate score with power-up multiplier
-                    score_value = self.game_mode_manager.get_food_value() * 10
-                    score_multiplier = self.power_up_manager.get_score_multiplier()
-                    self.score += int(score_value * score_multiplier)
-                    
-                    # Update high score
-                    self.high_score = max(self.score, self.high_score)
-                    
-                    # Spawn new food
-                    self.spawn_food()
-                
-                # Check for collisions with obstacles or maze walls
-                if self.snake.head_position in self.game_mode_manager.obstacles or \
-                   self.snake.head_position in self.game_mode_manager.maze_walls:
-                    if not self.game_mode_manager.is_no_death_mode():
-                        self.state = GAME_OVER
-                        self.game_over_time = 0
-                        self.death_particles_created = False
-                        self.sound_manager.play_sound('game_over')
-                        self.sound_manager.stop_music()
-                        self.sound_manager.play_music('game_over')
-                
-                # Check for collisions with walls
-                head_x, head_y = self.snake.head_position
-                if self.game_mode_manager.has_wall_collision() and \
-                   (head_x < 0 or head_x >= GRID_WIDTH or head_y < 0 or head_y >= GRID_HEIGHT):
-                    if not self.game_mode_manager.is_no_death_mode() and not self.snake.ghost_mode:
-                        self.state = GAME_OVER
-                        self.game_over_time = 0
-                        self.death_particles_created = False
-                        self.sound_manager.play_sound('game_over')
-                        self.sound_manager.stop_music()
-                        self.sound_manager.play_music('game_over')
-                
-                # Check for collisions with self
-                if self.snake.head_position in self.snake.segments[1:]:
-                    if not self.game_mode_manager.is_no_death_mode() and not self.snake.ghost_mode:
-                        self.state = GAME_OVER
-                        self.game_over_time = 0
-                        self.death_particles_created = False
-                        self.sound_manager.play_sound('game_over')
-                        self.sound_manager.stop_music()
-                        self.sound_manager.play_music('game_over')
+            # Advance the snake in fixed steps, catching up on any missed after a slow frame
+            self.move_timer = min(self.move_timer + dt, self.move_delay * MAX_MOVES_PER_FRAME)
+            while self.state == PLAYING and self.move_timer >= self.move_delay:
+                self.move_timer -= self.move_delay
+                self.step_snake()
                 
         elif self.state == GAME_OVER:
             # Update game over animations
@@ -346,19 +345,74 @@ class FancySnakeGame:
                 self.particles.create_death_particles(self.snake.segments)
                 self.death_particles_created = True
     
+    def step_snake(self):
+        """Move the snake one cell and resolve portals, food and collisions"""
+        # Move snake
+        self.snake.move()
+        
+        # Check for portal teleportation
+        portal_exit = self.game_mode_manager.check_portal_teleport(self.snake.head_position)
+        if portal_exit:
+            # Teleport snake head
+            self.snake.teleport_head(portal_exit)
+            self.sound_manager.play_sound('power_up')  # Reuse power-up sound for teleport
+        
+        head_x, head_y = self.snake.head_position
+        hit_self = self.snake.segment_counts[self.snake.head_position] > 1
+        
+        # Check for collisions with food
+        if self.snake.head_position == self.food.position:
+            # Create particles at food position
+            x, y = self.food.position
+            self.particles.create_food_particles(x, y, self.food.color)
+            
+            # Play sound
+            self.sound_manager.play_sound('eat')
+            
+            # Grow snake and update score
+            self.snake.grow()
+            
+            # Calculate score with power-up multiplier
+            score_value = self.game_mode_manager.get_food_value() * 10
+            score_multiplier = self.power_up_manager.get_score_multiplier()
+            self.score += int(score_value * score_multiplier)
+            
+            # Update high score
+            self.high_score = max(self.score, self.high_score)
+            
+            # Spawn new food
+            self.spawn_food()
+        
+        # Check for collisions with obstacles, maze walls, walls or self in one pass
+        hit_blocked = self.snake.head_position in self.game_mode_manager.solid_cells
+        hit_wall = self.game_mode_manager.has_wall_collision() and \
+            not (0 <= head_x < GRID_WIDTH and 0 <= head_y < GRID_HEIGHT)
+        if (hit_blocked or ((hit_wall or hit_self) and not self.snake.ghost_mode)) and \
+           not self.game_mode_manager.is_no_death_mode():
+            self.trigger_game_over()
+    
+    def trigger_game_over(self):
+        """End the current game and switch to the game over screen and music"""
+        self.state = GAME_OVER
+        self.game_over_time = 0
+        self.death_particles_created = False
+        self.sound_manager.play_sound('game_over')
+        self.sound_manager.play_music('game_over')
+    
     def update_menu_particles(self, dt):
-        # Update existing menu particles
-        for particle in self.menu_particles[:]:
-            particle['age'] += dt
-            if particle['age'] >= particle['lifetime']:
-                self.menu_particles.remove(particle)
-            else:
-                # Update position
-                particle['x'] += particle['vx'] * dt
-                particle['y'] += particle['vy'] * dt
-                # Update alpha
-                progress = particle['age'] / particle['lifetime']
-                particle['alpha'] = int(255 * (1 - progress))
+        # Update existing menu particles (all fields advanced as whole arrays)
+        mp = self.menu_particles
+        alive = mp['alive']
+        mp['age'][alive] += dt
+        mp['x'][alive] += mp['vx'][alive] * dt
+        mp['y'][alive] += mp['vy'][alive] * dt
+        
+        # Update alpha and retire particles that have outlived their lifetime
+        progress = np.minimum(mp['age'][alive] / mp['lifetime'][alive], 1.0)
+        mp['alpha'][alive] = (255 * (1 - progress)).astype(np.uint8)
+        expired = alive & (mp['age'] >= mp['lifetime'])
+        self.free_menu_particle_slots.extend(np.flatnonzero(expired).tolist())
+        alive &= ~expired
         
         # Add new particles occasionally
         if random.random() < dt * 5:  # Average 5 particles per second
@@ -393,21 +447,44 @@ class FancySnakeGame:
         r = random.randint(0, 100)
         g = random.randint(150, 255)
         b = random.randint(100, 255)
-        color = (r, g, b)
-        
-        self.menu_particles.append({
-            'x': x,
-            'y': y,
-            'vx': vx,
-            'vy': vy,
-            'size': random.uniform(2, 5),
-            'color': color,
-            'alpha': 200,
-            'lifetime': random.uniform(1.0, 3.0),
-            'age': 0,
-        })
+        
+        # Write into a free slot; drop the particle if the pool is full
+        if not self.free_menu_particle_slots:
+            return
+        i = self.free_menu_particle_slots.popleft()
+        mp = self.menu_particles
+        mp['x'][i] = x
+        mp['y'][i] = y
+        mp['vx'][i] = vx
+        mp['vy'][i] = vy
+        mp['size'][i] = random.uniform(2, 5)
+        mp['color_key'][i] = (r >> 4) << 8 | (g >> 4) << 4 | (b >> 4)
+        mp['alpha'][i] = 200
+        mp['lifetime'][i] = random.uniform(1.0, 3.0)
+        mp['age'][i] = 0
+        mp['alive'][i] = True
     
     def render(self):
+        if self.state in (PAUSED, GAME_OVER):
+            # Nothing in the dimmed scene moves, so draw it once and reuse the snapshot
+            if self.scene_snapshot is None:
+                self.render_dimmed_scene()
+                self.scene_snapshot = self.screen.copy()
+            else:
+                self.screen.blit(self.scene_snapshot, (0, 0))
+            
+            if self.state == PAUSED:
+                # Draw pause menu
+                self.render_pause_menu()
+            else:
+                # Draw death particles and the game over screen
+                self.particles.render(self.screen)
+                self.render_game_over()
+            
+            # Update the display
+            pygame.display.flip()
+            return
+        
         # Render background
         self.background.render(self.screen)
         
@@ -429,85 +506,68 @@ class FancySnakeGame:
             self.render_hud()
             self.power_up_manager.render_active_effects(self.screen)
             self.game_mode_manager.render_mode_info(self.screen, 10, SCREEN_HEIGHT - 30)
-        elif self.state == PAUSED:
-            # Draw game mode specific elements (dimmed)
-            self.game_mode_manager.render(self.screen)
-            
-            # Draw game elements (dimmed)
-            self.power_up_manager.render(self.screen, dimmed=True)
-            self.food.render(self.screen, dimmed=True)
-            self.snake.render(self.screen, self.particles, dimmed=True)
-            
-            # Draw UI elements
-            self.render_hud(dimmed=True)
-            self.game_mode_manager.render_mode_info(self.screen, 10, SCREEN_HEIGHT - 30)
-            
-            # Draw pause menu
-            self.render_pause_menu()
-        elif self.state == GAME_OVER:
-            # Draw game mode specific elements (dimmed)
-            self.game_mode_manager.render(self.screen)
-            
-            # Draw game elements (dimmed)
-            self.power_up_manager.render(self.screen, dimmed=True)
-            self.food.render(self.screen, dimmed=True)
-            self.snake.render(self.screen, self.particles, dimmed=True)
-            self.particles.render(self.screen)  # Death particles
-            
-            # Draw UI elements
-            self.render_hud(dimmed=True)
-            self.game_mode_manager.render_mode_info(self.screen, 10, SCREEN_HEIGHT - 30)
-            
-            # Draw game over screen
-            self.render_game_over()
         
         # Update the display
         pygame.display.flip()
     
+    def render_dimmed_scene(self):
+        """Render the frozen game scene shown behind the pause and game over screens"""
+        # Render background
+        self.background.render(self.screen)
+        
+        # Draw game mode specific elements (dimmed)
+        self.game_mode_manager.render(self.screen)
+        
+        # Draw game elements (dimmed)
+        self.power_up_manager.render(self.screen, dimmed=True)
+        self.food.render(self.screen, dimmed=True)
+        self.snake.render(self.screen, self.particles, dimmed=True)
+        
+        # Draw UI elements
+        self.render_hud(dimmed=True)
+        self.game_mode_manager.render_mode_info(self.screen, 10, SCREEN_HEIGHT - 30)
+    
     def render_menu(self):
-        # Render menu particles
-        for particle in self.menu_particles:
-            pygame.gfxdraw.filled_circle(
-                self.screen,
-                int(particle['x']),
-                int(particle['y']),
-                int(particle['size']),
-                (*particle['color'], particle['alpha'])
+        # Render menu particles with one batched blit
+        mp = self.menu_particles
+        alive = mp['alive']
+        sizes = mp['size'][alive].astype(np.int32)
+        sprite_keys = (sizes << 16) | (mp['color_key'][alive].astype(np.int32) << 4) | (mp['alpha'][alive] >> 4)
+        blit_sequence = [
+            (self.get_particle_sprite(key), (x - size, y - size))
+            for key, x, y, size in zip(
+                sprite_keys.tolist(),
+                mp['x'][alive].astype(int).tolist(),
+                mp['y'][alive].astype(int).tolist(),
+                sizes.tolist(),
             )
+        ]
+        self.screen.blits(blit_sequence, doreturn=False)
         
         # Title with pulsing effect
         pulse = (math.sin(self.menu_time * 2) + 1) * 0.1
-        title_scale = 1.0 + pulse
-        title_text = self.title_font.render("FANCY SNAKE", True, GOLD)
+        title_scale = round((1.0 + pulse) * 40) / 40  # 2.5% steps so scaled titles can be cached
+        title_text = self.render_text(self.title_font, "FANCY SNAKE", GOLD)
         title_rect = title_text.get_rect()
         title_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)
         
         # Create a slightly larger surface for the title to accommodate the scaling
         scaled_width = int(title_rect.width * title_scale)
         scaled_height = int(title_rect.height * title_scale)
-        scaled_surface = pygame.transform.scale(title_text, (scaled_width, scaled_height))
+        scaled_surface = self.get_scaled_title("FANCY SNAKE", GOLD, (scaled_width, scaled_height))
         scaled_rect = scaled_surface.get_rect(center=title_rect.center)
         
-        # Draw title with glow effect
-        glow_surface = pygame.Surface((scaled_width + 20, scaled_height + 20), pygame.SRCALPHA)
-        glow_text = self.title_font.render("FANCY SNAKE", True, (255, 215, 0, 100))
-        glow_scaled = pygame.transform.scale(glow_text, (scaled_width + 10, scaled_height + 10))
-        glow_rect = glow_scaled.get_rect(center=(glow_surface.get_width()//2, glow_surface.get_height()//2))
-        glow_surface.blit(glow_scaled, glow_rect)
-        
-        # Apply blur effect to glow (simple approximation)
-        for i in range(5):
-            blur_offset = i + 1
-            for offset_x, offset_y in [(blur_offset, 0), (-blur_offset, 0), (0, blur_offset), (0, -blur_offset)]:
-                self.screen.blit(glow_surface, (scaled_rect.x - 10 + offset_x, scaled_rect.y - 10 + offset_y))
+        # Draw title with glow effect (blur already baked in)
+        glow_surface = self.get_glow_surface("FANCY SNAKE", (255, 215, 0, 100), (scaled_width + 10, scaled_height + 10))
+        self.screen.blit(glow_surface, glow_surface.get_rect(center=scaled_rect.center))
         
         # Draw the actual title
         self.screen.blit(scaled_surface, scaled_rect)
         
         # Subtitle with color cycling
-        hue = (self.menu_time * 50) % 360  # Cycle through hues
-        r, g, b = self.hsv_to_rgb(hue, 0.7, 0.9)
-        subtitle_text = self.font.render("A Very Fancy Snake Game", True, (r, g, b))
+        hue = int(self.menu_time * 50) % 360  # Cycle through hues
+        r, g, b = self.subtitle_hues[hue]
+        subtitle_text = self.render_text(self.font, "A Very Fancy Snake Game", (r, g, b))
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4 + 80))
         self.screen.blit(subtitle_text, subtitle_rect)
         
@@ -519,39 +579,49 @@ class FancySnakeGame:
         ]
         
         for option in options:
-            pulse_start = (math.sin(self.menu_time * 3) + 1) * 0.5
-            color = option.get("color", self.lerp_color(WHITE, GOLD, pulse_start))
-            text = self.font.render(option["text"], True, color)
+            pulse_step = round((math.sin(self.menu_time * 3) + 1) * 7.5)  # 16 color steps
+            color = option.get("color", self.get_gradient(WHITE, GOLD, 16)[pulse_step])
+            text = self.render_text(self.font, option["text"], color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + option["y_offset"]))
             self.screen.blit(text, text_rect)
         
         # Controls
-        controls_text = self.small_font.render("Controls: Arrow Keys to move, ESC to pause", True, WHITE)
+        controls_text = self.render_text(self.small_font, "Controls: Arrow Keys to move, ESC to pause", WHITE)
         controls_rect = controls_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
         self.screen.blit(controls_text, controls_rect)
         
         # Draw animated snake in the background
         self.render_menu_snake()
     
+    def get_particle_sprite(self, key):
+        """Get a cached menu particle sprite for a packed (size, 4-bit r, g, b, alpha) key"""
+        sprite = self.particle_sprites.get(key)
+        if sprite is None:
+            if len(self.particle_sprites) >= 4096:
+                self.particle_sprites.clear()
+            size = key >> 16
+            sprite = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA).convert_alpha()
+            color = tuple(((key >> shift) & 0xF) << 4 | 8 for shift in (12, 8, 4, 0))
+            pygame.gfxdraw.filled_circle(sprite, size, size, size, color)
+            self.particle_sprites[key] = sprite
+        return sprite
+    
     def render_menu_snake(self):
         """Render an animated snake in the menu background"""
         # Calculate snake path based on time
         t = self.menu_time * 0.5
-        points = []
         
         # Create a spiral path
-        for i in range(20):
-            angle = t + i * 0.3
-            radius = 100 + i * 5
-            x = SCREEN_WIDTH // 2 + math.cos(angle) * radius
-            y = SCREEN_HEIGHT // 2 + math.sin(angle) * radius
-            points.append((x, y))
+        angles = t + self.spiral_phases
+        xs = SCREEN_WIDTH // 2 + np.cos(angles) * self.spiral_radii
+        ys = SCREEN_HEIGHT // 2 + np.sin(angles) * self.spiral_radii
+        points = zip(xs.tolist(), ys.tolist())
         
         # Draw snake segments along the path
         for i, (x, y) in enumerate(points):
             # Calculate color based on position in snake
-            hue = (t * 50 + i * 10) % 360
-            r, g, b = self.hsv_to_rgb(hue, 0.8, 0.8)
+            hue = int(t * 50 + i * 10) % 360
+            r, g, b = self.menu_snake_hues[hue]
             
             # Draw segment
             size = 15 - i * 0.5  # Gradually smaller toward tail
@@ -571,53 +641,47 @@ class FancySnakeGame:
     def render_hud(self, dimmed=False):
         color = (150, 150, 150) if dimmed else WHITE
         
-        # Score with fancy background
-        score_bg = pygame.Surface((150, 40), pygame.SRCALPHA)
-        pygame.draw.rect(score_bg, (0, 0, 0, 128), score_bg.get_rect(), border_radius=10)
-        self.screen.blit(score_bg, (10, 10))
-        
-        score_text = self.font.render(f"Score: {self.score}", True, color)
-        self.screen.blit(score_text, (20, 15))
-        
-        # High score with fancy background
-        high_score_text = self.font.render(f"High: {self.high_score}", True, color)
-        high_score_rect = high_score_text.get_rect()
-        
-        high_score_bg = pygame.Surface((high_score_rect.width + 20, 40), pygame.SRCALPHA)
-        pygame.draw.rect(high_score_bg, (0, 0, 0, 128), high_score_bg.get_rect(), border_radius=10)
-        self.screen.blit(high_score_bg, (SCREEN_WIDTH - high_score_rect.width - 30, 10))
+        # Rebuild the HUD only when the scores or its color change
+        key = (self.score, self.high_score, color)
+        if key != self.hud_key:
+            self.hud_key = key
+            
+            # Score with fancy background
+            score_text = self.render_text(self.font, f"Score: {self.score}", color)
+            
+            # High score with fancy background
+            high_score_text = self.render_text(self.font, f"High: {self.high_score}", color)
+            high_score_width = high_score_text.get_width()
+            high_score_bg = self.get_hud_background(high_score_width + 20)
+            
+            self.hud_blits = [
+                (self.get_hud_background(150), (10, 10)),
+                (score_text, (20, 15)),
+                (high_score_bg, (SCREEN_WIDTH - high_score_width - 30, 10)),
+                (high_score_text, (SCREEN_WIDTH - high_score_width - 20, 15)),
+            ]
         
-        self.screen.blit(high_score_text, (SCREEN_WIDTH - high_score_rect.width - 20, 15))
+        self.screen.blits(self.hud_blits, doreturn=False)
+    
+    def get_hud_background(self, width):
+        """Get a cached 40 pixel high rounded HUD background of the given width"""
+        if width not in self.hud_backgrounds:
+            background = pygame.Surface((width, 40), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(background, (0, 0, 0, 128), background.get_rect(), border_radius=10)
+            self.hud_backgrounds[width] = background
+        return self.hud_backgrounds[width]
     
     def render_pause_menu(self):
         # Semi-transparent overlay with radial gradient
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        # Create radial gradient
-        center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-        max_radius = math.sqrt(SCREEN_WIDTH**2 + SCREEN_HEIGHT**2) / 2
-        
-        for radius in range(0, int(max_radius), 2):
-            alpha = int(128 * (radius / max_radius))
-            pygame.gfxdraw.filled_circle(overlay, center[0], center[1], int(max_radius) - radius, (0, 0, 0, alpha))
-        
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.pause_overlay, (0, 0))
         
         # Pause title with glow
-        pause_text = self.title_font.render("PAUSED", True, WHITE)
+        pause_text = self.render_text(self.title_font, "PAUSED", WHITE)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         
-        # Glow effect
-        glow_surface = pygame.Surface((pause_rect.width + 20, pause_rect.height + 20), pygame.SRCALPHA)
-        glow_text = self.title_font.render("PAUSED", True, (255, 255, 255, 100))
-        glow_rect = glow_text.get_rect(center=(glow_surface.get_width()//2, glow_surface.get_height()//2))
-        glow_surface.blit(glow_text, glow_rect)
-        
-        # Apply blur effect to glow (simple approximation)
-        for i in range(5):
-            blur_offset = i + 1
-            for offset_x, offset_y in [(blur_offset, 0), (-blur_offset, 0), (0, blur_offset), (0, -blur_offset)]:
-                self.screen.blit(glow_surface, (pause_rect.x - 10 + offset_x, pause_rect.y - 10 + offset_y))
+        # Glow effect (blur already baked in)
+        glow_surface = self.get_glow_surface("PAUSED", (255, 255, 255, 100))
+        self.screen.blit(glow_surface, glow_surface.get_rect(center=pause_rect.center))
         
         # Draw the actual text
         self.screen.blit(pause_text, pause_rect)
@@ -629,75 +693,54 @@ class FancySnakeGame:
         ]
         
         for option in options:
-            text = self.font.render(option["text"], True, WHITE)
+            text, bg_surface = self.get_option_button(option["text"])
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + option["y_offset"]))
             
-            # Background with rounded corners
-            bg_rect = text_rect.inflate(40, 20)
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(bg_surface, (0, 0, 0, 150), bg_surface.get_rect(), border_radius=10)
-            
-            # Draw subtle border
-            pygame.draw.rect(bg_surface, (100, 100, 100, 100), bg_surface.get_rect(), width=2, border_radius=10)
-            
-            self.screen.blit(bg_surface, bg_rect)
+            self.screen.blit(bg_surface, text_rect.inflate(40, 20))
             self.screen.blit(text, text_rect)
     
     def render_game_over(self):
         # Semi-transparent overlay with radial gradient that expands over time
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
         # Calculate expanding radius based on game over time
         expansion_duration = 1.0  # seconds
         progress = min(1.0, self.game_over_time / expansion_duration)
         
-        # Create radial gradient
-        center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-        max_radius = math.sqrt(SCREEN_WIDTH**2 + SCREEN_HEIGHT**2) / 2
-        current_radius = max_radius * progress
-        
-        for radius in range(0, int(current_radius), 2):
-            alpha = int(192 * (radius / current_radius))
-            pygame.gfxdraw.filled_circle(overlay, center[0], center[1], int(current_radius) - radius, (0, 0, 0, alpha))
-        
-        self.screen.blit(overlay, (0, 0))
+        # Redraw the overlay in place only while it is still expanding
+        current_radius = self.overlay_max_radius * progress
+        if current_radius != self.game_over_overlay_radius:
+            self.fill_radial_overlay(self.game_over_overlay, current_radius, 192)
+            self.game_over_overlay_radius = current_radius
+        self.screen.blit(self.game_over_overlay, (0, 0))
         
         # Only show text after the overlay animation is complete
         if progress >= 1.0:
             # Game over title with animation
-            title_scale = 1.0 + 0.1 * math.sin(self.game_over_time * 3)
-            game_over_text = self.title_font.render("GAME OVER", True, RED)
+            title_scale = round((1.0 + 0.1 * math.sin(self.game_over_time * 3)) * 40) / 40
+            game_over_text = self.render_text(self.title_font, "GAME OVER", RED)
             game_over_rect = game_over_text.get_rect()
             game_over_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3)
             
             # Scale the text
             scaled_width = int(game_over_rect.width * title_scale)
             scaled_height = int(game_over_rect.height * title_scale)
-            scaled_surface = pygame.transform.scale(game_over_text, (scaled_width, scaled_height))
+            scaled_surface = self.get_scaled_title("GAME OVER", RED, (scaled_width, scaled_height))
             scaled_rect = scaled_surface.get_rect(center=game_over_rect.center)
             
-            # Draw with glow effect
-            glow_surface = pygame.Surface((scaled_width + 20, scaled_height + 20), pygame.SRCALPHA)
-            glow_text = self.title_font.render("GAME OVER", True, (255, 0, 0, 100))
-            glow_scaled = pygame.transform.scale(glow_text, (scaled_width + 10, scaled_height + 10))
-            glow_rect = glow_scaled.get_rect(center=(glow_surface.get_width()//2, glow_surface.get_height()//2))
-            glow_surface.blit(glow_scaled, glow_rect)
-            
-            # Apply blur effect to glow
-            for i in range(5):
-                blur_offset = i + 1
-                for offset_x, offset_y in [(blur_offset, 0), (-blur_offset, 0), (0, blur_offset), (0, -blur_offset)]:
-                    self.screen.blit(glow_surface, (scaled_rect.x - 10 + offset_x, scaled_rect.y - 10 + offset_y))
+            # Draw with glow effect (blur already baked in)
+            glow_surface = self.get_glow_surface("GAME OVER", (255, 0, 0, 100), (scaled_width + 10, scaled_height + 10))
+            self.screen.blit(glow_surface, glow_surface.get_rect(center=scaled_rect.center))
             
             # Draw the actual text
             self.screen.blit(scaled_surface, scaled_rect)
             
-            # Score with fancy background
-            score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
+            # Score with fancy background, rebuilt only when the score changes
+            if self.final_score_panel[0] != self.score:
+                score_text = self.font.render(f"Final Score: {self.score}", True, WHITE).convert_alpha()
+                score_bg = pygame.Surface((score_text.get_width() + 40, score_text.get_height() + 20), pygame.SRCALPHA).convert_alpha()
+                pygame.draw.rect(score_bg, (0, 0, 0, 150), score_bg.get_rect(), border_radius=10)
+                self.final_score_panel = (self.score, score_text, score_bg)
+            _, score_text, score_bg = self.final_score_panel
             score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            
-            score_bg = pygame.Surface((score_rect.width + 40, score_rect.height + 20), pygame.SRCALPHA)
-            pygame.draw.rect(score_bg, (0, 0, 0, 150), score_bg.get_rect(), border_radius=10)
             self.screen.blit(score_bg, score_rect.inflate(40, 20))
             self.screen.blit(score_text, score_rect)
             
@@ -708,20 +751,83 @@ class FancySnakeGame:
             ]
             
             for option in options:
-                text = self.font.render(option["text"], True, WHITE)
+                text, bg_surface = self.get_option_button(option["text"])
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + option["y_offset"]))
                 
-                # Background with rounded corners
-                bg_rect = text_rect.inflate(40, 20)
-                bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(bg_surface, (0, 0, 0, 150), bg_surface.get_rect(), border_radius=10)
-                
-                # Draw subtle border
-                pygame.draw.rect(bg_surface, (100, 100, 100, 100), bg_surface.get_rect(), width=2, border_radius=10)
-                
-                self.screen.blit(bg_surface, bg_rect)
+                self.screen.blit(bg_surface, text_rect.inflate(40, 20))
                 self.screen.blit(text, text_rect)
     
+    def get_option_button(self, text):
+        """Get the cached text and rounded background for a menu option"""
+        if text not in self.option_buttons:
+            text_surface = self.render_text(self.font, text, WHITE)
+            width, height = text_surface.get_size()
+            
+            # Background with rounded corners
+            bg_surface = pygame.Surface((width + 40, height + 20), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(bg_surface, (0, 0, 0, 150), bg_surface.get_rect(), border_radius=10)
+            
+            # Draw subtle border
+            pygame.draw.rect(bg_surface, (100, 100, 100, 100), bg_surface.get_rect(), width=2, border_radius=10)
+            
+            self.option_buttons[text] = (text_surface, bg_surface)
+        return self.option_buttons[text]
+    
+    def render_text(self, font, text, color):
+        """Render text once per (font, text, color) and reuse the surface afterwards"""
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= 512:
+                self.text_cache.clear()
+            surface = font.render(text, True, color).convert_alpha()
+            self.text_cache[key] = surface
+        return surface
+    
+    def get_scaled_title(self, text, color, size):
+        """Get title text scaled to the given size, resampling each size only once"""
+        key = (text, color, size)
+        if key not in self.scaled_title_cache:
+            title_text = self.render_text(self.title_font, text, color)
+            self.scaled_title_cache[key] = pygame.transform.scale(title_text, size).convert_alpha()
+        return self.scaled_title_cache[key]
+    
+    def get_glow_surface(self, text, glow_color, size=None):
+        """Get a cached title glow with the offset-copy blur baked into one surface"""
+        key = (text, glow_color, size)
+        if key not in self.glow_cache:
+            glow_text = self.render_text(self.title_font, text, glow_color)
+            if size is not None:
+                glow_text = pygame.transform.scale(glow_text, size)
+            width, height = glow_text.get_size()
+            
+            # Blur (simple approximation): 20 copies offset by up to 5 pixels each way
+            glow_surface = pygame.Surface((width + 10, height + 10), pygame.SRCALPHA).convert_alpha()
+            for i in range(5):
+                blur_offset = i + 1
+                for offset_x, offset_y in [(blur_offset, 0), (-blur_offset, 0), (0, blur_offset), (0, -blur_offset)]:
+                    glow_surface.blit(glow_text, (5 + offset_x, 5 + offset_y))
+            
+            self.glow_cache[key] = glow_surface
+        return self.glow_cache[key]
+    
+    def fill_radial_overlay(self, overlay, radius, max_alpha):
+        """Fill a black overlay that is darkest at the center and fades out at radius"""
+        alpha = pygame.surfarray.pixels_alpha(overlay)
+        if radius <= 0:
+            alpha[:] = 0
+        else:
+            # Same falloff as stacking alpha-blended circles from the edge inwards,
+            # computed in place in a preallocated float buffer
+            falloff = self.overlay_falloff
+            np.multiply(self.overlay_distance, -1.0 / radius, out=falloff)
+            falloff += 1
+            np.clip(falloff, 0, 1, out=falloff)
+            falloff *= falloff
+            falloff *= max_alpha / 2
+            alpha[:] = falloff
+        del alpha  # Unlock the surface
+    
     def reset_game(self):
         # Reset game objects
         self.snake = EnhancedSnake(GRID_WIDTH // 2, GRID_HEIGHT // 2)
@@ -747,57 +853,38 @@ class FancySnakeGame:
     
     def spawn_food(self):
         """Spawn food at a valid position"""
-        valid_positions = []
-        
-        # Find all valid positions
-        for x in range(GRID_WIDTH):
-            for y in range(GRID_HEIGHT):
-                pos = (x, y)
-                if self.game_mode_manager.is_valid_spawn_position(pos, self.snake.segments):
-                    valid_positions.append(pos)
-        
-        # If there are valid positions, choose one randomly
-        if valid_positions:
-            self.food.position = random.choice(valid_positions)
-        else:
-            # If no valid positions, try to find any position not occupied by snake
-            while True:
-                x = random.randint(0, GRID_WIDTH - 1)
-                y = random.randint(0, GRID_HEIGHT - 1)
-                if (x, y) not in self.snake.segments:
-                    self.food.position = (x, y)
-                    break
-    
-    def hsv_to_rgb(self, h, s, v):
-        """Convert HSV color to RGB"""
-        h = h / 360
-        i = math.floor(h * 6)
-        f = h * 6 - i
-        p = v * (1 - s)
-        q = v * (1 - f * s)
-        t = v * (1 - (1 - f) * s)
-        
-        if i % 6 == 0:
-            r, g, b = v, t, p
-        elif i % 6 == 1:
-            r, g, b = q, v, p
-        elif i % 6 == 2:
-            r, g, b = p, v, t
-        elif i % 6 == 3:
-            r, g, b = p, q, v
-        elif i % 6 == 4:
-            r, g, b = t, p, v
-        else:
-            r, g, b = v, p, q
+        # Every cell that is not blocked by the mode's layout or the snake
+        snake_cells = self.snake.segment_counts.keys()
+        free_cells = ALL_CELLS - self.game_mode_manager.blocked_cells - snake_cells
         
-        return int(r * 255), int(g * 255), int(b * 255)
+        # If no valid positions, fall back to any position not occupied by snake
+        if not free_cells:
+            free_cells = ALL_CELLS - snake_cells
+        
+        if free_cells:
+            self.food.position = random.choice(tuple(free_cells))
+    
+    @staticmethod
+    def hue_palette(s, v):
+        """Build the 360-entry rainbow for one saturation/value pair in a single pass"""
+        h = np.arange(360) / 360
+        i = np.floor(h * 6)
+        f = h * 6 - i
+        values = np.stack((np.full(360, v), np.full(360, v * (1 - s)), v * (1 - f * s), v * (1 - (1 - f) * s)))
+        sectors = np.array(HSV_SECTORS)[i.astype(int) % 6]
+        rgb = (values[sectors, np.arange(360)[:, None]] * 255).astype(int)
+        return [tuple(color) for color in rgb.tolist()]
     
-    def lerp_color(self, color1, color2, t):
-        """Linear interpolation between two colors"""
-        r = int(color1[0] + (color2[0] - color1[0]) * t)
-        g = int(color1[1] + (color2[1] - color1[1]) * t)
-        b = int(color1[2] + (color2[2] - color1[2]) * t)
-        return (r, g, b)
+    def get_gradient(self, color1, color2, steps):
+        """Get a cached list of colors stepping evenly from color1 to color2"""
+        key = (color1, color2, steps)
+        gradient = self.palette_cache.get(key)
+        if gradient is None:
+            start = np.array(color1, dtype=float)
+            t = np.linspace(0, 1, steps)[:, None]
+            rgb = (start + (np.array(color2, dtype=float) - start) * t).astype(int)
+            gradient = self.palette_cache[key] = [tuple(color) for color in rgb.tolist()]
+        return gradient
 
 
 # Main function
@@ -7,6 +7,7 @@ This file implements different game modes and difficulty settings for our fancy
 import pygame
 import random
 import math
+import numpy as np
 
 # Constants
 SCREEN_WIDTH = 800
@@ -28,6 +29,29 @@ OBSTACLE = 2
 MAZE = 3
 ZEN = 4
 
+# Cells at least two away from the border, where obstacles and portals may be placed
+INTERIOR_CELLS = [(x, y) for x in range(2, GRID_WIDTH - 2) for y in range(2, GRID_HEIGHT - 2)]
+
+# Interior cells outside the center area where the snake starts
+OBSTACLE_CELLS = [
+    (x, y) for x, y in INTERIOR_CELLS
+    if not (abs(x - GRID_WIDTH // 2) < 3 and abs(y - GRID_HEIGHT // 2) < 3)
+]
+
+# Unit directions of the eight portal swirl spokes, rotated by the animation phase each frame
+SWIRL_SPOKES = [(math.cos(j * math.pi / 4), math.sin(j * math.pi / 4)) for j in range(8)]
+
+# Fonts by size, created on first use
+FONT_CACHE = {}
+
+def get_font(size):
+    """Get the default font at the given size, creating it only once"""
+    font = FONT_CACHE.get(size)
+    if font is None:
+        font = FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
+
 class GameModeManager:
     """Manages different game modes and difficulty settings"""
     
@@ -125,6 +149,27 @@ class GameModeManager:
         # Portals for maze mode
         self.portals = []
         
+        # Immutable cell sets for O(1) lookups, replaced whenever the mode's layout changes
+        self.solid_cells = frozenset()  # Obstacles and maze walls
+        self.blocked_cells = frozenset()  # Solid cells plus portals; nothing may spawn here
+        self.portal_exits = {}  # Portal cell -> the cell at the other end of its pair
+        self.portal_ends = []  # (cell rect, pixel center, color) for drawing each portal end
+        
+        # Pre-rendered tiles, built lazily once a display exists
+        self.obstacle_tile = None
+        self.maze_wall_tile = None
+        
+        # Obstacles and maze walls baked onto one layer, rebuilt when the layout changes
+        self.static_layer = None
+        self.static_layer_dirty = True
+        
+        # Pre-rendered text, built on first use
+        self.selection_texts = None
+        self.mode_info_text = None
+        self.mode_info_key = None
+        self.time_text = None
+        self.time_text_seconds = None
+        
         # Time remaining for time trial mode
         self.time_remaining = 0
     
@@ -156,6 +201,25 @@ class GameModeManager:
                 self.generate_portals()
             else:
                 self.portals = []
+            
+            self.update_blocked_cells()
+    
+    def update_blocked_cells(self):
+        """Rebuild the cell lookups from the current layout"""
+        self.portal_exits = {}
+        self.portal_ends = []
+        for first, second in self.portals:
+            self.portal_exits[first] = second
+            self.portal_exits[second] = first
+            
+            # Different colors for each end of the portal pair: blue and pink
+            for (x, y), color in ((first, (0, 191, 255)), (second, (255, 105, 180))):
+                cell_rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+                self.portal_ends.append((cell_rect, cell_rect.center, color))
+        
+        self.solid_cells = frozenset(self.obstacles).union(self.maze_walls)
+        self.blocked_cells = self.solid_cells.union(self.portal_exits)
+        self.static_layer_dirty = True
     
     def get_move_delay(self):
         """Get the move delay based on current difficulty"""
@@ -194,163 +258,133 @@ class GameModeManager:
     
     def generate_obstacles(self):
         """Generate obstacles for obstacle mode"""
-        self.obstacles = []
         obstacle_count = self.game_mode_settings[self.game_mode]['obstacle_count']
         
-        # Create random obstacles
-        for _ in range(obstacle_count):
-            x = random.randint(2, GRID_WIDTH - 3)
-            y = random.randint(2, GRID_HEIGHT - 3)
-            
-            # Avoid center area where snake starts
-            if abs(x - GRID_WIDTH // 2) < 3 and abs(y - GRID_HEIGHT // 2) < 3:
-                continue
-            
-            self.obstacles.append((x, y))
+        # Create random obstacles on distinct cells
+        self.obstacles = random.sample(OBSTACLE_CELLS, min(obstacle_count, len(OBSTACLE_CELLS)))
     
     def generate_maze(self):
         """Generate a simple maze for maze mode"""
-        self.maze_walls = []
+        walls = np.zeros((GRID_WIDTH, GRID_HEIGHT), dtype=bool)
         
         # Create border walls
-        for x in range(GRID_WIDTH):
-            self.maze_walls.append((x, 0))
-            self.maze_walls.append((x, GRID_HEIGHT - 1))
-        
-        for y in range(GRID_HEIGHT):
-            self.maze_walls.append((0, y))
-            self.maze_walls.append((GRID_WIDTH - 1, y))
+        walls[[0, -1], :] = True
+        walls[:, [0, -1]] = True
         
         # Create internal walls
         # Horizontal walls with gaps
         for y in range(5, GRID_HEIGHT - 5, 5):
             gap_pos = random.randint(5, GRID_WIDTH - 6)
-            for x in range(1, GRID_WIDTH - 1):
-                if not (gap_pos <= x <= gap_pos + 4):
-                    self.maze_walls.append((x, y))
+            row = np.ones(GRID_WIDTH - 2, dtype=bool)
+            row[gap_pos - 1:gap_pos + 4] = False
+            walls[1:-1, y] |= row
         
         # Vertical walls with gaps
         for x in range(5, GRID_WIDTH - 5, 5):
             gap_pos = random.randint(5, GRID_HEIGHT - 6)
-            for y in range(1, GRID_HEIGHT - 1):
-                if not (gap_pos <= y <= gap_pos + 4):
-                    self.maze_walls.append((x, y))
+            column = np.ones(GRID_HEIGHT - 2, dtype=bool)
+            column[gap_pos - 1:gap_pos + 4] = False
+            walls[x, 1:-1] |= column
+        
+        self.maze_walls = list(map(tuple, np.argwhere(walls).tolist()))
     
     def generate_portals(self):
         """Generate portals for maze mode"""
-        self.portals = []
         portal_count = self.game_mode_settings[self.game_mode].get('portal_count', 2)
         
+        # Sample distinct free interior cells and pair them up
+        walls = set(self.maze_walls)
+        candidates = [cell for cell in INTERIOR_CELLS if cell not in walls]
+        portal_count = min(portal_count, len(candidates) // 2)
+        cells = random.sample(candidates, portal_count * 2)
+        
         # Create portal pairs
-        for _ in range(portal_count):
-            # First portal
-            while True:
-                x1 = random.randint(2, GRID_WIDTH - 3)
-                y1 = random.randint(2, GRID_HEIGHT - 3)
-                if (x1, y1) not in self.maze_walls and (x1, y1) not in self.portals:
-                    break
-            
-            # Second portal
-            while True:
-                x2 = random.randint(2, GRID_WIDTH - 3)
-                y2 = random.randint(2, GRID_HEIGHT - 3)
-                if (x2, y2) not in self.maze_walls and (x2, y2) not in self.portals and (x2, y2) != (x1, y1):
-                    break
-            
-            # Add portal pair
-            self.portals.append(((x1, y1), (x2, y2)))
+        self.portals = list(zip(cells[::2], cells[1::2]))
     
     def check_portal_teleport(self, position):
         """Check if position is on a portal and return the exit position"""
-        for portal_pair in self.portals:
-            if position == portal_pair[0]:
-                return portal_pair[1]
-            elif position == portal_pair[1]:
-                return portal_pair[0]
-        return None
+        return self.portal_exits.get(position)
     
     def is_valid_spawn_position(self, position, snake_segments):
         """Check if a position is valid for spawning food or power-ups"""
         x, y = position
         
-        # Check if position is within bounds
-        if x < 0 or x >= GRID_WIDTH or y < 0 or y >= GRID_HEIGHT:
-            return False
+        # In bounds, and not on the snake or on an obstacle, maze wall or portal
+        return (
+            0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT
+            and position not in self.blocked_cells
+            and position not in snake_segments
+        )
+    
+    def build_tiles(self):
+        """Pre-render the obstacle and maze wall tiles (needs a display mode set)"""
+        self.obstacle_tile = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+        self.obstacle_tile.fill((150, 75, 0))  # Brown obstacles
         
-        # Check if position is occupied by snake
-        if position in snake_segments:
-            return False
+        # Add some texture
+        for i in range(3):
+            pygame.draw.line(self.obstacle_tile, (100, 50, 0), (i * 5, 0), (i * 5, GRID_SIZE), 1)
         
-        # Check if position is occupied by obstacle
-        if position in self.obstacles:
-            return False
+        self.maze_wall_tile = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+        self.maze_wall_tile.fill((100, 100, 150))  # Blue-gray walls
         
-        # Check if position is occupied by maze wall
-        if position in self.maze_walls:
-            return False
+        # Add some texture
+        pygame.draw.rect(self.maze_wall_tile, (80, 80, 120), self.maze_wall_tile.get_rect(), 1)
+        pygame.draw.line(self.maze_wall_tile, (120, 120, 170), (0, 0), (GRID_SIZE, GRID_SIZE), 1)
+    
+    def build_static_layer(self):
+        """Paint all obstacles and maze walls onto a single transparent layer"""
+        self.static_layer_dirty = False
+        if not self.solid_cells:
+            self.static_layer = None
+            return
         
-        # Check if position is occupied by portal
-        for portal_pair in self.portals:
-            if position == portal_pair[0] or position == portal_pair[1]:
-                return False
+        if self.obstacle_tile is None:
+            self.build_tiles()
         
-        return True
+        self.static_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.static_layer.blits([(self.obstacle_tile, (x * GRID_SIZE, y * GRID_SIZE)) for x, y in self.obstacles], doreturn=False)
+        self.static_layer.blits([(self.maze_wall_tile, (x * GRID_SIZE, y * GRID_SIZE)) for x, y in self.maze_walls], doreturn=False)
     
     def render(self, surface):
         """Render mode-specific elements"""
-        # Render obstacles
-        for x, y in self.obstacles:
-            rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            pygame.draw.rect(surface, (150, 75, 0), rect)  # Brown obstacles
-            
-            # Add some texture
-            for i in range(3):
-                pygame.draw.line(
-                    surface,
-                    (100, 50, 0),
-                    (x * GRID_SIZE + i * 5, y * GRID_SIZE),
-                    (x * GRID_SIZE + i * 5, y * GRID_SIZE + GRID_SIZE),
-                    1
-                )
+        if self.static_layer_dirty:
+            self.build_static_layer()
         
-        # Render maze walls
-        for x, y in self.maze_walls:
-            rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            pygame.draw.rect(surface, (100, 100, 150), rect)  # Blue-gray walls
-            
-            # Add some texture
-            pygame.draw.rect(surface, (80, 80, 120), rect, 1)
-            pygame.draw.line(
-                surface,
-                (120, 120, 170),
-                (x * GRID_SIZE, y * GRID_SIZE),
-                (x * GRID_SIZE + GRID_SIZE, y * GRID_SIZE + GRID_SIZE),
-                1
-            )
+        # Obstacles and maze walls never move during a run, so they live on one pre-rendered layer
+        if self.static_layer is not None:
+            surface.blit(self.static_layer, (0, 0))
         
         # Render portals
-        for portal_pair in self.portals:
-            for i, (x, y) in enumerate(portal_pair):
-                # Different colors for each end of the portal pair
-                color = (0, 191, 255) if i == 0 else (255, 105, 180)  # Blue and pink
-                
-                # Draw portal
-                center_x = (x + 0.5) * GRID_SIZE
-                center_y = (y + 0.5) * GRID_SIZE
-                
-                # Draw outer circle
-                pygame.draw.circle(surface, color, (center_x, center_y), GRID_SIZE // 2)
-                
-                # Draw inner circle
-                pygame.draw.circle(surface, (0, 0, 0), (center_x, center_y), GRID_SIZE // 3)
-                
-                # Draw swirl
-                for j in range(8):
-                    angle = j * math.pi / 4 + pygame.time.get_ticks() / 1000
-                    radius = GRID_SIZE // 4
-                    end_x = center_x + math.cos(angle) * radius
-                    end_y = center_y + math.sin(angle) * radius
-                    pygame.draw.line(surface, color, (center_x, center_y), (end_x, end_y), 2)
+        if self.portal_ends:
+            # Rotate the fixed spoke directions by the current phase once for every portal this frame
+            phase = pygame.time.get_ticks() / 1000
+            cos_phase, sin_phase = math.cos(phase), math.sin(phase)
+            radius = GRID_SIZE // 4
+            spoke_offsets = [
+                (radius * (dx * cos_phase - dy * sin_phase), radius * (dx * sin_phase + dy * cos_phase))
+                for dx, dy in SWIRL_SPOKES
+            ]
+            clip = surface.get_clip()
+        
+        for cell_rect, center, color in self.portal_ends:
+            # Skip portals that fall entirely outside the surface's clip area
+            if not clip.colliderect(cell_rect):
+                continue
+            
+            # Draw outer circle
+            pygame.draw.circle(surface, color, center, GRID_SIZE // 2)
+            
+            # Draw inner circle
+            pygame.draw.circle(surface, (0, 0, 0), center, GRID_SIZE // 3)
+            
+            # Draw swirl as one polyline that returns to the center between spokes
+            center_x, center_y = center
+            points = [center]
+            for dx, dy in spoke_offsets:
+                points.append((center_x + dx, center_y + dy))
+                points.append(center)
+            pygame.draw.lines(surface, color, False, points, 2)
         
         # Render time remaining for time trial mode
         if self.has_time_limit():
@@ -380,77 +414,96 @@ class GameModeManager:
             # Border
             pygame.draw.rect(surface, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), 1)
             
-            # Text
-            font = pygame.font.Font(None, 20)
-            time_text = font.render(f"Time: {int(self.time_remaining)}s", True, (255, 255, 255))
-            surface.blit(time_text, (bar_x + 5, bar_y - 2))
+            # Text, re-rendered only when the displayed second changes
+            seconds = int(self.time_remaining)
+            if seconds != self.time_text_seconds:
+                self.time_text = get_font(20).render(f"Time: {seconds}s", True, (255, 255, 255)).convert_alpha()
+                self.time_text_seconds = seconds
+            surface.blit(self.time_text, (bar_x + 5, bar_y - 2))
     
     def render_mode_info(self, surface, x, y):
         """Render current mode and difficulty info"""
-        mode_name = self.game_mode_settings[self.game_mode]['name']
-        difficulty_name = ["Easy", "Medium", "Hard", "Extreme"][self.difficulty]
+        # Only re-render when the mode or difficulty has changed
+        key = (self.game_mode, self.difficulty)
+        if self.mode_info_key != key:
+            mode_name = self.game_mode_settings[self.game_mode]['name']
+            difficulty_name = ["Easy", "Medium", "Hard", "Extreme"][self.difficulty]
+            self.mode_info_text = get_font(24).render(f"Mode: {mode_name} | Difficulty: {difficulty_name}", True, (200, 200, 200)).convert_alpha()
+            self.mode_info_key = key
         
-        font = pygame.font.Font(None, 24)
-        text = font.render(f"Mode: {mode_name} | Difficulty: {difficulty_name}", True, (200, 200, 200))
-        surface.blit(text, (x, y))
+        surface.blit(self.mode_info_text, (x, y))
+    
+    def build_selection_texts(self):
+        """Pre-render every string on the mode selection screen, in both normal and highlighted colors"""
+        heading_font = get_font(36)
+        desc_font = get_font(20)
+        
+        self.selection_texts = {
+            'title': get_font(48).render("Game Mode & Difficulty", True, (255, 255, 255)).convert_alpha(),
+            'mode_title': heading_font.render("Select Game Mode:", True, (255, 255, 255)).convert_alpha(),
+            'diff_title': heading_font.render("Select Difficulty:", True, (255, 255, 255)).convert_alpha(),
+            'instructions': get_font(24).render("Use arrow keys to navigate, Enter to select, Space to start game", True, (200, 200, 200)).convert_alpha(),
+            # Mode -> (normal name, selected name, description)
+            'modes': {
+                mode: (
+                    heading_font.render(settings['name'], True, (200, 200, 200)).convert_alpha(),
+                    heading_font.render(settings['name'], True, (255, 255, 0)).convert_alpha(),
+                    desc_font.render(settings['description'], True, (150, 150, 150)).convert_alpha()
+                )
+                for mode, settings in self.game_mode_settings.items()
+            },
+            # Difficulty -> (normal description, selected description)
+            'difficulties': {
+                diff: (
+                    heading_font.render(settings['description'], True, (200, 200, 200)).convert_alpha(),
+                    heading_font.render(settings['description'], True, (255, 255, 0)).convert_alpha()
+                )
+                for diff, settings in self.difficulty_settings.items()
+            }
+        }
     
     def render_mode_selection(self, surface, selected_mode, selected_difficulty):
         """Render mode and difficulty selection screen"""
+        if self.selection_texts is None:
+            self.build_selection_texts()
+        texts = self.selection_texts
+        
         # Title
-        title_font = pygame.font.Font(None, 48)
-        title_text = title_font.render("Game Mode & Difficulty", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_text, title_rect)
+        title_rect = texts['title'].get_rect(center=(SCREEN_WIDTH // 2, 80))
+        surface.blit(texts['title'], title_rect)
         
         # Mode selection
-        mode_font = pygame.font.Font(None, 36)
-        mode_title = mode_font.render("Select Game Mode:", True, (255, 255, 255))
-        surface.blit(mode_title, (SCREEN_WIDTH // 4 - 100, 150))
+        surface.blit(texts['mode_title'], (SCREEN_WIDTH // 4 - 100, 150))
         
         for i, mode in enumerate(self.game_mode_settings.keys()):
-            mode_name = self.game_mode_settings[mode]['name']
-            mode_desc = self.game_mode_settings[mode]['description']
+            name_text, selected_name_text, desc_text = texts['modes'][mode]
             
             # Highlight selected mode
             if mode == selected_mode:
-                color = (255, 255, 0)  # Yellow for selected
+                name_text = selected_name_text  # Yellow for selected
                 pygame.draw.rect(surface, (50, 50, 50), (SCREEN_WIDTH // 4 - 110, 190 + i * 60, 300, 50), border_radius=5)
-            else:
-                color = (200, 200, 200)
-            
-            # Mode name
-            mode_text = mode_font.render(mode_name, True, color)
-            surface.blit(mode_text, (SCREEN_WIDTH // 4 - 100, 200 + i * 60))
             
-            # Mode description
-            desc_font = pygame.font.Font(None, 20)
-            desc_text = desc_font.render(mode_desc, True, (150, 150, 150))
+            # Mode name and description
+            surface.blit(name_text, (SCREEN_WIDTH // 4 - 100, 200 + i * 60))
             surface.blit(desc_text, (SCREEN_WIDTH // 4 - 100, 225 + i * 60))
         
         # Difficulty selection
-        diff_title = mode_font.render("Select Difficulty:", True, (255, 255, 255))
-        surface.blit(diff_title, (3 * SCREEN_WIDTH // 4 - 100, 150))
+        surface.blit(texts['diff_title'], (3 * SCREEN_WIDTH // 4 - 100, 150))
         
         for i, diff in enumerate(self.difficulty_settings.keys()):
-            diff_desc = self.difficulty_settings[diff]['description']
+            diff_text, selected_diff_text = texts['difficulties'][diff]
             
             # Highlight selected difficulty
             if diff == selected_difficulty:
-                color = (255, 255, 0)  # Yellow for selected
+                diff_text = selected_diff_text  # Yellow for selected
                 pygame.draw.rect(surface, (50, 50, 50), (3 * SCREEN_WIDTH // 4 - 110, 190 + i * 60, 300, 50), border_radius=5)
-            else:
-                color = (200, 200, 200)
             
             # Difficulty name and description
-            diff_text = mode_font.render(diff_desc, True, color)
             surface.blit(diff_text, (3 * SCREEN_WIDTH // 4 - 100, 200 + i * 60))
         
         # Instructions
-        inst_font = pygame.font.Font(None, 24)
-        inst_text = inst_font.render("Use arrow keys to navigate, Enter to select, Space to start game", True, (200, 200, 200))
-        inst_rect = inst_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-        surface.blit(inst_text, inst_rect)
-
+        inst_rect = texts['instructions'].get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
+        surface.blit(texts['instructions'], inst_rect)
 
 # Test function
 def test_game_modes():
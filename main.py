@@ -8,7 +8,9 @@ import pygame
 import sys
 import random
 import math
-import time
+import collections
+import functools
+import numpy as np
 from pygame import gfxdraw
 
 # Initialize pygame
@@ -21,6 +23,14 @@ GRID_SIZE = 20
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
 FPS = 60
+ALL_CELLS = frozenset((x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT))
+
+# Snake length above which segment pixel positions are computed with NumPy
+VECTORIZE_LENGTH = 16
+
+# Sine sampled over one full turn, for the food pulse
+SIN_STEPS = 256
+SIN_TABLE = [math.sin(2 * math.pi * i / SIN_STEPS) for i in range(SIN_STEPS)]
 
 # Colors
 BLACK = (0, 0, 0)
@@ -38,13 +48,39 @@ PLAYING = 1
 PAUSED = 2
 GAME_OVER = 3
 
+# Arrow key directions and the reverse of each (the snake cannot turn back on itself)
+DIRECTION_KEYS = {
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+}
+OPPOSITE_DIRECTIONS = {(0, -1): (0, 1), (0, 1): (0, -1), (-1, 0): (1, 0), (1, 0): (-1, 0)}
+
+# Direction -> (left eye x, left eye y, right eye x, right eye y, pupil dx, pupil dy) within the head cell
+EYE_OFFSETS = {
+    (1, 0): (GRID_SIZE // 4, GRID_SIZE // 3, 3 * GRID_SIZE // 4, GRID_SIZE // 3, GRID_SIZE // 12, 0),
+    (-1, 0): (GRID_SIZE // 4, 2 * GRID_SIZE // 3, 3 * GRID_SIZE // 4, 2 * GRID_SIZE // 3, -GRID_SIZE // 12, 0),
+    (0, -1): (GRID_SIZE // 3, GRID_SIZE // 4, 2 * GRID_SIZE // 3, GRID_SIZE // 4, 0, -GRID_SIZE // 12),
+    (0, 1): (GRID_SIZE // 3, 2 * GRID_SIZE // 3, 2 * GRID_SIZE // 3, 2 * GRID_SIZE // 3, 0, GRID_SIZE // 12),
+}
+
+
 class Game:
     def __init__(self):
-        # Set up the display
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Set up the display, letting the driver pace frames to the vertical blank where it can
+        try:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            # Vsync is not available on every driver
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF)
         pygame.display.set_caption("Fancy Snake Game")
         self.clock = pygame.time.Clock()
         
+        # Only quit, key presses and window exposure are handled, so keep everything else out of the queue
+        pygame.event.set_allowed(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE])
+        
         # Game state
         self.state = MENU
         self.score = 0
@@ -53,29 +89,73 @@ class Game:
         # Initialize game objects
         self.snake = Snake(GRID_WIDTH // 2, GRID_HEIGHT // 2)
         self.food = Food()
-        self.food.spawn(self.snake.segments)
+        self.food.spawn(self.snake.segment_counts)
         
         # Font for text rendering
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self.title_font = pygame.font.Font(None, 72)
+        self.text_cache = {}  # (font, text, color) -> rendered text
         
-        # Background
+        # Background with subtle grid lines, drawn once
         self.bg_color = BLACK
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background.fill(self.bg_color)
+        for x in range(0, SCREEN_WIDTH, GRID_SIZE):
+            pygame.draw.line(self.background, (30, 30, 30), (x, 0), (x, SCREEN_HEIGHT))
+        for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
+            pygame.draw.line(self.background, (30, 30, 30), (0, y), (SCREEN_WIDTH, y))
+        
+        # Semi-transparent overlays for the pause and game over screens
+        self.pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.pause_overlay.fill((0, 0, 0, 128))
+        self.game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.game_over_overlay.fill((0, 0, 0, 192))
+        
+        # Set whenever the screen needs redrawing outside of play
+        self.dirty = True
+        
+        # Areas drawn over the background by the last frame of play, or None after a full redraw of another state
+        self.drawn_rects = None
+        
+        # Key press handlers and renderers for each game state
+        self.key_handlers = {
+            MENU: {
+                pygame.K_RETURN: self.resume_game,
+            },
+            PLAYING: {
+                **{key: functools.partial(self.steer, direction) for key, direction in DIRECTION_KEYS.items()},
+                pygame.K_ESCAPE: self.pause_game,
+            },
+            PAUSED: {
+                pygame.K_RETURN: self.resume_game,
+                pygame.K_ESCAPE: self.quit_to_menu,
+            },
+            GAME_OVER: {
+                pygame.K_RETURN: self.play_again,
+                pygame.K_ESCAPE: self.return_to_menu,
+            },
+        }
+        self.state_renderers = {
+            MENU: self.render_menu,
+            PLAYING: self.render_playing,
+            PAUSED: self.render_paused,
+            GAME_OVER: self.render_ended,
+        }
         
         # Game timing
-        self.last_update_time = time.time()
         self.move_timer = 0
         self.move_delay = 0.1  # seconds between snake movements
         
     def run(self):
         running = True
         while running:
-            # Calculate delta time
-            current_time = time.time()
-            dt = current_time - self.last_update_time
-            self.last_update_time = current_time
+            # Cap the frame rate and get the delta time in one call; waiting first means
+            # the queue is drained once per frame right before it is used. The cap stays on
+            # with vsync too, since set_mode only warns when the driver cannot provide it
+            dt = self.clock.tick(FPS) / 1000.0
             
-            # Handle events
+            # Handle events, draining the filtered queue in one call
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -84,46 +164,53 @@ class Game:
             # Update game state
             self.update(dt)
             
-            # Render
-            self.render()
-            
-            # Cap the frame rate
-            self.clock.tick(FPS)
+            # Render only when something on screen has changed; the board animates while playing
+            if self.dirty or self.state == PLAYING:
+                self.render()
+                self.dirty = False
         
         pygame.quit()
         sys.exit()
     
     def handle_events(self, event):
-        if event.type == pygame.KEYDOWN:
-            if self.state == MENU:
-                if event.key == pygame.K_RETURN:
-                    self.state = PLAYING
-            elif self.state == PLAYING:
-                if event.key == pygame.K_UP and self.snake.direction != (0, 1):
-                    self.snake.change_direction((0, -1))
-                elif event.key == pygame.K_DOWN and self.snake.direction != (0, -1):
-                    self.snake.change_direction((0, 1))
-                elif event.key == pygame.K_LEFT and self.snake.direction != (1, 0):
-                    self.snake.change_direction((-1, 0))
-                elif event.key == pygame.K_RIGHT and self.snake.direction != (-1, 0):
-                    self.snake.change_direction((1, 0))
-                elif event.key == pygame.K_ESCAPE:
-                    self.state = PAUSED
-            elif self.state == PAUSED:
-                if event.key == pygame.K_RETURN:
-                    self.state = PLAYING
-                elif event.key == pygame.K_ESCAPE:
-                    self.state = MENU
-            elif self.state == GAME_OVER:
-                if event.key == pygame.K_RETURN:
-                    self.reset_game()
-                    self.state = PLAYING
-                elif event.key == pygame.K_ESCAPE:
-                    self.reset_game()
-                    self.state = MENU
+        if event.type == pygame.VIDEOEXPOSE:
+            self.dirty = True
+        elif event.type == pygame.KEYDOWN:
+            # Any key can change the state or the screen it shows
+            self.dirty = True
+            
+            handler = self.key_handlers[self.state].get(event.key)
+            if handler:
+                handler()
+    
+    def steer(self, direction):
+        # The snake cannot turn back on itself. Turns are checked against the last move it made,
+        # so two quick presses between moves cannot reverse it into its own neck
+        if direction != OPPOSITE_DIRECTIONS[self.snake.moved_direction]:
+            self.snake.change_direction(direction)
+    
+    def pause_game(self):
+        self.state = PAUSED
+    
+    def resume_game(self):
+        self.state = PLAYING
+    
+    def quit_to_menu(self):
+        self.state = MENU
+    
+    def play_again(self):
+        self.reset_game()
+        self.state = PLAYING
+    
+    def return_to_menu(self):
+        self.reset_game()
+        self.state = MENU
     
     def update(self, dt):
         if self.state == PLAYING:
+            # Advance the food's pulse by the time passed, so it keeps its speed at any frame rate
+            self.food.update(dt)
+            
             # Update move timer
             self.move_timer += dt
             if self.move_timer >= self.move_delay:
@@ -137,69 +224,71 @@ class Game:
                     self.snake.grow()
                     self.score += 10
                     self.high_score = max(self.score, self.high_score)
-                    self.food.spawn(self.snake.segments)
+                    self.food.spawn(self.snake.segment_counts)
                 
                 # Check for collisions with walls or self
                 if self.snake.check_collision():
                     self.state = GAME_OVER
+                    self.dirty = True
     
     def render(self):
-        # Clear the screen
-        self.screen.fill(self.bg_color)
+        if self.state == PLAYING and self.drawn_rects:
+            # Only the board changes during play: put the background back under what the
+            # last frame drew, draw again, and push just those areas to the display
+            self.screen.blits([(self.background, rect, rect) for rect in self.drawn_rects], doreturn=False)
+            drawn_rects = self.render_playing()
+            pygame.display.update(self.drawn_rects + drawn_rects)
+        else:
+            # Clear the screen to the pre-drawn background and grid
+            self.screen.blit(self.background, (0, 0))
+            drawn_rects = self.state_renderers[self.state]()
+            
+            # Update the display
+            pygame.display.flip()
         
-        # Draw grid lines (subtle)
-        for x in range(0, SCREEN_WIDTH, GRID_SIZE):
-            pygame.draw.line(self.screen, (30, 30, 30), (x, 0), (x, SCREEN_HEIGHT))
-        for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
-            pygame.draw.line(self.screen, (30, 30, 30), (0, y), (SCREEN_WIDTH, y))
-        
-        if self.state == MENU:
-            self.render_menu()
-        elif self.state == PLAYING:
-            # Draw game elements
-            self.snake.render(self.screen)
-            self.food.render(self.screen)
-            self.render_hud()
-        elif self.state == PAUSED:
-            # Draw game elements (dimmed)
-            self.snake.render(self.screen, dimmed=True)
-            self.food.render(self.screen, dimmed=True)
-            self.render_hud(dimmed=True)
-            self.render_pause_menu()
-        elif self.state == GAME_OVER:
-            # Draw game elements (dimmed)
-            self.snake.render(self.screen, dimmed=True)
-            self.food.render(self.screen, dimmed=True)
-            self.render_game_over()
-        
-        # Update the display
-        pygame.display.flip()
+        self.drawn_rects = drawn_rects if self.state == PLAYING else None
+    
+    def render_playing(self):
+        # Draw game elements, returning the areas they cover
+        return self.snake.render(self.screen) + self.food.render(self.screen) + self.render_hud()
+    
+    def render_paused(self):
+        # Draw game elements (dimmed)
+        self.snake.render(self.screen, dimmed=True)
+        self.food.render(self.screen, dimmed=True)
+        self.render_hud(dimmed=True)
+        self.render_pause_menu()
+    
+    def render_ended(self):
+        # Draw game elements (dimmed)
+        self.snake.render(self.screen, dimmed=True)
+        self.food.render(self.screen, dimmed=True)
+        self.render_game_over()
     
     def render_menu(self):
         # Title
-        title_font = pygame.font.Font(None, 72)
-        title_text = title_font.render("FANCY SNAKE", True, GOLD)
+        title_text = self.render_text(self.title_font, "FANCY SNAKE", GOLD)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
         self.screen.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_text = self.font.render("A Very Fancy Snake Game", True, TEAL)
+        subtitle_text = self.render_text(self.font, "A Very Fancy Snake Game", TEAL)
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4 + 50))
         self.screen.blit(subtitle_text, subtitle_rect)
         
         # Menu options
-        start_text = self.font.render("Press ENTER to Start", True, WHITE)
+        start_text = self.render_text(self.font, "Press ENTER to Start", WHITE)
         start_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         self.screen.blit(start_text, start_rect)
         
         # High score
         if self.high_score > 0:
-            high_score_text = self.font.render(f"High Score: {self.high_score}", True, GOLD)
+            high_score_text = self.render_text(self.font, f"High Score: {self.high_score}", GOLD)
             high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
             self.screen.blit(high_score_text, high_score_rect)
         
         # Controls
-        controls_text = self.small_font.render("Controls: Arrow Keys to move, ESC to pause", True, WHITE)
+        controls_text = self.render_text(self.small_font, "Controls: Arrow Keys to move, ESC to pause", WHITE)
         controls_rect = controls_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
         self.screen.blit(controls_text, controls_rect)
     
@@ -207,76 +296,94 @@ class Game:
         color = (150, 150, 150) if dimmed else WHITE
         
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, color)
-        self.screen.blit(score_text, (10, 10))
+        score_text = self.render_text(self.font, f"Score: {self.score}", color)
+        score_rect = self.screen.blit(score_text, (10, 10))
         
         # High score
-        high_score_text = self.font.render(f"High Score: {self.high_score}", True, color)
+        high_score_text = self.render_text(self.font, f"High Score: {self.high_score}", color)
         high_score_rect = high_score_text.get_rect(topright=(SCREEN_WIDTH - 10, 10))
-        self.screen.blit(high_score_text, high_score_rect)
+        return [score_rect, self.screen.blit(high_score_text, high_score_rect)]
     
     def render_pause_menu(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.pause_overlay, (0, 0))
         
         # Pause title
-        pause_text = self.font.render("GAME PAUSED", True, WHITE)
+        pause_text = self.render_text(self.font, "GAME PAUSED", WHITE)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         self.screen.blit(pause_text, pause_rect)
         
         # Menu options
-        resume_text = self.font.render("Press ENTER to Resume", True, WHITE)
+        resume_text = self.render_text(self.font, "Press ENTER to Resume", WHITE)
         resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(resume_text, resume_rect)
         
-        quit_text = self.font.render("Press ESC to Quit to Menu", True, WHITE)
+        quit_text = self.render_text(self.font, "Press ESC to Quit to Menu", WHITE)
         quit_rect = quit_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         self.screen.blit(quit_text, quit_rect)
     
     def render_game_over(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 192))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.game_over_overlay, (0, 0))
         
         # Game over title
-        game_over_text = self.font.render("GAME OVER", True, RED)
+        game_over_text = self.render_text(self.font, "GAME OVER", RED)
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         self.screen.blit(game_over_text, game_over_rect)
         
         # Score
-        score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Final Score: {self.score}", WHITE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(score_text, score_rect)
         
         # Menu options
-        restart_text = self.font.render("Press ENTER to Play Again", True, WHITE)
+        restart_text = self.render_text(self.font, "Press ENTER to Play Again", WHITE)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         self.screen.blit(restart_text, restart_rect)
         
-        menu_text = self.font.render("Press ESC to Return to Menu", True, WHITE)
+        menu_text = self.render_text(self.font, "Press ESC to Return to Menu", WHITE)
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
         self.screen.blit(menu_text, menu_rect)
     
+    def render_text(self, font, text, color):
+        """Render text once per (font, text, color) and reuse the surface afterwards"""
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= 512:
+                self.text_cache.clear()
+            surface = font.render(text, True, color).convert_alpha()
+            self.text_cache[key] = surface
+        return surface
+    
     def reset_game(self):
-        self.snake = Snake(GRID_WIDTH // 2, GRID_HEIGHT // 2)
-        self.food.spawn(self.snake.segments)
+        self.snake.reset(GRID_WIDTH // 2, GRID_HEIGHT // 2)
+        self.food.spawn(self.snake.segment_counts)
         self.score = 0
         self.move_timer = 0
 
 
 class Snake:
     def __init__(self, x, y):
-        self.segments = [(x, y), (x-1, y), (x-2, y)]  # Head is first element
-        self.direction = (1, 0)  # Moving right initially
-        self.growth_pending = 0
+        self.segments = collections.deque()  # Head is first element
+        self.segment_counts = collections.Counter()  # Cell -> segments on it
         self.colors = [
             (0, 255, 0),      # Head color
             (0, 220, 0),      # Body color 1
             (0, 200, 0),      # Body color 2
         ]
+        self.build_tiles()
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Put a fresh three-segment snake at (x, y), keeping the containers and pre-drawn tiles"""
+        self.segments.clear()
+        self.segments.extend([(x, y), (x-1, y), (x-2, y)])
+        self.segment_counts.clear()
+        self.segment_counts.update(self.segments)
+        self.direction = (1, 0)  # Moving right initially
+        self.moved_direction = self.direction  # Direction of the last move made
+        self.growth_pending = 0
     
     @property
     def head_position(self):
@@ -287,22 +394,30 @@ class Snake:
         head_x, head_y = self.head_position
         dx, dy = self.direction
         new_head = ((head_x + dx) % GRID_WIDTH, (head_y + dy) % GRID_HEIGHT)
+        self.moved_direction = self.direction
         
         # Add new head
-        self.segments.insert(0, new_head)
+        self.segments.appendleft(new_head)
+        self.segment_counts[new_head] += 1
         
         # Remove tail if no growth is pending
         if self.growth_pending > 0:
             self.growth_pending -= 1
         else:
-            self.segments.pop()
+            self.remove_cell(self.segments.pop())
+    
+    def remove_cell(self, cell):
+        """Drop one segment from the cell counts, forgetting cells that become empty"""
+        self.segment_counts[cell] -= 1
+        if not self.segment_counts[cell]:
+            del self.segment_counts[cell]
     
     def grow(self):
         self.growth_pending += 1
     
     def check_collision(self):
         # Check for collision with self
-        if self.head_position in self.segments[1:]:
+        if self.segment_counts[self.head_position] > 1:
             return True
         return False
     
@@ -310,35 +425,47 @@ class Snake:
         self.direction = new_direction
     
     def render(self, surface, dimmed=False):
-        alpha = 128 if dimmed else 255
-        
-        # Draw each segment
-        for i, (x, y) in enumerate(self.segments):
-            # Calculate color based on segment position
-            if i == 0:  # Head
-                color = self.colors[0]
-            else:  # Body
-                color_index = (i % 2) + 1
-                color = self.colors[color_index]
+        # Blit every segment from its pre-drawn tile in one call, returning the areas covered;
+        # the head tile already has its eyes
+        tiles = self.tiles[dimmed]  # The two alternating body tiles
+        blit_sequence = [(tiles[i % 2], pixel) for i, pixel in enumerate(self.segment_pixels())]
+        blit_sequence[0] = (self.head_tiles[dimmed][self.direction], blit_sequence[0][1])
+        return surface.blits(blit_sequence)
+    
+    def segment_pixels(self):
+        """Get the top-left pixel of every segment, head first"""
+        # Long snakes are scaled in one array multiply; for short ones the conversion costs more than it saves
+        if len(self.segments) > VECTORIZE_LENGTH:
+            return (np.array(self.segments) * GRID_SIZE).tolist()
+        return [(x * GRID_SIZE, y * GRID_SIZE) for x, y in self.segments]
+    
+    def build_tiles(self):
+        """Pre-draw the rounded segment tiles, normal and dimmed, with one head tile per direction"""
+        self.tiles = {}
+        self.head_tiles = {}
+        for dimmed in (False, True):
+            head_color, *body_colors = self.colors
             
             # Apply dimming if needed
             if dimmed:
-                color = (color[0] // 2, color[1] // 2, color[2] // 2)
-            
-            # Calculate position and size
-            rect = pygame.Rect(
-                x * GRID_SIZE, 
-                y * GRID_SIZE, 
-                GRID_SIZE, 
-                GRID_SIZE
-            )
+                head_color = (head_color[0] // 2, head_color[1] // 2, head_color[2] // 2)
+                body_colors = [(color[0] // 2, color[1] // 2, color[2] // 2) for color in body_colors]
             
-            # Draw rounded rectangle for each segment
-            self.draw_rounded_rect(surface, rect, color, 5)
+            # Body colors alternate, starting from the first one on even segments
+            self.tiles[dimmed] = [self.build_tile(body_colors[0]), self.build_tile(body_colors[1])]
             
-            # Draw eyes on the head
-            if i == 0:
-                self.draw_eyes(surface, x, y, dimmed)
+            # Draw eyes on the head, facing each way it can move
+            self.head_tiles[dimmed] = {}
+            for direction in EYE_OFFSETS:
+                tile = self.build_tile(head_color)
+                self.draw_eyes(tile, 0, 0, dimmed, direction)
+                self.head_tiles[dimmed][direction] = tile
+    
+    def build_tile(self, color):
+        """Pre-draw one rounded segment tile"""
+        tile = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA).convert_alpha()
+        self.draw_rounded_rect(tile, tile.get_rect(), color, 5)
+        return tile
     
     def draw_rounded_rect(self, surface, rect, color, radius):
         """Draw a rounded rectangle"""
@@ -352,75 +479,77 @@ class Snake:
         # Draw the main rectangle
         pygame.draw.rect(surface, color, rect, border_radius=radius)
     
-    def draw_eyes(self, surface, x, y, dimmed=False):
-        """Draw eyes on the snake's head"""
+    def draw_eyes(self, surface, x, y, dimmed=False, direction=None):
+        """Draw eyes on the snake's head, facing its current direction unless told otherwise"""
         eye_color = (50, 50, 50) if dimmed else (0, 0, 0)
         pupil_color = (200, 200, 200) if dimmed else WHITE
         
-        # Eye positions depend on direction
-        dx, dy = self.direction
-        
-        # Base positions
-        left_eye_x = x * GRID_SIZE + GRID_SIZE // 4
-        right_eye_x = x * GRID_SIZE + 3 * GRID_SIZE // 4
-        left_eye_y = y * GRID_SIZE + GRID_SIZE // 3
-        right_eye_y = y * GRID_SIZE + GRID_SIZE // 3
-        
-        # Adjust based on direction
-        if dx == 1:  # Right
-            pass  # Default position is for right direction
-        elif dx == -1:  # Left
-            left_eye_y = y * GRID_SIZE + 2 * GRID_SIZE // 3
-            right_eye_y = y * GRID_SIZE + 2 * GRID_SIZE // 3
-        elif dy == -1:  # Up
-            left_eye_x = x * GRID_SIZE + GRID_SIZE // 3
-            right_eye_x = x * GRID_SIZE + 2 * GRID_SIZE // 3
-            left_eye_y = y * GRID_SIZE + GRID_SIZE // 4
-            right_eye_y = y * GRID_SIZE + GRID_SIZE // 4
-        elif dy == 1:  # Down
-            left_eye_x = x * GRID_SIZE + GRID_SIZE // 3
-            right_eye_x = x * GRID_SIZE + 2 * GRID_SIZE // 3
-            left_eye_y = y * GRID_SIZE + 2 * GRID_SIZE // 3
-            right_eye_y = y * GRID_SIZE + 2 * GRID_SIZE // 3
+        # Eye and pupil offsets within the head cell depend on direction
+        left_x, left_y, right_x, right_y, pupil_dx, pupil_dy = EYE_OFFSETS[direction or self.direction]
+        left_eye = (x * GRID_SIZE + left_x, y * GRID_SIZE + left_y)
+        right_eye = (x * GRID_SIZE + right_x, y * GRID_SIZE + right_y)
         
         # Draw eyes
-        pygame.draw.circle(surface, eye_color, (left_eye_x, left_eye_y), GRID_SIZE // 6)
-        pygame.draw.circle(surface, eye_color, (right_eye_x, right_eye_y), GRID_SIZE // 6)
+        pygame.draw.circle(surface, eye_color, left_eye, GRID_SIZE // 6)
+        pygame.draw.circle(surface, eye_color, right_eye, GRID_SIZE // 6)
         
         # Draw pupils
-        pupil_offset_x = dx * GRID_SIZE // 12
-        pupil_offset_y = dy * GRID_SIZE // 12
-        pygame.draw.circle(surface, pupil_color, 
-                          (left_eye_x + pupil_offset_x, left_eye_y + pupil_offset_y), 
-                          GRID_SIZE // 10)
-        pygame.draw.circle(surface, pupil_color, 
-                          (right_eye_x + pupil_offset_x, right_eye_y + pupil_offset_y), 
-                          GRID_SIZE // 10)
-
+        pygame.draw.circle(surface, pupil_color, (left_eye[0] + pupil_dx, left_eye[1] + pupil_dy), GRID_SIZE // 10)
+        pygame.draw.circle(surface, pupil_color, (right_eye[0] + pupil_dx, right_eye[1] + pupil_dy), GRID_SIZE // 10)
 
 class Food:
     def __init__(self):
         self.position = (0, 0)
         self.color = RED
-        self.pulse_speed = 2  # Speed of pulsing animation
-        self.pulse_time = 0   # Time counter for pulsing
+        self.pulse_speed = 12  # Speed of pulsing animation, in radians per second
+        self.pulse_time = 0    # Seconds of pulsing so far
         self.glow_radius = GRID_SIZE // 2  # Base radius for glow effect
+        self.glow_growth = int(GRID_SIZE * 0.3)  # How far the glow reaches past its base radius at full pulse
+        self.build_glow_tiles()
+    
+    def spawn(self, snake_cells):
+        # Pick straight from the cells not occupied by the snake
+        free_cells = ALL_CELLS.difference(snake_cells)
+        if free_cells:
+            self.position = random.choice(tuple(free_cells))
+    
+    def update(self, dt):
+        # Advance the pulsing animation
+        self.pulse_time += dt
+    
+    def build_glow_tiles(self):
+        """Pre-draw the glow at every size the pulse can reach, in the current food color"""
+        self.glow_color = self.color
+        self.glow_tiles = [
+            self.build_glow_tile(self.color, self.glow_radius + growth)
+            for growth in range(self.glow_growth + 1)
+        ]
     
-    def spawn(self, snake_segments):
-        # Find a position not occupied by the snake
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            if (x, y) not in snake_segments:
-                self.position = (x, y)
-                break
+    def build_glow_tile(self, color, glow_size):
+        """Pre-draw the glow of fading rings for a color and outer radius"""
+        diameter = glow_size * 2 + 1
+        
+        # The rings stack like layers of translucent paint, so each pixel's
+        # opacity is 1 minus the product of what every ring over it lets through
+        ring = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        transmittance = np.ones((diameter, diameter))
+        for i in range(glow_size, 0, -2):
+            alpha = 100 - (i * 100 // glow_size)
+            ring.fill((0, 0, 0, 0))
+            pygame.gfxdraw.filled_circle(ring, glow_size, glow_size, i, WHITE)
+            transmittance[pygame.surfarray.pixels_alpha(ring) > 0] *= 1 - alpha / 255
+        
+        tile = pygame.Surface((diameter, diameter), pygame.SRCALPHA).convert_alpha()
+        tile.fill(color)
+        pygame.surfarray.pixels_alpha(tile)[:] = np.rint((1 - transmittance) * 255)
+        return tile
     
     def render(self, surface, dimmed=False):
         x, y = self.position
         
         # Calculate pulsing effect
-        self.pulse_time += 0.1
-        pulse = abs(math.sin(self.pulse_time * self.pulse_speed))
+        step = int(self.pulse_time * self.pulse_speed * SIN_STEPS / (2 * math.pi)) % SIN_STEPS
+        pulse = abs(SIN_TABLE[step])
         size = int(GRID_SIZE * 0.6 + pulse * GRID_SIZE * 0.2)
         
         # Apply dimming if needed
@@ -430,21 +559,23 @@ class Food:
         center_x = x * GRID_SIZE + GRID_SIZE // 2
         center_y = y * GRID_SIZE + GRID_SIZE // 2
         
-        # Draw glow (if not dimmed)
+        # Draw glow (if not dimmed), keeping the areas covered
+        drawn_rects = []
         if not dimmed:
-            glow_size = self.glow_radius + int(pulse * GRID_SIZE * 0.3)
-            for i in range(glow_size, 0, -2):
-                alpha = 100 - (i * 100 // glow_size)
-                glow_color = (color[0], color[1], color[2], alpha)
-                pygame.gfxdraw.filled_circle(surface, center_x, center_y, i, glow_color)
+            if self.glow_color != color:
+                self.build_glow_tiles()
+            growth = int(pulse * self.glow_growth)
+            glow_size = self.glow_radius + growth
+            drawn_rects.append(surface.blit(self.glow_tiles[growth], (center_x - glow_size, center_y - glow_size)))
         
         # Draw main food item
-        pygame.draw.circle(surface, color, (center_x, center_y), size // 2)
+        drawn_rects.append(pygame.draw.circle(surface, color, (center_x, center_y), size // 2))
         
         # Draw highlight
         highlight_size = size // 4
         highlight_pos = (center_x - size // 6, center_y - size // 6)
         pygame.draw.circle(surface, (255, 255, 255, 180), highlight_pos, highlight_size)
+        return drawn_rects
 
 
 # Main function
@@ -7,6 +7,8 @@ This file implements power-ups and special abilities for our fancy Snake game.
 import pygame
 import random
 import math
+import itertools
+import numpy as np
 from pygame import gfxdraw
 
 # Constants
@@ -15,10 +17,37 @@ SCREEN_HEIGHT = 600
 GRID_SIZE = 20
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
+ALL_CELLS = frozenset((x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT))
+
+# Whole-pixel cell center offset, and a power-up's resting size and how much the pulse adds to it
+HALF_GRID = GRID_SIZE // 2
+BASE_SIZE = int(GRID_SIZE * 0.7)
+PULSE_GROWTH = int(GRID_SIZE * 0.2)
+
+# Ambient particles advance in fixed steps, independent of the frame rate;
+# a long hitch is caught up with at most a few steps
+PARTICLE_STEP = 1 / 30
+MAX_PARTICLE_STEPS = 4
+
+# Corners of the ghost octagon on the unit circle, before rotation
+GHOST_VERTICES = [(math.cos(math.pi * 2 * i / 8), math.sin(math.pi * 2 * i / 8)) for i in range(8)]
+
+# Sine sampled over one full turn, for the pulse
+SIN_STEPS = 1024
+SIN_TABLE = [math.sin(2 * math.pi * i / SIN_STEPS) for i in range(SIN_STEPS)]
 
 class PowerUp:
     """Power-up class for special abilities and effects"""
     
+    # Power-ups are created all game long, so they keep their attributes in fixed slots
+    __slots__ = (
+        'type', 'properties', 'color', 'dimmed_color', 'glow_color', 'duration', 'effect_strength', 'render_pattern',
+        'position', 'active', 'collect_time', 'remaining_time', 'applied',
+        'pulse_time', 'rotation', 'particle_time',
+        'particle_positions', 'particle_velocities', 'particle_ages', 'particle_lifetimes',
+        'particle_sizes', 'particle_alphas',
+    )
+    
     # Power-up types and their properties
     TYPES = {
         'speed_boost': {
@@ -71,85 +100,101 @@ class PowerUp:
         }
     }
     
+    # Pattern renderers for the types that animate; the rest draw their cached icon
+    PATTERN_RENDERERS = {
+        'slow_motion': 'render_clock',
+        'ghost_mode': 'render_ghost',
+    }
+    
+    # Still part of each type's pattern, pre-drawn per (type, size) and shared by all power-ups
+    ICON_CACHE = {}
+    
+    # Glow circles, pre-drawn per (glow color, radius) and shared by all power-ups
+    GLOW_CACHE = {}
+    
     def __init__(self):
         # Choose a random power-up type based on spawn chances
-        self.type = self.choose_random_type()
-        self.properties = self.TYPES[self.type]
+        self.set_type(self.choose_random_type())
         
         self.position = (0, 0)
         self.active = False
         self.collect_time = None
         self.remaining_time = 0
+        self.applied = False  # Whether a one-time effect has been applied
         
         # Animation properties
         self.pulse_time = 0
         self.rotation = 0
-        self.particles = []
+        self.particle_time = 0  # Time not yet covered by a particle step
+        
+        # Ambient particles, one row or entry per particle
+        self.particle_positions = np.zeros((0, 2))
+        self.particle_velocities = np.zeros((0, 2))
+        self.particle_ages = np.zeros(0)
+        self.particle_lifetimes = np.zeros(0)
+        self.particle_sizes = np.zeros(0)
+        self.particle_alphas = np.zeros(0, dtype=int)
+    
+    def set_type(self, power_up_type):
+        """Become a power-up of the given type, copying its properties onto attributes for quick access"""
+        self.type = power_up_type
+        self.properties = self.TYPES[power_up_type]
+        self.color = self.properties['color']
+        self.dimmed_color = tuple(c // 2 for c in self.color)
+        self.glow_color = self.properties['glow_color']
+        self.duration = self.properties['duration']
+        self.effect_strength = self.properties['effect_strength']
+        
+        # Bind the pattern renderer once so render needs no check on the type
+        self.render_pattern = getattr(self, self.PATTERN_RENDERERS.get(power_up_type, 'render_icon'))
     
     def choose_random_type(self):
         """Choose a random power-up type based on spawn chances"""
-        types = list(self.TYPES.keys())
-        chances = [self.TYPES[t]['spawn_chance'] for t in types]
-        
-        # Normalize chances
-        total = sum(chances)
-        chances = [c / total for c in chances]
-        
-        # Cumulative distribution
-        cumulative = [sum(chances[:i+1]) for i in range(len(chances))]
-        
-        # Random selection
-        r = random.random()
-        for i, threshold in enumerate(cumulative):
-            if r <= threshold:
-                return types[i]
-        
-        # Fallback
-        return types[0]
+        return random.choices(POWER_UP_TYPES, cum_weights=POWER_UP_CUMULATIVE_CHANCES)[0]
     
     def spawn(self, snake_segments, food_position):
         """Spawn power-up at a random position not occupied by the snake or food"""
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            if (x, y) not in snake_segments and (x, y) != food_position:
-                self.position = (x, y)
-                self.active = False
-                self.collect_time = None
-                self.remaining_time = self.properties['duration']
-                break
-    
-    def collect(self):
-        """Collect the power-up"""
-        self.active = True
-        self.collect_time = pygame.time.get_ticks() / 1000  # Current time in seconds
+        # Pick straight from the cells not occupied by the snake or food
+        free_cells = ALL_CELLS.difference(snake_segments, (food_position,))
+        if free_cells:
+            self.position = random.choice(tuple(free_cells))
+        self.active = False
+        self.collect_time = None
+        self.remaining_time = self.duration
     
-    def is_expired(self, current_time):
-        """Check if the power-up effect has expired"""
-        if not self.active or self.collect_time is None:
-            return False
-        
-        elapsed = current_time - self.collect_time
-        self.remaining_time = max(0, self.properties['duration'] - elapsed)
-        return elapsed >= self.properties['duration']
+    def collect(self, current_time):
+        """Collect the power-up at the given time in seconds"""
+        self.active = True
+        self.collect_time = current_time
     
     def update(self, dt):
         """Update power-up animation"""
         self.pulse_time += dt
         self.rotation += dt * 60  # Rotate 60 degrees per second
         
-        # Update particles
-        for particle in self.particles[:]:
-            particle['age'] += dt
-            if particle['age'] >= particle['lifetime']:
-                self.particles.remove(particle)
-            else:
-                # Update position
-                particle['x'] += particle['vx'] * dt
-                particle['y'] += particle['vy'] * dt
-                # Update alpha
-                progress = particle['age'] / particle['lifetime']
-                particle['alpha'] = int(255 * (1 - progress))
+        # Step the particles at a fixed rate, however long this frame took
+        self.particle_time = min(self.particle_time + dt, PARTICLE_STEP * MAX_PARTICLE_STEPS)
+        while self.particle_time >= PARTICLE_STEP:
+            self.step_particles(PARTICLE_STEP)
+            self.particle_time -= PARTICLE_STEP
+    
+    def step_particles(self, dt):
+        """Advance the ambient particles by one fixed step"""
+        # Update particles, dropping the ones that have lived out their lifetime
+        if len(self.particle_ages):
+            self.particle_ages += dt
+            alive = self.particle_ages < self.particle_lifetimes
+            if not alive.all():
+                self.particle_positions = self.particle_positions[alive]
+                self.particle_velocities = self.particle_velocities[alive]
+                self.particle_ages = self.particle_ages[alive]
+                self.particle_lifetimes = self.particle_lifetimes[alive]
+                self.particle_sizes = self.particle_sizes[alive]
+            
+            # Update position and alpha
+            self.particle_positions += self.particle_velocities * dt
+            progress = self.particle_ages / self.particle_lifetimes
+            self.particle_alphas = (255 * (1 - progress)).astype(int)
         
         # Add new particles occasionally
         if not self.active and random.random() < dt * 2:  # Average 2 particles per second
@@ -158,28 +203,26 @@ class PowerUp:
     def add_ambient_particle(self):
         """Add ambient particles around the power-up"""
         x, y = self.position
-        center_x = (x + 0.5) * GRID_SIZE
-        center_y = (y + 0.5) * GRID_SIZE
+        center_x = x * GRID_SIZE + HALF_GRID
+        center_y = y * GRID_SIZE + HALF_GRID
         
+        # The particle starts and moves along the same direction, so its trig is done once
         angle = random.uniform(0, math.pi * 2)
+        direction_x = math.cos(angle)
+        direction_y = math.sin(angle)
         distance = random.uniform(0, GRID_SIZE * 0.5)
-        start_x = center_x + math.cos(angle) * distance
-        start_y = center_y + math.sin(angle) * distance
+        start_x = center_x + direction_x * distance
+        start_y = center_y + direction_y * distance
         
         speed = random.uniform(5, 15)
         lifetime = random.uniform(0.5, 1.0)
         
-        self.particles.append({
-            'x': start_x,
-            'y': start_y,
-            'vx': math.cos(angle) * speed,
-            'vy': math.sin(angle) * speed,
-            'size': random.uniform(1, 3),
-            'color': self.properties['color'],
-            'alpha': 150,
-            'lifetime': lifetime,
-            'age': 0,
-        })
+        self.particle_positions = np.append(self.particle_positions, [(start_x, start_y)], axis=0)
+        self.particle_velocities = np.append(self.particle_velocities, [(direction_x * speed, direction_y * speed)], axis=0)
+        self.particle_ages = np.append(self.particle_ages, 0)
+        self.particle_lifetimes = np.append(self.particle_lifetimes, lifetime)
+        self.particle_sizes = np.append(self.particle_sizes, random.uniform(1, 3))
+        self.particle_alphas = np.append(self.particle_alphas, 150)
     
     def render(self, surface, dimmed=False):
         """Render power-up with fancy effects"""
@@ -187,40 +230,31 @@ class PowerUp:
             return  # Don't render if already collected
         
         x, y = self.position
-        center_x = (x + 0.5) * GRID_SIZE
-        center_y = (y + 0.5) * GRID_SIZE
+        center_x = x * GRID_SIZE + HALF_GRID
+        center_y = y * GRID_SIZE + HALF_GRID
         
         # Calculate pulsing effect
-        pulse = abs(math.sin(self.pulse_time * 3))
-        size = int(GRID_SIZE * 0.7 + pulse * GRID_SIZE * 0.2)
+        step = int(self.pulse_time * 3 * SIN_STEPS / (2 * math.pi)) % SIN_STEPS
+        pulse = abs(SIN_TABLE[step])
+        size = BASE_SIZE + int(pulse * PULSE_GROWTH)
         
         # Apply dimming if needed
-        color = tuple(c // 2 for c in self.properties['color']) if dimmed else self.properties['color']
+        color = self.dimmed_color if dimmed else self.color
         
-        # Draw ambient particles
-        if not dimmed:
-            for particle in self.particles:
-                pygame.gfxdraw.filled_circle(
-                    surface,
-                    int(particle['x']),
-                    int(particle['y']),
-                    int(particle['size']),
-                    (*particle['color'], particle['alpha'])
-                )
-        
-        # Draw glow effect (if not dimmed)
+        # Draw ambient particles and glow effect (if not dimmed)
         if not dimmed:
+            # Particles move in straight lines, so carry them on through the time since the last step
+            particle_positions = self.particle_positions + self.particle_velocities * self.particle_time
+            for (particle_x, particle_y), particle_size, particle_alpha in zip(
+                particle_positions.astype(int).tolist(),
+                self.particle_sizes.astype(int).tolist(),
+                self.particle_alphas.tolist(),
+            ):
+                pygame.gfxdraw.filled_circle(surface, particle_x, particle_y, particle_size, (*color, particle_alpha))
+            
             glow_size = int(size * 1.5 + pulse * size * 0.5)
-            glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            pygame.gfxdraw.filled_circle(
-                glow_surface,
-                glow_size,
-                glow_size,
-                glow_size,
-                self.properties['glow_color']
-            )
             surface.blit(
-                glow_surface,
+                self.get_glow(glow_size),
                 (center_x - glow_size, center_y - glow_size)
             )
         
@@ -229,119 +263,162 @@ class PowerUp:
         
         # Draw power-up specific pattern
         if not dimmed:
-            if self.type == 'speed_boost':
-                # Draw lightning bolt
-                points = [
-                    (center_x - size//4, center_y - size//3),
-                    (center_x, center_y - size//8),
-                    (center_x - size//8, center_y),
-                    (center_x + size//4, center_y + size//3),
-                    (center_x, center_y + size//8),
-                    (center_x + size//8, center_y)
-                ]
-                pygame.draw.polygon(surface, (255, 255, 200), points)
-            
-            elif self.type == 'slow_motion':
-                # Draw clock face
-                pygame.draw.circle(surface, (200, 200, 255), (center_x, center_y), size // 3, 2)
-                # Draw clock hands
-                angle = math.radians(self.rotation)
-                hand_length = size // 4
-                pygame.draw.line(
-                    surface, 
-                    (200, 200, 255), 
-                    (center_x, center_y),
-                    (center_x + math.cos(angle) * hand_length, center_y + math.sin(angle) * hand_length),
-                    2
-                )
+            self.render_pattern(surface, center_x, center_y, size)
+    
+    def render_icon(self, surface, center_x, center_y, size):
+        """Draw a pattern that never moves, straight from the icon cache"""
+        icon = self.get_icon(size)
+        surface.blit(icon, icon.get_rect(center=(center_x, center_y)))
+    
+    def render_clock(self, surface, center_x, center_y, size):
+        """Draw the slow motion clock face, then its hand, which turns every frame"""
+        self.render_icon(surface, center_x, center_y, size)
+        
+        # Draw clock hands
+        angle = math.radians(self.rotation)
+        hand_length = size // 4
+        pygame.draw.line(
+            surface, 
+            (200, 200, 255), 
+            (center_x, center_y),
+            (center_x + math.cos(angle) * hand_length, center_y + math.sin(angle) * hand_length),
+            2
+        )
+    
+    def render_ghost(self, surface, center_x, center_y, size):
+        """Draw the ghost shape, which turns every frame"""
+        # The still octagon is rotated with one sine and cosine rather than two per vertex
+        angle = math.radians(self.rotation)
+        r = size // 3
+        turn_x = math.cos(angle) * r
+        turn_y = math.sin(angle) * r
+        ghost_points = [
+            (center_x + vertex_x * turn_x - vertex_y * turn_y, center_y + vertex_x * turn_y + vertex_y * turn_x)
+            for vertex_x, vertex_y in GHOST_VERTICES
+        ]
+        
+        pygame.draw.polygon(surface, (255, 255, 255, 150), ghost_points)
+    
+    def get_glow(self, glow_size):
+        """Get the cached glow for this type's glow color at a radius"""
+        key = (self.glow_color, glow_size)
+        glow_surface = self.GLOW_CACHE.get(key)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA).convert_alpha()
+            pygame.gfxdraw.filled_circle(
+                glow_surface,
+                glow_size,
+                glow_size,
+                glow_size,
+                self.glow_color
+            )
+            self.GLOW_CACHE[key] = glow_surface
+        return glow_surface
+    
+    def get_icon(self, size):
+        """Get the cached still part of this type's pattern at a size"""
+        key = (self.type, size)
+        icon = self.ICON_CACHE.get(key)
+        if icon is None:
+            icon = self.ICON_CACHE[key] = self.build_icon(size)
+        return icon
+    
+    def build_icon(self, size):
+        """Pre-draw the still part of this type's pattern, centered on a transparent surface"""
+        if self.type == 'double_points':
+            # Draw dollar sign; the glyph is used as the icon itself so its edges blend only once
+            font = pygame.font.Font(None, size // 2)
+            return font.render("$", True, (255, 255, 200)).convert_alpha()
+        
+        icon = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA).convert_alpha()
+        center_x = center_y = size
+        
+        if self.type == 'speed_boost':
+            # Draw lightning bolt
+            points = [
+                (center_x - size//4, center_y - size//3),
+                (center_x, center_y - size//8),
+                (center_x - size//8, center_y),
+                (center_x + size//4, center_y + size//3),
+                (center_x, center_y + size//8),
+                (center_x + size//8, center_y)
+            ]
+            pygame.draw.polygon(icon, (255, 255, 200), points)
+        
+        elif self.type == 'slow_motion':
+            # Draw clock face
+            pygame.draw.circle(icon, (200, 200, 255), (center_x, center_y), size // 3, 2)
+        
+        elif self.type == 'magnet':
+            # Draw magnet shape
+            magnet_width = size // 3
+            magnet_height = size // 2
             
-            elif self.type == 'ghost_mode':
-                # Draw ghost shape
-                ghost_points = []
-                for i in range(8):
-                    angle = math.pi * 2 * i / 8 + math.radians(self.rotation)
-                    r = size // 3
-                    x = center_x + math.cos(angle) * r
-                    y = center_y + math.sin(angle) * r
-                    ghost_points.append((x, y))
-                
-                pygame.draw.polygon(surface, (255, 255, 255, 150), ghost_points)
+            # North pole (red)
+            pygame.draw.rect(
+                icon,
+                (255, 100, 100),
+                (center_x - magnet_width//2, center_y - magnet_height//2, magnet_width, magnet_height//2)
+            )
             
-            elif self.type == 'double_points':
-                # Draw dollar sign
-                font = pygame.font.Font(None, size // 2)
-                text = font.render("$", True, (255, 255, 200))
-                text_rect = text.get_rect(center=(center_x, center_y))
-                surface.blit(text, text_rect)
+            # South pole (blue)
+            pygame.draw.rect(
+                icon,
+                (100, 100, 255),
+                (center_x - magnet_width//2, center_y, magnet_width, magnet_height//2)
+            )
+        
+        elif self.type == 'size_down':
+            # Draw shrink arrows
+            arrow_size = size // 3
             
-            elif self.type == 'magnet':
-                # Draw magnet shape
-                magnet_width = size // 3
-                magnet_height = size // 2
-                
-                # North pole (red)
-                pygame.draw.rect(
-                    surface,
-                    (255, 100, 100),
-                    (center_x - magnet_width//2, center_y - magnet_height//2, magnet_width, magnet_height//2)
-                )
-                
-                # South pole (blue)
-                pygame.draw.rect(
-                    surface,
-                    (100, 100, 255),
-                    (center_x - magnet_width//2, center_y, magnet_width, magnet_height//2)
-                )
+            # Left arrow
+            pygame.draw.line(
+                icon,
+                (200, 255, 200),
+                (center_x - arrow_size, center_y),
+                (center_x, center_y),
+                2
+            )
+            pygame.draw.line(
+                icon,
+                (200, 255, 200),
+                (center_x - arrow_size, center_y),
+                (center_x - arrow_size//2, center_y - arrow_size//2),
+                2
+            )
+            pygame.draw.line(
+                icon,
+                (200, 255, 200),
+                (center_x - arrow_size, center_y),
+                (center_x - arrow_size//2, center_y + arrow_size//2),
+                2
+            )
             
-            elif self.type == 'size_down':
-                # Draw shrink arrows
-                arrow_size = size // 3
-                
-                # Left arrow
-                pygame.draw.line(
-                    surface,
-                    (200, 255, 200),
-                    (center_x - arrow_size, center_y),
-                    (center_x, center_y),
-                    2
-                )
-                pygame.draw.line(
-                    surface,
-                    (200, 255, 200),
-                    (center_x - arrow_size, center_y),
-                    (center_x - arrow_size//2, center_y - arrow_size//2),
-                    2
-                )
-                pygame.draw.line(
-                    surface,
-                    (200, 255, 200),
-                    (center_x - arrow_size, center_y),
-                    (center_x - arrow_size//2, center_y + arrow_size//2),
-                    2
-                )
-                
-                # Right arrow
-                pygame.draw.line(
-                    surface,
-                    (200, 255, 200),
-                    (center_x + arrow_size, center_y),
-                    (center_x, center_y),
-                    2
-                )
-                pygame.draw.line(
-                    surface,
-                    (200, 255, 200),
-                    (center_x + arrow_size, center_y),
-                    (center_x + arrow_size//2, center_y - arrow_size//2),
-                    2
-                )
-                pygame.draw.line(
-                    surface,
-                    (200, 255, 200),
-                    (center_x + arrow_size, center_y),
-                    (center_x + arrow_size//2, center_y + arrow_size//2),
-                    2
-                )
+            # Right arrow
+            pygame.draw.line(
+                icon,
+                (200, 255, 200),
+                (center_x + arrow_size, center_y),
+                (center_x, center_y),
+                2
+            )
+            pygame.draw.line(
+                icon,
+                (200, 255, 200),
+                (center_x + arrow_size, center_y),
+                (center_x + arrow_size//2, center_y - arrow_size//2),
+                2
+            )
+            pygame.draw.line(
+                icon,
+                (200, 255, 200),
+                (center_x + arrow_size, center_y),
+                (center_x + arrow_size//2, center_y + arrow_size//2),
+                2
+            )
+        
+        return icon
     
     def render_status(self, surface, x, y, width=100, height=20):
         """Render power-up status bar when active"""
@@ -353,10 +430,10 @@ class PowerUp:
         pygame.draw.rect(surface, (50, 50, 50), bg_rect, border_radius=height//2)
         
         # Draw progress bar
-        progress = self.remaining_time / self.properties['duration']
+        progress = self.remaining_time / self.duration
         progress_width = int(width * progress)
         progress_rect = pygame.Rect(x, y, progress_width, height)
-        pygame.draw.rect(surface, self.properties['color'], progress_rect, border_radius=height//2)
+        pygame.draw.rect(surface, self.color, progress_rect, border_radius=height//2)
         
         # Draw border
         pygame.draw.rect(surface, (200, 200, 200), bg_rect, width=1, border_radius=height//2)
@@ -364,7 +441,7 @@ class PowerUp:
         # Draw icon
         icon_size = height - 4
         icon_rect = pygame.Rect(x + 2, y + 2, icon_size, icon_size)
-        pygame.draw.rect(surface, self.properties['color'], icon_rect, border_radius=icon_size//2)
+        pygame.draw.rect(surface, self.color, icon_rect, border_radius=icon_size//2)
         
         # Draw text
         font = pygame.font.Font(None, height - 4)
@@ -373,12 +450,20 @@ class PowerUp:
         surface.blit(text, text_rect)
 
 
+# Power-up types and their running total of spawn chances, for weighted picks
+POWER_UP_TYPES = tuple(PowerUp.TYPES)
+POWER_UP_CUMULATIVE_CHANCES = tuple(itertools.accumulate(PowerUp.TYPES[t]['spawn_chance'] for t in POWER_UP_TYPES))
+
+
 class PowerUpManager:
     """Manages multiple power-ups and their effects"""
     
     def __init__(self):
         self.power_ups = []  # Available power-ups on screen
         self.active_effects = []  # Currently active power-up effects
+        self.effects_by_type = {}  # Effect type -> earliest active effect of that type
+        self.collect_times = np.zeros(0)  # When each active effect was collected, in seconds
+        self.durations = np.zeros(0)  # How long each active effect lasts, in seconds
         
         self.spawn_timer = 0
         self.spawn_interval = 15.0  # Seconds between power-up spawns
@@ -392,23 +477,40 @@ class PowerUpManager:
         self.spawn_timer += dt
         if self.spawn_timer >= self.spawn_interval and len(self.power_ups) < self.max_power_ups:
             self.spawn_timer = 0
-            self.spawn_power_up(snake.segments, food.position)
+            self.spawn_power_up(snake.segment_counts, food.position)
         
         # Update existing power-ups
         for power_up in self.power_ups:
             power_up.update(dt)
         
-        # Check for expired effects
-        for effect in self.active_effects[:]:
-            if effect.is_expired(current_time):
-                self.active_effects.remove(effect)
-        
-        # Check for power-up collection
-        for power_up in self.power_ups[:]:
-            if snake.head_position == power_up.position:
-                power_up.collect()
+        # Check for expired effects, timing them all at once
+        if self.active_effects:
+            elapsed = current_time - self.collect_times
+            remaining_times = np.maximum(0, self.durations - elapsed).tolist()
+            for effect, remaining_time in zip(self.active_effects, remaining_times):
+                effect.remaining_time = remaining_time
+            
+            alive = elapsed < self.durations
+            if not alive.all():
+                self.active_effects = [effect for effect, keep in zip(self.active_effects, alive.tolist()) if keep]
+                self.collect_times = self.collect_times[alive]
+                self.durations = self.durations[alive]
+                self.index_effects()
+        
+        # Check for power-up collection, compacting the uncollected ones to the front in one pass
+        head_position = snake.head_position
+        kept = 0
+        for power_up in self.power_ups:
+            if power_up.position == head_position:
+                power_up.collect(current_time)
                 self.active_effects.append(power_up)
-                self.power_ups.remove(power_up)
+                self.effects_by_type.setdefault(power_up.type, power_up)
+                self.collect_times = np.append(self.collect_times, power_up.collect_time)
+                self.durations = np.append(self.durations, power_up.duration)
+            else:
+                self.power_ups[kept] = power_up
+                kept += 1
+        del self.power_ups[kept:]
     
     def spawn_power_up(self, snake_segments, food_position):
         """Spawn a new power-up"""
@@ -427,32 +529,31 @@ class PowerUpManager:
         for i, effect in enumerate(self.active_effects):
             effect.render_status(surface, 10, y_offset + i * 25)
     
+    def index_effects(self):
+        """Rebuild the type index so each type maps to its earliest active effect"""
+        self.effects_by_type = {}
+        for effect in reversed(self.active_effects):
+            self.effects_by_type[effect.type] = effect
+    
     def get_effect(self, effect_type):
         """Get the active effect of the specified type, or None if not active"""
-        for effect in self.active_effects:
-            if effect.type == effect_type:
-                return effect
-        return None
+        return self.effects_by_type.get(effect_type)
     
     def has_effect(self, effect_type):
         """Check if an effect of the specified type is active"""
-        return self.get_effect(effect_type) is not None
+        return effect_type in self.effects_by_type
     
     def get_effect_strength(self, effect_type, default=1.0):
         """Get the strength of an effect, or default if not active"""
         effect = self.get_effect(effect_type)
         if effect:
-            return effect.properties['effect_strength']
+            return effect.effect_strength
         return default
     
     def apply_effects(self, snake, game):
         """Apply all active effects to the game"""
-        # Apply speed effects
-        speed_multiplier = 1.0
-        if self.has_effect('speed_boost'):
-            speed_multiplier *= self.get_effect_strength('speed_boost')
-        if self.has_effect('slow_motion'):
-            speed_multiplier *= self.get_effect_strength('slow_motion')
+        # Apply speed effects; inactive ones leave the speed unchanged
+        speed_multiplier = self.get_effect_strength('speed_boost') * self.get_effect_strength('slow_motion')
         
         # Apply the speed multiplier
         game.move_delay = game.base_move_delay / speed_multiplier
@@ -462,19 +563,16 @@ class PowerUpManager:
         
         # Apply size down (one-time effect)
         size_down = self.get_effect('size_down')
-        if size_down and not hasattr(size_down, 'applied'):
+        if size_down and not size_down.applied:
             # Remove half of the snake's segments (but keep at least 3)
             segments_to_remove = max(0, len(snake.segments) // 2 - 3)
             if segments_to_remove > 0:
-                snake.segments = snake.segments[:-segments_to_remove]
+                snake.shrink(segments_to_remove)
             size_down.applied = True
     
     def get_score_multiplier(self):
         """Get the current score multiplier from active effects"""
-        multiplier = 1.0
-        if self.has_effect('double_points'):
-            multiplier *= self.get_effect_strength('double_points')
-        return multiplier
+        return self.get_effect_strength('double_points')
     
     def apply_magnet_effect(self, food, snake):
         """Apply magnet effect to attract food"""
@@ -485,30 +583,22 @@ class PowerUpManager:
         head_x, head_y = snake.head_position
         food_x, food_y = food.position
         
-        # Calculate distance
+        # Calculate squared distance; comparing it to squared bounds needs no square root
         dx = food_x - head_x
         dy = food_y - head_y
-        distance = math.sqrt(dx*dx + dy*dy)
+        distance_squared = dx*dx + dy*dy
         
         # If food is within range and not too close
-        if 2 < distance < 8:
-            # Move food slightly closer to snake
+        if 2 * 2 < distance_squared < 8 * 8:
+            # Move food one cell closer to snake along its longer axis
             if abs(dx) > abs(dy):
-                # Move horizontally
-                if dx > 0:
-                    food_x -= 1
-                elif dx < 0:
-                    food_x += 1
+                food_x -= (dx > 0) - (dx < 0)
             else:
-                # Move vertically
-                if dy > 0:
-                    food_y -= 1
-                elif dy < 0:
-                    food_y += 1
+                food_y -= (dy > 0) - (dy < 0)
             
             # Update food position if the new position is valid
             new_pos = (food_x, food_y)
-            if new_pos not in snake.segments:
+            if new_pos not in snake.segment_counts:
                 food.position = new_pos
 
 
@@ -8,6 +8,18 @@ import pygame
 import os
 import random
 import sys
+import concurrent.futures
+import threading
+import wave as wave_file
+import numpy as np
+
+# Sample rate of the synthesized sounds
+SAMPLE_RATE = 44100
+LONGEST_SOUND = SAMPLE_RATE * 5  # Samples in the longest sound, the 5 second music tracks
+TWO_PI = 2 * np.pi
+
+# The sound files ship next to this module, so they are found from any working directory
+SOUND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sounds')
 
 class SoundManager:
     def __init__(self):
@@ -16,26 +28,31 @@ class SoundManager:
         self.sound_volume = 0.7
         self.music_volume = 0.5
         self.audio_enabled = True
+        self.current_music = None  # Name of the track loaded into the music stream
+        self.times = None  # Sample times shared by the sounds being synthesized
+        self.pending_music = None  # Track asked for before the sounds were ready
+        self.ready = threading.Event()  # Set once the sound files are created and loaded
+        self.music_lock = threading.RLock()
         
         # Create directories for sounds if they don't exist
-        os.makedirs('sounds', exist_ok=True)
+        os.makedirs(SOUND_DIR, exist_ok=True)
         
         # Sound effect file paths
         self.sound_files = {
-            'eat': 'sounds/eat.wav',
-            'game_over': 'sounds/game_over.wav',
-            'menu_select': 'sounds/menu_select.wav',
-            'menu_navigate': 'sounds/menu_navigate.wav',
-            'power_up': 'sounds/power_up.wav',
-            'level_up': 'sounds/level_up.wav',
-            'move': 'sounds/move.wav'
+            'eat': os.path.join(SOUND_DIR, 'eat.wav'),
+            'game_over': os.path.join(SOUND_DIR, 'game_over.wav'),
+            'menu_select': os.path.join(SOUND_DIR, 'menu_select.wav'),
+            'menu_navigate': os.path.join(SOUND_DIR, 'menu_navigate.wav'),
+            'power_up': os.path.join(SOUND_DIR, 'power_up.wav'),
+            'level_up': os.path.join(SOUND_DIR, 'level_up.wav'),
+            'move': os.path.join(SOUND_DIR, 'move.wav')
         }
         
         # Music file paths
         self.music_files = {
-            'menu': 'sounds/menu_music.wav',
-            'gameplay': 'sounds/gameplay_music.wav',
-            'game_over': 'sounds/game_over_music.wav'
+            'menu': os.path.join(SOUND_DIR, 'menu_music.wav'),
+            'gameplay': os.path.join(SOUND_DIR, 'gameplay_music.wav'),
+            'game_over': os.path.join(SOUND_DIR, 'game_over_music.wav')
         }
         
         # Try to initialize pygame mixer
@@ -47,132 +64,134 @@ class SoundManager:
             print("Game will run without sound")
             self.audio_enabled = False
         
-        # Create sound files and load sounds only if audio is enabled
+        # Prepare the sounds in the background so the menu shows right away
+        threading.Thread(target=self.prepare_sounds, daemon=True).start()
+    
+    def prepare_sounds(self):
+        """Create any missing sound files and load the sound effects"""
+        # Creating files needs no audio device, so only loading depends on audio being enabled
+        self.create_sound_files()
         if self.audio_enabled:
-            self.create_sound_files()
             self.load_sounds()
+        
+        # Start any music that was asked for while the files were still being written
+        with self.music_lock:
+            self.ready.set()
+            if self.pending_music is not None:
+                self.play_music(self.pending_music)
     
     def create_sound_files(self):
-        """Create sound files using pygame's built-in synth capabilities"""
+        """Create sound files by synthesizing each waveform with NumPy, skipping files already on disk"""
+        # Each creator and the files it writes; the synthesis is deterministic, so
+        # a creator only runs again when one of its files has gone missing
+        creators = [
+            (self.create_eat_sound, [self.sound_files['eat']]),
+            (self.create_game_over_sound, [self.sound_files['game_over']]),
+            (self.create_menu_sounds, [self.sound_files['menu_navigate'], self.sound_files['menu_select']]),
+            (self.create_power_up_sound, [self.sound_files['power_up']]),
+            (self.create_level_up_sound, [self.sound_files['level_up']]),
+            (self.create_move_sound, [self.sound_files['move']]),
+            (self.create_music_files, list(self.music_files.values())),
+        ]
         try:
-            self.create_eat_sound()
-            self.create_game_over_sound()
-            self.create_menu_sounds()
-            self.create_power_up_sound()
-            self.create_level_up_sound()
-            self.create_move_sound()
-            self.create_music_files()
+            for create, file_paths in creators:
+                if not all(os.path.isfile(file_path) for file_path in file_paths):
+                    create()
         except Exception as e:
             print(f"Warning: Could not create sound files: {e}")
             self.audio_enabled = False
+        finally:
+            self.times = None  # Free the shared sample times once every file exists
+    
+    def sample_times(self, sample_count):
+        """Get the time in seconds of each of the first sample_count samples"""
+        # Every sound starts at time zero, so each one takes a view of one shared array
+        if self.times is None:
+            self.times = np.arange(LONGEST_SOUND) / SAMPLE_RATE
+        return self.times[:sample_count]
+    
+    def tone_phase(self, freq):
+        """Accumulate a per-sample frequency into the phase of a tone"""
+        # Summing each sample's phase step keeps a changing frequency a true sweep,
+        # where sin(2*pi*freq*t) would warp it to roughly twice the intended range
+        phase = np.multiply(freq, TWO_PI / SAMPLE_RATE)
+        return np.cumsum(phase, out=phase)
+    
+    def save_sound(self, wave, file_path):
+        """Save a waveform as a 16-bit mono WAV file"""
+        with wave_file.open(file_path, 'wb') as sound_file:
+            sound_file.setnchannels(1)
+            sound_file.setsampwidth(2)
+            sound_file.setframerate(SAMPLE_RATE)
+            sound_file.writeframes(wave.astype('<i2').tobytes())
     
     def create_eat_sound(self):
         """Create a sound for eating food"""
-        sound_array = pygame.sndarray.array([0] * 11025)  # 0.25 seconds at 44.1kHz
+        t = self.sample_times(11025)  # 0.25 seconds at 44.1kHz
         
         # Create a short rising tone
-        for i in range(11025):
-            t = i / 44100
-            freq = 300 + 1200 * t  # Rising frequency
-            amplitude = 32767 * 0.7 * (1 - t/0.25)  # Decreasing amplitude
-            sound_array[i] = int(amplitude * pygame.math.sin(2 * 3.14159 * freq * t))
-        
-        sound = pygame.sndarray.make_sound(sound_array)
-        pygame.mixer.Sound.save(sound, self.sound_files['eat'])
+        freq = 300 + 1200 * t  # Rising frequency
+        amplitude = 32767 * 0.7 * (1 - t/0.25)  # Decreasing amplitude
+        self.save_sound(amplitude * np.sin(self.tone_phase(freq)), self.sound_files['eat'])
     
     def create_game_over_sound(self):
         """Create a sound for game over"""
-        sound_array = pygame.sndarray.array([0] * 44100)  # 1 second at 44.1kHz
+        t = self.sample_times(44100)  # 1 second at 44.1kHz
         
         # Create a descending tone with vibrato
-        for i in range(44100):
-            t = i / 44100
-            freq = 400 - 200 * t  # Descending frequency
-            vibrato = 20 * pygame.math.sin(2 * 3.14159 * 10 * t)  # Vibrato
-            amplitude = 32767 * 0.8 * (1 - t/1.2)  # Decreasing amplitude
-            sound_array[i] = int(amplitude * pygame.math.sin(2 * 3.14159 * (freq + vibrato) * t))
-        
-        sound = pygame.sndarray.make_sound(sound_array)
-        pygame.mixer.Sound.save(sound, self.sound_files['game_over'])
+        freq = 400 - 200 * t  # Descending frequency
+        vibrato = 20 * np.sin(TWO_PI * 10 * t)  # Vibrato
+        amplitude = 32767 * 0.8 * (1 - t/1.2)  # Decreasing amplitude
+        self.save_sound(amplitude * np.sin(self.tone_phase(freq + vibrato)), self.sound_files['game_over'])
     
     def create_menu_sounds(self):
         """Create sounds for menu navigation and selection"""
         # Menu navigate sound (short blip)
-        nav_array = pygame.sndarray.array([0] * 4410)  # 0.1 seconds
-        for i in range(4410):
-            t = i / 44100
-            freq = 500
-            amplitude = 32767 * 0.5 * (1 - t/0.1)
-            nav_array[i] = int(amplitude * pygame.math.sin(2 * 3.14159 * freq * t))
-        
-        nav_sound = pygame.sndarray.make_sound(nav_array)
-        pygame.mixer.Sound.save(nav_sound, self.sound_files['menu_navigate'])
+        t = self.sample_times(4410)  # 0.1 seconds
+        freq = 500
+        amplitude = 32767 * 0.5 * (1 - t/0.1)
+        self.save_sound(amplitude * np.sin(TWO_PI * freq * t), self.sound_files['menu_navigate'])
         
         # Menu select sound (two-tone blip)
-        select_array = pygame.sndarray.array([0] * 8820)  # 0.2 seconds
-        for i in range(8820):
-            t = i / 44100
-            freq = 400 if t < 0.1 else 600  # Change frequency halfway
-            amplitude = 32767 * 0.6 * (1 - t/0.2)
-            select_array[i] = int(amplitude * pygame.math.sin(2 * 3.14159 * freq * t))
-        
-        select_sound = pygame.sndarray.make_sound(select_array)
-        pygame.mixer.Sound.save(select_sound, self.sound_files['menu_select'])
+        t = self.sample_times(8820)  # 0.2 seconds
+        freq = np.where(t < 0.1, 400, 600)  # Change frequency halfway
+        amplitude = 32767 * 0.6 * (1 - t/0.2)
+        self.save_sound(amplitude * np.sin(TWO_PI * freq * t), self.sound_files['menu_select'])
     
     def create_power_up_sound(self):
         """Create a sound for collecting power-ups"""
-        sound_array = pygame.sndarray.array([0] * 22050)  # 0.5 seconds
+        t = self.sample_times(22050)  # 0.5 seconds
         
         # Create a rising tone with harmonics
-        for i in range(22050):
-            t = i / 44100
-            freq1 = 300 + 900 * t  # Rising frequency
-            freq2 = 450 + 1350 * t  # Harmonic at 1.5x
-            amplitude = 32767 * 0.7 * (1 - t/0.6)  # Decreasing amplitude
-            
-            # Mix the two frequencies
-            val1 = pygame.math.sin(2 * 3.14159 * freq1 * t)
-            val2 = 0.3 * pygame.math.sin(2 * 3.14159 * freq2 * t)
-            sound_array[i] = int(amplitude * (val1 + val2))
+        freq = 300 + 900 * t  # Rising frequency
+        amplitude = 32767 * 0.7 * (1 - t/0.6)  # Decreasing amplitude
         
-        sound = pygame.sndarray.make_sound(sound_array)
-        pygame.mixer.Sound.save(sound, self.sound_files['power_up'])
+        # Mix the tone with its harmonic at 1.5x, whose phase is just the tone's scaled
+        phase = self.tone_phase(freq)
+        self.save_sound(amplitude * (np.sin(phase) + 0.3 * np.sin(1.5 * phase)), self.sound_files['power_up'])
     
     def create_level_up_sound(self):
         """Create a sound for leveling up"""
-        sound_array = pygame.sndarray.array([0] * 44100)  # 1 second
+        t = self.sample_times(44100)  # 1 second
         
-        # Create a series of rising tones
-        for i in range(44100):
-            t = i / 44100
-            
-            # Three rising tones in sequence
-            if t < 0.33:
-                freq = 300 + 300 * (t/0.33)
-            elif t < 0.66:
-                freq = 400 + 300 * ((t-0.33)/0.33)
-            else:
-                freq = 500 + 300 * ((t-0.66)/0.34)
-            
-            amplitude = 32767 * 0.8 * (1 - (t-0.5)*(t-0.5)/0.5)  # Bell curve amplitude
-            sound_array[i] = int(amplitude * pygame.math.sin(2 * 3.14159 * freq * t))
+        # Three rising tones in sequence
+        freq = np.select(
+            [t < 0.33, t < 0.66],
+            [300 + 300 * (t/0.33), 400 + 300 * ((t-0.33)/0.33)],
+            500 + 300 * ((t-0.66)/0.34)
+        )
         
-        sound = pygame.sndarray.make_sound(sound_array)
-        pygame.mixer.Sound.save(sound, self.sound_files['level_up'])
+        amplitude = 32767 * 0.8 * (1 - (t-0.5)*(t-0.5)/0.5)  # Bell curve amplitude
+        self.save_sound(amplitude * np.sin(self.tone_phase(freq)), self.sound_files['level_up'])
     
     def create_move_sound(self):
         """Create a subtle sound for snake movement"""
-        sound_array = pygame.sndarray.array([0] * 2205)  # 0.05 seconds (very short)
+        t = self.sample_times(2205)  # 0.05 seconds (very short)
         
         # Create a very short, subtle sound
-        for i in range(2205):
-            t = i / 44100
-            freq = 100
-            amplitude = 32767 * 0.2 * (1 - t/0.05)  # Low amplitude, quick fade
-            sound_array[i] = int(amplitude * pygame.math.sin(2 * 3.14159 * freq * t))
-        
-        sound = pygame.sndarray.make_sound(sound_array)
-        pygame.mixer.Sound.save(sound, self.sound_files['move'])
+        freq = 100
+        amplitude = 32767 * 0.2 * (1 - t/0.05)  # Low amplitude, quick fade
+        self.save_sound(amplitude * np.sin(TWO_PI * freq * t), self.sound_files['move'])
     
     def create_music_files(self):
         """
@@ -182,84 +201,91 @@ class SoundManager:
         these simple synthesized tones. These are just placeholders.
         """
         # For menu music, create a simple looping pattern
-        menu_array = pygame.sndarray.array([0] * (44100 * 5))  # 5 seconds
+        sample_count = LONGEST_SOUND  # 5 seconds
+        t = self.sample_times(sample_count)
+        angle = TWO_PI * t  # Shared by every track, which only scales it by a frequency
         
         # Create a simple arpeggio pattern
         notes = [261.63, 329.63, 392.00, 523.25]  # C4, E4, G4, C5
-        note_duration = 44100 // 4  # 0.25 seconds per note
+        note_duration = SAMPLE_RATE // 4  # 0.25 seconds per note
+        freq = self.note_frequencies(notes, note_duration, sample_count)
         
-        for i in range(len(menu_array)):
-            t = i / 44100
-            note_idx = (i // note_duration) % len(notes)
-            freq = notes[note_idx]
-            
-            # Add some variation
-            if (i // (note_duration * len(notes))) % 2 == 1:
-                freq *= 0.8
-            
-            amplitude = 32767 * 0.3  # Low amplitude for background music
-            menu_array[i] = int(amplitude * pygame.math.sin(2 * 3.14159 * freq * t))
+        # Add some variation: every other pass over the notes plays lower
+        freq *= self.note_frequencies([1.0, 0.8], note_duration * len(notes), sample_count)
         
-        # Save as WAV since MP3 encoding is not available
-        menu_music = pygame.sndarray.make_sound(menu_array)
-        pygame.mixer.Sound.save(menu_music, 'sounds/menu_music.wav')
-        self.music_files['menu'] = 'sounds/menu_music.wav'
+        amplitude = 32767 * 0.3  # Low amplitude for background music
         
-        # For gameplay music, create a different pattern
-        gameplay_array = pygame.sndarray.array([0] * (44100 * 5))  # 5 seconds
+        # Save as WAV since MP3 encoding is not available
+        wave = self.tone(freq, angle)
+        wave *= amplitude
+        self.save_sound(wave, self.music_files['menu'])
         
-        # Create a simple bass line with higher notes
+        # For gameplay music, create a simple bass line with higher notes
         bass_notes = [65.41, 73.42, 82.41, 98.00]  # C2, D2, E2, G2
-        high_notes = [523.25, 587.33, 659.26, 783.99]  # C5, D5, E5, G5
+        high_notes = [0, 0, 0, 0, 523.25, 587.33, 659.26, 783.99]  # Rest, then C5, D5, E5, G5
         
-        for i in range(len(gameplay_array)):
-            t = i / 44100
-            bass_idx = (i // (note_duration * 2)) % len(bass_notes)
-            high_idx = (i // note_duration) % len(high_notes)
-            
-            bass_freq = bass_notes[bass_idx]
-            high_freq = high_notes[high_idx] if (i // note_duration) % 8 >= 4 else 0
-            
-            bass_val = 0.4 * pygame.math.sin(2 * 3.14159 * bass_freq * t)
-            high_val = 0.2 * pygame.math.sin(2 * 3.14159 * high_freq * t)
-            
-            amplitude = 32767 * 0.3
-            gameplay_array[i] = int(amplitude * (bass_val + high_val))
+        bass_freq = self.note_frequencies(bass_notes, note_duration * 2, sample_count)
+        high_freq = self.note_frequencies(high_notes, note_duration, sample_count)
         
-        gameplay_music = pygame.sndarray.make_sound(gameplay_array)
-        pygame.mixer.Sound.save(gameplay_music, 'sounds/gameplay_music.wav')
-        self.music_files['gameplay'] = 'sounds/gameplay_music.wav'
+        bass_val = self.tone(bass_freq, angle)
+        bass_val *= 0.4
+        high_val = self.tone(high_freq, angle)
+        high_val *= 0.2
         
-        # For game over music, create a sad pattern
-        gameover_array = pygame.sndarray.array([0] * (44100 * 3))  # 3 seconds
+        amplitude = 32767 * 0.3
+        bass_val += high_val
+        bass_val *= amplitude
+        self.save_sound(bass_val, self.music_files['gameplay'])
         
-        # Create a descending pattern
+        # For game over music, create a sad descending pattern that ends in silence
+        sample_count = SAMPLE_RATE * 3  # 3 seconds
+        t, angle = t[:sample_count], angle[:sample_count]
         notes = [392.00, 349.23, 329.63, 261.63]  # G4, F4, E4, C4
         
-        for i in range(len(gameover_array)):
-            t = i / 44100
-            section = i // (44100 // 2)  # 0.5 seconds per note
-            if section < len(notes):
-                freq = notes[section]
-                amplitude = 32767 * 0.3 * (1 - t/3)  # Fade out
-                gameover_array[i] = int(amplitude * pygame.math.sin(2 * 3.14159 * freq * t))
+        # 0.5 seconds per note, then a zero frequency, which is silent
+        freq = np.zeros(sample_count)
+        played = np.repeat(notes, SAMPLE_RATE // 2)
+        freq[:len(played)] = played
         
-        gameover_music = pygame.sndarray.make_sound(gameover_array)
-        pygame.mixer.Sound.save(gameover_music, 'sounds/game_over_music.wav')
-        self.music_files['game_over'] = 'sounds/game_over_music.wav'
+        amplitude = 32767 * 0.3 * (1 - t/3)  # Fade out
+        wave = self.tone(freq, angle)
+        wave *= amplitude
+        self.save_sound(wave, self.music_files['game_over'])
+    
+    def tone(self, freq, angle):
+        """Turn a per-sample frequency into a sine wave, reusing the frequency's buffer"""
+        # Working in place keeps a five second track to one buffer instead of a temporary per step
+        wave = np.multiply(freq, angle, out=freq)
+        return np.sin(wave, out=wave)
+    
+    def note_frequencies(self, notes, note_duration, sample_count):
+        """Spell out a looping sequence of notes as one frequency per sample"""
+        return np.resize(np.repeat(notes, note_duration), sample_count)
     
     def load_sounds(self):
-        """Load all sound effects"""
-        for name, file_path in self.sound_files.items():
-            try:
-                self.sounds[name] = pygame.mixer.Sound(file_path)
-                self.sounds[name].set_volume(self.sound_volume)
-            except pygame.error as e:
-                print(f"Warning: Could not load sound {file_path}: {e}")
+        """Load all sound effects, reading the files in parallel"""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            sounds = dict(zip(self.sound_files, executor.map(self.load_sound, self.sound_files.values())))
+        
+        for sound in sounds.values():
+            if sound is not None:
+                sound.set_volume(self.sound_volume)
+        
+        # Publish the sounds all at once, since the game may already be running
+        self.sounds = {name: sound for name, sound in sounds.items() if sound is not None}
+    
+    def load_sound(self, file_path):
+        """Load one sound effect, or return None if it cannot be loaded"""
+        try:
+            return pygame.mixer.Sound(file_path)
+        except (pygame.error, OSError) as e:
+            print(f"Warning: Could not load sound {file_path}: {e}")
+            return None
     
     def play_sound(self, sound_name):
         """Play a sound effect"""
-        if not self.audio_enabled:
+        # Sounds asked for while still loading are dropped rather than waited for
+        if not self.audio_enabled or not self.ready.is_set():
             return
             
         if sound_name in self.sounds:
@@ -269,27 +295,43 @@ class SoundManager:
                 print(f"Warning: Could not play sound {sound_name}: {e}")
     
     def play_music(self, music_name):
-        """Play background music"""
+        """Play background music, streamed from its file rather than loaded whole"""
         if not self.audio_enabled:
             return
+        
+        with self.music_lock:
+            # Music streams from its file, so hold the track until the files are written
+            if not self.ready.is_set():
+                self.pending_music = music_name
+                return
+            self.pending_music = None
             
-        if music_name in self.music_files:
-            try:
-                pygame.mixer.music.load(self.music_files[music_name])
-                pygame.mixer.music.set_volume(self.music_volume)
-                pygame.mixer.music.play(-1)  # Loop indefinitely
-            except Exception as e:
-                print(f"Warning: Could not play music {self.music_files[music_name]}: {e}")
+            # Keep the track going rather than reloading it from disk
+            if music_name == self.current_music and pygame.mixer.music.get_busy():
+                return
+            
+            if music_name in self.music_files:
+                try:
+                    # Loading a new track also stops the one that is playing
+                    pygame.mixer.music.load(self.music_files[music_name])
+                    pygame.mixer.music.set_volume(self.music_volume)
+                    pygame.mixer.music.play(-1)  # Loop indefinitely
+                    self.current_music = music_name
+                except Exception as e:
+                    print(f"Warning: Could not play music {self.music_files[music_name]}: {e}")
     
     def stop_music(self):
         """Stop the currently playing music"""
         if not self.audio_enabled:
             return
-            
-        try:
-            pygame.mixer.music.stop()
-        except Exception as e:
-            print(f"Warning: Could not stop music: {e}")
+        
+        with self.music_lock:
+            self.pending_music = None
+            try:
+                pygame.mixer.music.stop()
+                self.current_music = None
+            except Exception as e:
+                print(f"Warning: Could not stop music: {e}")
     
     def set_sound_volume(self, volume):
         """Set volume for sound effects (0.0 to 1.0)"""
@@ -313,6 +355,7 @@ class SoundManager:
 def test_sound_manager():
     pygame.init()
     sound_manager = SoundManager()
+    sound_manager.ready.wait()
     
     if not sound_manager.audio_enabled:
         print("Audio is disabled, skipping sound tests")
@@ -322,20 +365,24 @@ def test_sound_manager():
     for sound_name in sound_manager.sounds:
         print(f"Playing {sound_name} sound...")
         sound_manager.play_sound(sound_name)
-        pygame.time.wait(1000)  # Wait 1 second between sounds
+        pygame.time.wait(int(sound_manager.sounds[sound_name].get_length() * 1000) + 50)  # Wait for the sound to finish
     
-    # Play music
+    # Play music, listening to each track only outside CI
+    listen = not os.environ.get('CI')
     print("Playing menu music...")
     sound_manager.play_music('menu')
-    pygame.time.wait(5000)  # Wait 5 seconds
+    if listen:
+        pygame.time.wait(5000)  # Wait 5 seconds
     
     print("Playing gameplay music...")
     sound_manager.play_music('gameplay')
-    pygame.time.wait(5000)  # Wait 5 seconds
+    if listen:
+        pygame.time.wait(5000)  # Wait 5 seconds
     
     print("Playing game over music...")
     sound_manager.play_music('game_over')
-    pygame.time.wait(3000)  # Wait 3 seconds
+    if listen:
+        pygame.time.wait(3000)  # Wait 3 seconds
     
     sound_manager.stop_music()
 
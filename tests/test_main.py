@@ -0,0 +1,62 @@
+"""
+Steering tests for the classic Snake game in main.py
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+
+import main
+
+
+@pytest.fixture
+def game():
+    pygame.init()
+    game = main.Game()
+    game.state = main.PLAYING
+    yield game
+    pygame.quit()
+
+
+def press(game, *keys):
+    """Post KEYDOWN events for the keys and drain the queue the way Game.run does"""
+    for key in keys:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+    for event in pygame.event.get():
+        game.handle_events(event)
+
+
+def test_holding_two_perpendicular_keys_never_reverses(game):
+    # UP and LEFT pressed together and held while the snake moves right
+    press(game, pygame.K_UP, pygame.K_LEFT)
+
+    directions = []
+    for _ in range(10):
+        game.update(0.05)
+        directions.append(game.snake.direction)
+
+    # The turn up sticks, LEFT would reverse the last move, and the snake never hits itself
+    assert directions == [(0, -1)] * 10
+    assert game.state == main.PLAYING
+    assert len(set(game.snake.segments)) == len(game.snake.segments)
+
+
+def test_newest_turn_between_moves_wins(game):
+    press(game, pygame.K_UP)
+    press(game, pygame.K_DOWN)
+    assert game.snake.direction == (0, 1)
+
+    game.update(0.1)
+    assert game.snake.head_position == (main.GRID_WIDTH // 2, main.GRID_HEIGHT // 2 + 1)
+    assert game.state == main.PLAYING
+
+
+def test_reverse_key_is_ignored(game):
+    press(game, pygame.K_LEFT)
+    assert game.snake.direction == (1, 0)
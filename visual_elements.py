@@ -7,6 +7,9 @@ This file implements fancy visual elements for our Snake game.
 import pygame
 import math
 import random
+import collections
+import itertools
+import numpy as np
 from pygame import gfxdraw
 
 # Initialize pygame
@@ -19,6 +22,14 @@ GRID_SIZE = 20
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
 FPS = 60
+VECTORIZE_LENGTH = 16  # Snakes longer than this interpolate their segments with NumPy
+
+# Every grid cell, for set-difference food spawning
+ALL_CELLS = frozenset((x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT))
+
+# Sine sampled over one full turn, for the pulse animations
+SIN_STEPS = 1024
+SIN_TABLE = [math.sin(2 * math.pi * i / SIN_STEPS) for i in range(SIN_STEPS)]
 
 # Colors
 BLACK = (0, 0, 0)
@@ -30,120 +41,154 @@ PURPLE = (128, 0, 128)
 GOLD = (255, 215, 0)
 TEAL = (0, 128, 128)
 
+# Eye placement relative to the head's center for each direction:
+# (left eye dx, left eye dy, right eye dx, right eye dy, pupil dx, pupil dy)
+EYE_OFFSETS = {
+    (1, 0): (-GRID_SIZE * 0.15, -GRID_SIZE * 0.2, -GRID_SIZE * 0.15, GRID_SIZE * 0.2, GRID_SIZE * 0.06, 0),
+    (-1, 0): (GRID_SIZE * 0.15, -GRID_SIZE * 0.2, GRID_SIZE * 0.15, GRID_SIZE * 0.2, -GRID_SIZE * 0.06, 0),
+    (0, -1): (-GRID_SIZE * 0.2, GRID_SIZE * 0.15, GRID_SIZE * 0.2, GRID_SIZE * 0.15, 0, -GRID_SIZE * 0.06),
+    (0, 1): (-GRID_SIZE * 0.2, -GRID_SIZE * 0.15, GRID_SIZE * 0.2, -GRID_SIZE * 0.15, 0, GRID_SIZE * 0.06),
+}
+
+# Food patterns: the angle of each bonus star point, whether it is an outer point,
+# and how far along the special food's spiral each point lies
+STAR_POINT_ANGLES = np.arange(10) * (math.pi * 2 / 10)
+STAR_OUTER_POINTS = np.arange(10) % 2 == 0
+SPIRAL_STEPS = np.arange(20) / 20
+
+# Filled circles drawn once and reused, keyed by (surface width, rgba color)
+CIRCLE_SPRITES = {}
+
+def get_circle_sprite(width, color):
+    """Get a cached square surface holding a filled circle of radius width // 2 at its center"""
+    key = (width, color)
+    sprite = CIRCLE_SPRITES.get(key)
+    if sprite is None:
+        if len(CIRCLE_SPRITES) >= 4096:
+            CIRCLE_SPRITES.clear()
+        radius = width // 2
+        sprite = pygame.Surface((width, width), pygame.SRCALPHA).convert_alpha()
+        pygame.gfxdraw.filled_circle(sprite, radius, radius, radius, color)
+        CIRCLE_SPRITES[key] = sprite
+    return sprite
+
 class ParticleSystem:
     """Particle system for visual effects"""
     
     def __init__(self):
-        self.particles = []
+        # Particles, one row or entry per particle
+        self.positions = np.zeros((0, 2))
+        self.velocities = np.zeros((0, 2))
+        self.sizes = np.zeros(0)
+        self.colors = np.zeros((0, 3), dtype=np.uint8)
+        self.alphas = np.zeros(0, dtype=int)
+        self.lifetimes = np.zeros(0)
+        self.ages = np.zeros(0)
+    
+    def add_particles(self, positions, velocities, sizes, colors, alpha, lifetimes):
+        """Add a batch of particles, all starting at age zero"""
+        count = len(sizes)
+        self.positions = np.concatenate((self.positions, positions))
+        self.velocities = np.concatenate((self.velocities, velocities))
+        self.sizes = np.concatenate((self.sizes, sizes))
+        self.colors = np.concatenate((self.colors, np.broadcast_to(np.asarray(colors, dtype=np.uint8), (count, 3))))
+        self.alphas = np.concatenate((self.alphas, np.full(count, alpha)))
+        self.lifetimes = np.concatenate((self.lifetimes, lifetimes))
+        self.ages = np.concatenate((self.ages, np.zeros(count)))
+    
+    def burst_velocities(self, count, min_speed, max_speed):
+        """Get velocities pointing in random directions with random speeds"""
+        angles = np.random.uniform(0, math.pi * 2, count)
+        speeds = np.random.uniform(min_speed, max_speed, count)
+        return np.column_stack((np.cos(angles) * speeds, np.sin(angles) * speeds))
     
     def create_food_particles(self, x, y, color, count=20):
         """Create particles when food is eaten"""
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(1, 3)
-            size = random.uniform(2, 5)
-            lifetime = random.uniform(0.5, 1.5)
-            
-            self.particles.append({
-                'x': x * GRID_SIZE + GRID_SIZE // 2,
-                'y': y * GRID_SIZE + GRID_SIZE // 2,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'size': size,
-                'color': color,
-                'alpha': 255,
-                'lifetime': lifetime,
-                'age': 0,
-            })
+        center = (x * GRID_SIZE + GRID_SIZE // 2, y * GRID_SIZE + GRID_SIZE // 2)
+        self.add_particles(
+            np.full((count, 2), center),
+            self.burst_velocities(count, 1, 3),
+            np.random.uniform(2, 5, count),
+            color,
+            255,
+            np.random.uniform(0.5, 1.5, count),
+        )
     
     def create_trail_particles(self, x, y, color, count=3):
         """Create trail particles behind the snake"""
-        for _ in range(count):
-            offset_x = random.uniform(-GRID_SIZE/4, GRID_SIZE/4)
-            offset_y = random.uniform(-GRID_SIZE/4, GRID_SIZE/4)
-            size = random.uniform(1, 3)
-            lifetime = random.uniform(0.3, 0.8)
-            
-            self.particles.append({
-                'x': x * GRID_SIZE + GRID_SIZE // 2 + offset_x,
-                'y': y * GRID_SIZE + GRID_SIZE // 2 + offset_y,
-                'vx': 0,
-                'vy': 0,
-                'size': size,
-                'color': color,
-                'alpha': 150,
-                'lifetime': lifetime,
-                'age': 0,
-            })
+        center = (x * GRID_SIZE + GRID_SIZE // 2, y * GRID_SIZE + GRID_SIZE // 2)
+        self.add_particles(
+            center + np.random.uniform(-GRID_SIZE/4, GRID_SIZE/4, (count, 2)),
+            np.zeros((count, 2)),
+            np.random.uniform(1, 3, count),
+            color,
+            150,
+            np.random.uniform(0.3, 0.8, count),
+        )
     
     def create_death_particles(self, segments, count_per_segment=10):
         """Create explosion particles when snake dies"""
-        for x, y in segments:
-            for _ in range(count_per_segment):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(2, 5)
-                size = random.uniform(3, 7)
-                lifetime = random.uniform(0.8, 2.0)
-                
-                # Random color variations of green
-                r = random.randint(0, 100)
-                g = random.randint(180, 255)
-                b = random.randint(0, 100)
-                
-                self.particles.append({
-                    'x': x * GRID_SIZE + GRID_SIZE // 2,
-                    'y': y * GRID_SIZE + GRID_SIZE // 2,
-                    'vx': math.cos(angle) * speed,
-                    'vy': math.sin(angle) * speed,
-                    'size': size,
-                    'color': (r, g, b),
-                    'alpha': 255,
-                    'lifetime': lifetime,
-                    'age': 0,
-                })
+        cells = np.repeat(np.array(segments, dtype=float).reshape(-1, 2), count_per_segment, axis=0)
+        count = len(cells)
+        
+        # Random color variations of green
+        colors = np.column_stack((
+            np.random.randint(0, 101, count),
+            np.random.randint(180, 256, count),
+            np.random.randint(0, 101, count),
+        ))
+        
+        self.add_particles(
+            cells * GRID_SIZE + GRID_SIZE // 2,
+            self.burst_velocities(count, 2, 5),
+            np.random.uniform(3, 7, count),
+            colors,
+            255,
+            np.random.uniform(0.8, 2.0, count),
+        )
     
     def update(self, dt):
         """Update all particles"""
-        # Update existing particles
-        for particle in self.particles[:]:
-            # Update position
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            
-            # Update age
-            particle['age'] += dt
-            
-            # Calculate alpha based on lifetime
-            progress = particle['age'] / particle['lifetime']
-            particle['alpha'] = int(255 * (1 - progress))
-            
-            # Remove dead particles
-            if particle['age'] >= particle['lifetime']:
-                self.particles.remove(particle)
+        if not len(self.ages):
+            return
+        
+        # Update position and age
+        self.positions += self.velocities
+        self.ages += dt
+        
+        # Remove dead particles
+        alive = self.ages < self.lifetimes
+        if not alive.all():
+            self.positions = self.positions[alive]
+            self.velocities = self.velocities[alive]
+            self.sizes = self.sizes[alive]
+            self.colors = self.colors[alive]
+            self.lifetimes = self.lifetimes[alive]
+            self.ages = self.ages[alive]
+        
+        # Calculate alpha based on lifetime, working in one buffer
+        alphas = np.divide(self.ages, self.lifetimes)
+        np.subtract(1, alphas, out=alphas)
+        alphas *= 255
+        self.alphas = alphas.astype(int)
     
     def render(self, surface):
         """Render all particles"""
-        for particle in self.particles:
-            # Get particle properties
-            x, y = int(particle['x']), int(particle['y'])
-            size = particle['size']
-            color = particle['color']
-            alpha = particle['alpha']
-            
-            # Create surface for this particle
-            particle_surface = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-            
-            # Draw the particle
-            pygame.gfxdraw.filled_circle(
-                particle_surface, 
-                int(size), 
-                int(size), 
-                int(size), 
-                (*color, alpha)
+        # Alpha is rounded to 16 levels so particles share a bounded set of sprites;
+        # colors stay exact, since rounding them would wash out saturated colors
+        alphas = self.alphas >> 4 << 4 | 8
+        
+        # Hand every particle to SDL in one batched blit
+        blit_sequence = [
+            (get_circle_sprite(int(size * 2), (r, g, b, alpha)), (x - size, y - size))
+            for (x, y), size, (r, g, b), alpha in zip(
+                self.positions.astype(int).tolist(),
+                self.sizes.tolist(),
+                self.colors.tolist(),
+                alphas.tolist(),
             )
-            
-            # Blit to main surface
-            surface.blit(particle_surface, (x - size, y - size))
+        ]
+        surface.blits(blit_sequence, doreturn=False)
 
 
 class BackgroundEffect:
@@ -152,106 +197,102 @@ class BackgroundEffect:
     def __init__(self, width, height):
         self.width = width
         self.height = height
-        self.stars = []
-        self.grid_lines = []
         self.create_stars(100)
         self.create_grid()
         self.time = 0
     
     def create_stars(self, count):
         """Create starry background effect"""
-        for _ in range(count):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            size = random.uniform(0.5, 2)
-            pulse_speed = random.uniform(1, 3)
-            
-            self.stars.append({
-                'x': x,
-                'y': y,
-                'size': size,
-                'base_size': size,
-                'pulse_speed': pulse_speed,
-                'phase': random.uniform(0, math.pi * 2),
-            })
+        # One entry per star
+        self.star_x = np.random.randint(0, self.width + 1, count)
+        self.star_y = np.random.randint(0, self.height + 1, count)
+        self.star_base_sizes = np.random.uniform(0.5, 2, count)
+        self.star_sizes = self.star_base_sizes.copy()
+        self.star_pulse_speeds = np.random.uniform(1, 3, count)
+        self.star_phases = np.random.uniform(0, math.pi * 2, count)
+        
+        # Glow and core circles for every radius a star reaches, pulsing up to 30% past its base size
+        max_radius = int(2 * 1.3)
+        self.star_glow_sprites = [self.build_star_sprite(radius, (200, 200, 255), 100) for radius in range(max_radius + 1)]
+        self.star_core_sprites = [self.build_star_sprite(radius, (255, 255, 255), 200) for radius in range(max_radius // 2 + 1)]
+    
+    def build_star_sprite(self, radius, color, alpha):
+        """Pre-draw one translucent star circle"""
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA).convert_alpha()
+        pygame.gfxdraw.filled_circle(sprite, radius, radius, radius, (*color, 255))
+        sprite.set_alpha(alpha)
+        return sprite
     
     def create_grid(self):
-        """Create grid lines"""
+        """Draw the grid lines once onto a see-through surface laid over the stars"""
+        self.grid_surface = pygame.Surface((self.width, self.height)).convert()
+        self.grid_surface.set_colorkey(BLACK)
+        
         # Horizontal lines
         for y in range(0, self.height, GRID_SIZE):
-            self.grid_lines.append(((0, y), (self.width, y)))
+            pygame.draw.line(self.grid_surface, (30, 30, 60), (0, y), (self.width, y), 1)
         
         # Vertical lines
         for x in range(0, self.width, GRID_SIZE):
-            self.grid_lines.append(((x, 0), (x, self.height)))
+            pygame.draw.line(self.grid_surface, (30, 30, 60), (x, 0), (x, self.height), 1)
     
     def update(self, dt):
         """Update background effects"""
         self.time += dt
         
-        # Update stars
-        for star in self.stars:
-            # Pulsing effect
-            pulse = math.sin(self.time * star['pulse_speed'] + star['phase'])
-            star['size'] = star['base_size'] * (1 + 0.3 * pulse)
+        # Pulse every star at once
+        pulse = np.sin(self.time * self.star_pulse_speeds + self.star_phases)
+        self.star_sizes = self.star_base_sizes * (1 + 0.3 * pulse)
     
     def render(self, surface):
         """Render background effects"""
         # Fill background with dark color
         surface.fill((10, 10, 30))
         
-        # Draw stars
-        for star in self.stars:
-            x, y = int(star['x']), int(star['y'])
-            size = star['size']
-            
-            # Draw with glow effect
-            pygame.gfxdraw.filled_circle(surface, x, y, int(size), (200, 200, 255, 100))
-            pygame.gfxdraw.filled_circle(surface, x, y, int(size/2), (255, 255, 255, 200))
+        # Draw stars with glow effect, every glow and core in one batched blit
+        blit_sequence = []
+        for x, y, size, core_size in zip(
+            self.star_x.tolist(),
+            self.star_y.tolist(),
+            self.star_sizes.astype(int).tolist(),
+            (self.star_sizes / 2).astype(int).tolist(),
+        ):
+            blit_sequence.append((self.star_glow_sprites[size], (x - size, y - size)))
+            blit_sequence.append((self.star_core_sprites[core_size], (x - core_size, y - core_size)))
+        surface.blits(blit_sequence, doreturn=False)
         
         # Draw grid lines (subtle)
-        for start, end in self.grid_lines:
-            pygame.draw.line(surface, (30, 30, 60), start, end, 1)
+        surface.blit(self.grid_surface, (0, 0))
 
 
 class EnhancedSnake:
     """Enhanced snake with fancy visuals"""
     
     def __init__(self, x, y):
-        self.segments = [(x, y), (x-1, y), (x-2, y)]  # Head is first element
+        self.segments = collections.deque([(x, y), (x-1, y), (x-2, y)])  # Head is first element
+        self.segment_counts = collections.Counter(self.segments)  # Cell -> segments on it
         self.direction = (1, 0)  # Moving right initially
         self.growth_pending = 0
         
         # Visual properties
         self.gradient_colors = self.generate_gradient((0, 255, 100), (0, 100, 255), 10)
+        self.dimmed_gradient_colors = [tuple(c // 2 for c in color) for color in self.gradient_colors]
         self.glow_colors = self.generate_gradient((100, 255, 100, 150), (0, 100, 255, 50), 10)
         self.pulse_time = 0
         self.trail_time = 0
         
         # Movement animation
         self.move_progress = 0  # 0 to 1 for smooth movement
-        self.prev_segments = self.segments.copy()
+        self.prev_segments = tuple(self.segments)
     
     def generate_gradient(self, start_color, end_color, steps):
         """Generate a gradient between two colors"""
         result = []
         
-        # Check if we're dealing with RGBA or RGB
-        if len(start_color) == 4:  # RGBA
-            for i in range(steps):
-                t = i / (steps - 1)
-                r = int(start_color[0] * (1 - t) + end_color[0] * t)
-                g = int(start_color[1] * (1 - t) + end_color[1] * t)
-                b = int(start_color[2] * (1 - t) + end_color[2] * t)
-                a = int(start_color[3] * (1 - t) + end_color[3] * t)
-                result.append((r, g, b, a))
-        else:  # RGB
-            for i in range(steps):
-                t = i / (steps - 1)
-                r = int(start_color[0] * (1 - t) + end_color[0] * t)
-                g = int(start_color[1] * (1 - t) + end_color[1] * t)
-                b = int(start_color[2] * (1 - t) + end_color[2] * t)
-                result.append((r, g, b))
+        # Blend channel by channel, which covers both RGB and RGBA colors
+        for i in range(steps):
+            t = i / (steps - 1)
+            result.append(tuple(int(start * (1 - t) + end * t) for start, end in zip(start_color, end_color)))
         
         return result
     
@@ -262,7 +303,7 @@ class EnhancedSnake:
     def move(self):
         """Move the snake with animation"""
         # Save previous positions for animation
-        self.prev_segments = self.segments.copy()
+        self.prev_segments = tuple(self.segments)
         self.move_progress = 0
         
         # Calculate new head position
@@ -271,13 +312,31 @@ class EnhancedSnake:
         new_head = ((head_x + dx) % GRID_WIDTH, (head_y + dy) % GRID_HEIGHT)
         
         # Add new head
-        self.segments.insert(0, new_head)
+        self.segments.appendleft(new_head)
+        self.segment_counts[new_head] += 1
         
         # Remove tail if no growth is pending
         if self.growth_pending > 0:
             self.growth_pending -= 1
         else:
-            self.segments.pop()
+            self.remove_cell(self.segments.pop())
+    
+    def remove_cell(self, cell):
+        """Drop one segment from the cell counts, forgetting cells that become empty"""
+        self.segment_counts[cell] -= 1
+        if not self.segment_counts[cell]:
+            del self.segment_counts[cell]
+    
+    def teleport_head(self, position):
+        """Move the head segment straight to a new cell"""
+        self.remove_cell(self.segments[0])
+        self.segments[0] = position
+        self.segment_counts[position] += 1
+    
+    def shrink(self, count):
+        """Remove the given number of segments from the tail"""
+        for _ in range(count):
+            self.remove_cell(self.segments.pop())
     
     def update_animation(self, dt, particle_system=None):
         """Update snake animation"""
@@ -292,7 +351,7 @@ class EnhancedSnake:
         if particle_system and self.trail_time >= 0.05:  # Every 0.05 seconds
             self.trail_time = 0
             # Add trail particles behind the snake
-            for i, (x, y) in enumerate(self.segments[1:4]):  # Just a few segments behind head
+            for i, (x, y) in enumerate(itertools.islice(self.segments, 1, 4)):  # Just a few segments behind head
                 color_idx = min(i, len(self.gradient_colors) - 1)
                 particle_system.create_trail_particles(x, y, self.gradient_colors[color_idx])
     
@@ -301,55 +360,55 @@ class EnhancedSnake:
     
     def check_collision(self):
         # Check for collision with self
-        if self.head_position in self.segments[1:]:
+        if self.segment_counts[self.head_position] > 1:
             return True
         return False
     
     def change_direction(self, new_direction):
         self.direction = new_direction
     
+    def segment_positions(self):
+        """Get the grid position of every segment, head first, part way through the current move"""
+        progress = self.move_progress
+        if progress >= 1.0:
+            return list(self.segments)
+        
+        # Segments that existed before the move slide from their previous cells
+        moving = min(len(self.segments), len(self.prev_segments))
+        if moving > VECTORIZE_LENGTH:
+            prev = np.array(self.prev_segments[:moving])
+            curr = np.array(list(itertools.islice(self.segments, moving)))
+            positions = (prev + (curr - prev) * progress).tolist()
+        else:
+            positions = [
+                (prev_x + (curr_x - prev_x) * progress, prev_y + (curr_y - prev_y) * progress)
+                for (prev_x, prev_y), (curr_x, curr_y) in zip(self.prev_segments, self.segments)
+            ]
+        positions.extend(itertools.islice(self.segments, moving, None))
+        return positions
+    
     def render(self, surface, particle_system=None, dimmed=False):
         """Render the snake with fancy effects"""
         alpha = 128 if dimmed else 255
+        colors = self.dimmed_gradient_colors if dimmed else self.gradient_colors
+        last_color = len(colors) - 1
+        
+        # Apply pulsing effect to head
+        step = int(self.pulse_time * 3 * SIN_STEPS / (2 * math.pi)) % SIN_STEPS
+        pulse = (SIN_TABLE[step] + 1) * 0.1
+        head_size = GRID_SIZE * (1.0 + pulse)
+        
+        # One rect sized for the head and one moved along the body, recentered on each segment
+        head_rect = pygame.Rect(0, 0, head_size, head_size)
+        body_rect = pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE)
         
         # Draw each segment with interpolation for smooth movement
-        for i in range(len(self.segments)):
-            # Get current and previous positions
-            curr_x, curr_y = self.segments[i]
+        for i, (x, y) in enumerate(self.segment_positions()):
+            # Calculate color based on segment position, already dimmed if needed
+            color = colors[min(i, last_color)]
             
-            # For animation, interpolate between previous and current position
-            if i < len(self.prev_segments) and self.move_progress < 1.0:
-                prev_x, prev_y = self.prev_segments[i]
-                # Interpolate position
-                x = prev_x + (curr_x - prev_x) * self.move_progress
-                y = prev_y + (curr_y - prev_y) * self.move_progress
-            else:
-                x, y = curr_x, curr_y
-            
-            # Calculate color based on segment position
-            color_idx = min(i, len(self.gradient_colors) - 1)
-            color = self.gradient_colors[color_idx]
-            
-            # Apply pulsing effect to head
-            if i == 0:
-                pulse = (math.sin(self.pulse_time * 3) + 1) * 0.1
-                size_factor = 1.0 + pulse
-            else:
-                size_factor = 1.0
-            
-            # Apply dimming if needed
-            if dimmed:
-                color = tuple(c // 2 for c in color)
-            
-            # Calculate position and size
-            rect = pygame.Rect(
-                x * GRID_SIZE, 
-                y * GRID_SIZE, 
-                GRID_SIZE * size_factor, 
-                GRID_SIZE * size_factor
-            )
-            
-            # Center the rectangle
+            # Center the rectangle on the segment
+            rect = head_rect if i == 0 else body_rect
             rect.center = (
                 (x + 0.5) * GRID_SIZE, 
                 (y + 0.5) * GRID_SIZE
@@ -357,16 +416,9 @@ class EnhancedSnake:
             
             # Draw glow effect (if not dimmed)
             if not dimmed and i < 5:  # Only for first few segments
-                glow_color = self.glow_colors[min(i, len(self.glow_colors) - 1)]
+                glow_color = self.glow_colors[i]
                 glow_size = int(GRID_SIZE * (1.2 + pulse * 0.5))
-                glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                pygame.gfxdraw.filled_circle(
-                    glow_surface, 
-                    glow_size, 
-                    glow_size, 
-                    glow_size, 
-                    glow_color
-                )
+                glow_surface = get_circle_sprite(glow_size * 2, glow_color)
                 surface.blit(
                     glow_surface, 
                     (rect.centerx - glow_size, rect.centery - glow_size)
@@ -396,26 +448,14 @@ class EnhancedSnake:
         eye_color = (50, 50, 50) if dimmed else (0, 0, 0)
         pupil_color = (200, 200, 200) if dimmed else WHITE
         
-        # Eye positions depend on direction
-        dx, dy = self.direction
-        
         # Calculate center of the grid cell
         center_x = (x + 0.5) * GRID_SIZE
         center_y = (y + 0.5) * GRID_SIZE
         
-        # Eye offsets based on direction
-        if dx == 1:  # Right
-            left_eye_pos = (center_x - GRID_SIZE * 0.15, center_y - GRID_SIZE * 0.2)
-            right_eye_pos = (center_x - GRID_SIZE * 0.15, center_y + GRID_SIZE * 0.2)
-        elif dx == -1:  # Left
-            left_eye_pos = (center_x + GRID_SIZE * 0.15, center_y - GRID_SIZE * 0.2)
-            right_eye_pos = (center_x + GRID_SIZE * 0.15, center_y + GRID_SIZE * 0.2)
-        elif dy == -1:  # Up
-            left_eye_pos = (center_x - GRID_SIZE * 0.2, center_y + GRID_SIZE * 0.15)
-            right_eye_pos = (center_x + GRID_SIZE * 0.2, center_y + GRID_SIZE * 0.15)
-        else:  # Down
-            left_eye_pos = (center_x - GRID_SIZE * 0.2, center_y - GRID_SIZE * 0.15)
-            right_eye_pos = (center_x + GRID_SIZE * 0.2, center_y - GRID_SIZE * 0.15)
+        # Eye positions depend on direction
+        left_dx, left_dy, right_dx, right_dy, pupil_offset_x, pupil_offset_y = EYE_OFFSETS[self.direction]
+        left_eye_pos = (center_x + left_dx, center_y + left_dy)
+        right_eye_pos = (center_x + right_dx, center_y + right_dy)
         
         # Draw eyes with glow
         eye_radius = GRID_SIZE * 0.18
@@ -425,15 +465,8 @@ class EnhancedSnake:
         if not dimmed:
             # Glow
             glow_radius = int(eye_radius * 1.5)
+            glow_surface = get_circle_sprite(glow_radius * 2, (255, 255, 255, 40))
             for eye_pos in [left_eye_pos, right_eye_pos]:
-                glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                pygame.gfxdraw.filled_circle(
-                    glow_surface, 
-                    glow_radius, 
-                    glow_radius, 
-                    glow_radius, 
-                    (255, 255, 255, 40)
-                )
                 surface.blit(
                     glow_surface, 
                     (eye_pos[0] - glow_radius, eye_pos[1] - glow_radius)
@@ -444,9 +477,6 @@ class EnhancedSnake:
             pygame.draw.circle(surface, eye_color, eye_pos, eye_radius)
         
         # Draw pupils with direction bias
-        pupil_offset_x = dx * GRID_SIZE * 0.06
-        pupil_offset_y = dy * GRID_SIZE * 0.06
-        
         for eye_pos in [left_eye_pos, right_eye_pos]:
             pupil_pos = (eye_pos[0] + pupil_offset_x, eye_pos[1] + pupil_offset_y)
             pygame.draw.circle(surface, pupil_color, pupil_pos, pupil_radius)
@@ -465,7 +495,15 @@ class EnhancedFood:
         self.set_properties_by_type()
         self.pulse_time = 0
         self.rotation = 0
-        self.particles = []
+        
+        # Ambient particles, one row or entry per particle
+        self.particle_positions = np.zeros((0, 2))
+        self.particle_velocities = np.zeros((0, 2))
+        self.particle_sizes = np.zeros(0)
+        self.particle_colors = np.zeros((0, 3), dtype=int)
+        self.particle_alphas = np.zeros(0, dtype=int)
+        self.particle_lifetimes = np.zeros(0)
+        self.particle_ages = np.zeros(0)
     
     def set_properties_by_type(self):
         """Set food properties based on type"""
@@ -493,33 +531,41 @@ class EnhancedFood:
     
     def spawn(self, snake_segments):
         """Spawn food at a random position not occupied by the snake"""
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            if (x, y) not in snake_segments:
-                self.position = (x, y)
-                # Randomly choose a new type
-                self.type = random.choice(['regular'] * 7 + ['bonus'] * 2 + ['special'])
-                self.set_properties_by_type()
-                break
+        # Pick straight from the free cells, so a long snake never means repeated retries
+        free_cells = ALL_CELLS.difference(snake_segments)
+        if free_cells:
+            self.place(random.choice(tuple(free_cells)))
+    
+    def place(self, position):
+        """Place food at a known free position with a newly chosen type"""
+        self.position = position
+        # Randomly choose a new type
+        self.type = random.choice(['regular'] * 7 + ['bonus'] * 2 + ['special'])
+        self.set_properties_by_type()
     
     def update(self, dt):
         """Update food animation"""
         self.pulse_time += dt
         self.rotation += dt * 50  # Rotate 50 degrees per second
         
-        # Update particles
-        for particle in self.particles[:]:
-            particle['age'] += dt
-            if particle['age'] >= particle['lifetime']:
-                self.particles.remove(particle)
-            else:
-                # Update position
-                particle['x'] += particle['vx'] * dt
-                particle['y'] += particle['vy'] * dt
-                # Update alpha
-                progress = particle['age'] / particle['lifetime']
-                particle['alpha'] = int(255 * (1 - progress))
+        # Update particles, dropping the ones that have lived out their lifetime
+        if len(self.particle_ages):
+            self.particle_ages += dt
+            alive = self.particle_ages < self.particle_lifetimes
+            if not alive.all():
+                self.particle_positions = self.particle_positions[alive]
+                self.particle_velocities = self.particle_velocities[alive]
+                self.particle_sizes = self.particle_sizes[alive]
+                self.particle_colors = self.particle_colors[alive]
+                self.particle_lifetimes = self.particle_lifetimes[alive]
+                self.particle_ages = self.particle_ages[alive]
+            
+            # Update position and alpha
+            self.particle_positions += self.particle_velocities * dt
+            alphas = np.divide(self.particle_ages, self.particle_lifetimes)
+            np.subtract(1, alphas, out=alphas)
+            alphas *= 255
+            self.particle_alphas = alphas.astype(int)
         
         # Add new particles occasionally
         if random.random() < dt * 2:  # Average 2 particles per second
@@ -531,25 +577,24 @@ class EnhancedFood:
         center_x = (x + 0.5) * GRID_SIZE
         center_y = (y + 0.5) * GRID_SIZE
         
+        # The particle starts and moves along the same direction, so its trig is done once
         angle = random.uniform(0, math.pi * 2)
+        direction_x = math.cos(angle)
+        direction_y = math.sin(angle)
         distance = random.uniform(0, GRID_SIZE * 0.5)
-        start_x = center_x + math.cos(angle) * distance
-        start_y = center_y + math.sin(angle) * distance
+        start_x = center_x + direction_x * distance
+        start_y = center_y + direction_y * distance
         
         speed = random.uniform(5, 15)
         lifetime = random.uniform(0.5, 1.0)
         
-        self.particles.append({
-            'x': start_x,
-            'y': start_y,
-            'vx': math.cos(angle) * speed,
-            'vy': math.sin(angle) * speed,
-            'size': random.uniform(1, 3),
-            'color': self.particle_color,
-            'alpha': 150,
-            'lifetime': lifetime,
-            'age': 0,
-        })
+        self.particle_positions = np.append(self.particle_positions, [(start_x, start_y)], axis=0)
+        self.particle_velocities = np.append(self.particle_velocities, [(direction_x * speed, direction_y * speed)], axis=0)
+        self.particle_sizes = np.append(self.particle_sizes, random.uniform(1, 3))
+        self.particle_colors = np.append(self.particle_colors, [self.particle_color], axis=0)
+        self.particle_alphas = np.append(self.particle_alphas, 150)
+        self.particle_lifetimes = np.append(self.particle_lifetimes, lifetime)
+        self.particle_ages = np.append(self.particle_ages, 0)
     
     def render(self, surface, dimmed=False):
         """Render food with fancy effects"""
@@ -558,7 +603,8 @@ class EnhancedFood:
         center_y = (y + 0.5) * GRID_SIZE
         
         # Calculate pulsing effect
-        pulse = abs(math.sin(self.pulse_time * self.pulse_speed))
+        step = int(self.pulse_time * self.pulse_speed * SIN_STEPS / (2 * math.pi)) % SIN_STEPS
+        pulse = abs(SIN_TABLE[step])
         size = int(GRID_SIZE * self.size_factor + pulse * GRID_SIZE * 0.2)
         
         # Apply dimming if needed
@@ -566,26 +612,24 @@ class EnhancedFood:
         
         # Draw ambient particles
         if not dimmed:
-            for particle in self.particles:
-                pygame.gfxdraw.filled_circle(
-                    surface,
-                    int(particle['x']),
-                    int(particle['y']),
-                    int(particle['size']),
-                    (*particle['color'], particle['alpha'])
+            # Alpha is rounded to 16 levels and kept in the sprite key, as in ParticleSystem.render,
+            # so the shared cached sprites are never changed
+            alphas = self.particle_alphas >> 4 << 4 | 8
+            blit_sequence = [
+                (get_circle_sprite(particle_size * 2 + 1, (r, g, b, alpha)), (particle_x - particle_size, particle_y - particle_size))
+                for (particle_x, particle_y), particle_size, (r, g, b), alpha in zip(
+                    self.particle_positions.astype(int).tolist(),
+                    self.particle_sizes.astype(int).tolist(),
+                    self.particle_colors.tolist(),
+                    alphas.tolist(),
                 )
+            ]
+            surface.blits(blit_sequence, doreturn=False)
         
         # Draw glow effect (if not dimmed)
         if not dimmed:
             glow_size = int(size * 1.5 + pulse * size * 0.5)
-            glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            pygame.gfxdraw.filled_circle(
-                glow_surface,
-                glow_size,
-                glow_size,
-                glow_size,
-                self.glow_color
-            )
+            glow_surface = get_circle_sprite(glow_size * 2, self.glow_color)
             surface.blit(
                 glow_surface,
                 (center_x - glow_size, center_y - glow_size)
@@ -604,39 +648,30 @@ class EnhancedFood:
         elif self.type == 'bonus':
             # Star pattern for bonus food
             if not dimmed:
-                points = 5
                 inner_radius = size // 4
                 outer_radius = size // 2
                 
-                # Calculate star points
-                star_points = []
-                for i in range(points * 2):
-                    angle = math.pi * 2 * i / (points * 2) + math.radians(self.rotation)
-                    radius = outer_radius if i % 2 == 0 else inner_radius
-                    x = center_x + math.cos(angle) * radius
-                    y = center_y + math.sin(angle) * radius
-                    star_points.append((x, y))
+                # Calculate all five points and the notches between them at once
+                angles = STAR_POINT_ANGLES + math.radians(self.rotation)
+                radii = np.where(STAR_OUTER_POINTS, outer_radius, inner_radius)
+                star_points = np.column_stack((center_x + np.cos(angles) * radii, center_y + np.sin(angles) * radii))
                 
                 # Draw star
-                pygame.draw.polygon(surface, (255, 255, 200), star_points)
+                pygame.draw.polygon(surface, (255, 255, 200), star_points.tolist())
         
         elif self.type == 'special':
             # Spiral pattern for special food
             if not dimmed:
-                spiral_points = []
                 spiral_radius = size // 2
                 spiral_turns = 2
                 
-                for i in range(20):
-                    angle = i / 20 * math.pi * 2 * spiral_turns + math.radians(self.rotation)
-                    radius = spiral_radius * (i / 20)
-                    x = center_x + math.cos(angle) * radius
-                    y = center_y + math.sin(angle) * radius
-                    spiral_points.append((x, y))
+                # Calculate every point along the spiral at once
+                angles = SPIRAL_STEPS * (math.pi * 2 * spiral_turns) + math.radians(self.rotation)
+                radii = spiral_radius * SPIRAL_STEPS
+                spiral_points = np.column_stack((center_x + np.cos(angles) * radii, center_y + np.sin(angles) * radii))
                 
                 # Draw spiral
-                if len(spiral_points) > 1:
-                    pygame.draw.lines(surface, (200, 255, 255), False, spiral_points, 2)
+                pygame.draw.lines(surface, (200, 255, 255), False, spiral_points.tolist(), 2)
 
 
 # Main function to test the visual elements